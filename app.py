@@ -7,17 +7,47 @@ Run:
 Then visit http://localhost:5000
 """
 
+import base64
+import gzip
 import json
+import logging
 import os
 import sqlite3
-import threading
 import time
-from datetime import datetime
-
-from flask import Flask, jsonify, redirect, render_template, request, url_for
+from datetime import datetime, timezone
+
+from flask import Flask, Response, jsonify, redirect, render_template, request, url_for
+
+import metrics
+from db.cache import ResponseCache
+from db.database import (
+    bump_generation,
+    fts_query,
+    get_connection,
+    get_count,
+    get_counts,
+    init_db,
+    reset_connection,
+    transaction,
+)
+from db.events import EventBroker, last_event_id, publish
+from db.tags import (
+    FACET_SCAN_LIMIT,
+    MAX_FILTER_TAGS,
+    facet_counts,
+    normalize_tags,
+    tag_filter,
+    tags_for,
+    top_tags,
+)
+from scrapers.history import summarize as summarize_history
+from scrapers.registry import SCRAPERS
+from scrapers.scheduler import Scheduler, get_run, request_run
 
-from db.database import get_connection, init_db
-from scrapers.runner import run as run_scrapers
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
 
 app = Flask(
     __name__,
@@ -25,115 +55,368 @@ app = Flask(
     static_folder="static",
 )
 
+# Hand pooled DB connections back clean after every request
+app.teardown_appcontext(lambda exc: reset_connection())
+
+# Rendered feed pages and stats, shared by all requests in this worker
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get("RESPONSE_CACHE_SIZE", 256)),
+    ttl=float(os.environ.get("RESPONSE_CACHE_TTL", 300)),
+)
+
+# Live updates for open pages at /api/events, fed by the events table
+event_broker = EventBroker()
+
+# Latency, SQL, template and cache metrics at /metrics, plus opt-in profiling
+metrics.init_app(app, response_cache)
+
 # ── Background Scraper ────────────────────────────────────────────────────────
 
-SCRAPE_INTERVAL = int(os.environ.get("SCRAPE_INTERVAL_HOURS", 12)) * 3600
 DEFAULT_TERMS = os.environ.get(
     "SEARCH_TERMS",
     "data analyst,bi engineer,business intelligence,analytics engineer,power bi,data engineer",
 ).split(",")
 
+# Every worker runs a scheduler thread; a DB lease lets only one of them
+# scrape at a time. Periodic scrapes are only queued in production; locally
+# the thread is started on demand to serve "Refresh Jobs".
+scheduler = Scheduler(
+    terms=DEFAULT_TERMS,
+    scheduled=bool(os.environ.get("RAILWAY_ENVIRONMENT") or os.environ.get("ENABLE_BG_SCRAPE")),
+)
+if scheduler.scheduled:
+    scheduler.start()
 
-def background_scraper():
-    """Runs in a daemon thread, scrapes on interval."""
-    while True:
-        time.sleep(SCRAPE_INTERVAL)
-        try:
-            run_scrapers(search_terms=DEFAULT_TERMS)
-        except Exception as e:
-            print(f"[bg-scraper] Error: {e}")
 
+# ── Feed Page (Home) ──────────────────────────────────────────────────────────
 
-# Start background thread in production
-if os.environ.get("RAILWAY_ENVIRONMENT") or os.environ.get("ENABLE_BG_SCRAPE"):
-    t = threading.Thread(target=background_scraper, daemon=True)
-    t.start()
+PER_PAGE = 30
+FACETS = 20  # Tags in the sidebar
+MAX_SALARY_FILTER = 10_000_000  # Yearly USD; above every normalized salary
+MAX_DAYS = 3650  # "Posted in the last N days"
+
+# Feed orders: newest first by when we first saw a job (default) or by
+# when it was posted, or best paid first (only jobs with a readable
+# salary). Each key has its own index and doubles as the cursor key.
+SORTS = {"": "scraped_ts", "posted": "posted_ts", "salary": "salary_max_usd"}
+
+# Everything a job card needs, plus the SORTS keys for the cursor; the
+# cards never show the description, so it is only fetched through /api/jobs
+JOB_COLUMNS = """
+    j.id, j.title, j.company, j.location, j.source_platform, j.url, j.salary,
+    j.tags, j.posted_at, j.scraped_at, j.posted_ts, j.scraped_ts, j.salary_max_usd
+"""
 
 
-# ── Feed Page (Home) ──────────────────────────────────────────────────────────
+def saved_lists(conn, job_ids: list[int]) -> dict[int, list[str]]:
+    """The lists each saved job is in, in one query on UNIQUE(job_id, list_name)."""
+    if not job_ids:
+        return {}
+    rows = conn.execute(
+        f"""
+        SELECT job_id, json_group_array(list_name) FROM saved_jobs
+        WHERE job_id IN ({",".join("?" * len(job_ids))}) GROUP BY job_id
+        """,
+        job_ids,
+    ).fetchall()
+    return {r[0]: sorted(json.loads(r[1])) for r in rows}
 
 
-@app.route("/")
-def feed():
-    """Main job feed with filters."""
-    conn = get_connection()
+def with_saved_state(conn, jobs: list) -> list[dict]:
+    """Job rows as dicts with is_saved, saved_lists and saved_list (the first).
 
-    # Get filter params
-    source = request.args.get("source", "")
-    search = request.args.get("search", "").strip()
-    days = request.args.get("days", "")
-    page = int(request.args.get("page", 1))
-    per_page = 30
+    One card per job however many lists it is in, which a join with
+    saved_jobs would not give.
+    """
+    lists = saved_lists(conn, [job["id"] for job in jobs])
+    return [
+        {
+            **dict(job),
+            "is_saved": int(job["id"] in lists),
+            "saved_lists": lists.get(job["id"], []),
+            "saved_list": lists[job["id"]][0] if job["id"] in lists else None,
+        }
+        for job in jobs
+    ]
+
+
+def encode_cursor(row, key: str) -> str:
+    """Opaque keyset cursor pointing just past the given job row."""
+    raw = f"{row[key]}|{row['id']}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
 
-    # Build query
-    where_clauses = []
-    params = []
+
+def decode_cursor(cursor: str) -> tuple[int, int] | None:
+    """Returns (sort key, id) for a cursor, or None if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        key, job_id = raw.rsplit("|", 1)
+        return int(key), int(job_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def build_feed_query(args) -> tuple[str, str, list, str, str | None]:
+    """Translate feed filter params into SQL fragments.
+
+    Returns (join_sql, where_sql, params, order_sql, keyset). ``keyset`` is
+    the column results are ordered by (with id), which an ``after`` cursor
+    pages on; it is None for search results ordered by rank, which are
+    paged by offset instead.
+
+    ``min_salary`` / ``max_salary`` (yearly USD) keep jobs whose salary
+    range reaches into [min_salary, max_salary]. ``tags`` (comma-separated)
+    keeps jobs with all of them, or any of them with ``tag_mode=any``.
+    """
+    source = args.get("source", "")
+    search = args.get("search", "").strip()
+    days = args.get("days", "")
+    keyset = SORTS.get(args.get("sort", ""), "scraped_ts")
+
+    join_sql = ""
+    where_clauses = ["j.canonical_id IS NULL"]  # One card per duplicate cluster
+    params: list = []
+    order_sql = f"j.{keyset} DESC, j.id DESC"
+
+    if search:
+        match = fts_query(search)
+        if match:
+            # Full-text search, best matches first (title weighs most)
+            join_sql = "JOIN job_posts_fts ON job_posts_fts.rowid = j.id"
+            where_clauses.append("job_posts_fts MATCH ?")
+            params.append(match)
+            if not args.get("sort"):
+                order_sql = "bm25(job_posts_fts, 10.0, 5.0, 3.0, 1.0), j.scraped_ts DESC"
+                keyset = None
 
     if source:
         where_clauses.append("j.source_platform = ?")
         params.append(source)
 
-    if search:
-        where_clauses.append(
-            "(j.title LIKE ? OR j.company LIKE ? OR j.tags LIKE ?)"
-        )
-        like = f"%{search}%"
-        params.extend([like, like, like])
-
     if days:
-        where_clauses.append("j.scraped_at >= datetime('now', ?)")
-        params.append(f"-{days} days")
-
-    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-
-    # Get total count
-    count_row = conn.execute(
-        f"SELECT COUNT(*) as cnt FROM job_posts j WHERE {where_sql}", params
-    ).fetchone()
-    total = count_row["cnt"]
+        since = int(time.time()) - int(days) * 86400
+        where_clauses.append("j.posted_ts >= ?")
+        params.append(since)
+        if keyset == "scraped_ts":
+            # Implied by posted_ts <= scraped_ts; bounds the range scan on
+            # the newest-first index instead of filtering all of it
+            where_clauses.append("j.scraped_ts >= ?")
+            params.append(since)
+
+    if args.get("tags"):
+        clauses, tag_params = tag_filter(args["tags"].split(","), args.get("tag_mode") == "any")
+        where_clauses += clauses
+        params += tag_params
+
+    if args.get("min_salary"):
+        where_clauses.append("j.salary_max_usd >= ?")
+        params.append(int(args["min_salary"]))
+    elif keyset == "salary_max_usd":
+        where_clauses.append("j.salary_max_usd IS NOT NULL")
+    if args.get("max_salary"):
+        where_clauses.append("j.salary_min_usd <= ?")
+        params.append(int(args["max_salary"]))
+
+    where_sql = " AND ".join(where_clauses)
+    return join_sql, where_sql, params, order_sql, keyset
+
+
+def fetch_feed_page(
+    conn, args, page: int = 1, columns: str = JOB_COLUMNS, with_saved: bool = True
+) -> tuple[list, str | None]:
+    """Fetch one page of the feed. Returns (jobs, next_cursor).
+
+    With a valid ``after`` cursor the page is read with an index range seek
+    on (sort key, id), so deep pages cost the same as the first one.
+    Otherwise falls back to LIMIT/OFFSET from ``page``.
+
+    ``columns`` must include j.id and the sort's epoch column for the
+    cursor. The saved state (see with_saved_state) is only looked up when
+    ``with_saved``.
+    """
+    join_sql, where_sql, params, order_sql, keyset = build_feed_query(args)
+
+    cursor = decode_cursor(args.get("after", "")) if keyset and args.get("after") else None
+    if cursor:
+        where_sql += f" AND (j.{keyset}, j.id) < (?, ?)"
+        params = params + list(cursor)
+        offset = 0
+    else:
+        offset = (page - 1) * PER_PAGE
 
-    # Get paginated jobs with saved status
-    offset = (page - 1) * per_page
     jobs = conn.execute(
         f"""
-        SELECT j.*,
-               CASE WHEN s.id IS NOT NULL THEN 1 ELSE 0 END as is_saved,
-               s.list_name as saved_list
+        SELECT {columns}
         FROM job_posts j
-        LEFT JOIN saved_jobs s ON j.id = s.job_id
+        {join_sql}
         WHERE {where_sql}
-        ORDER BY j.scraped_at DESC
+        ORDER BY {order_sql}
         LIMIT ? OFFSET ?
         """,
-        params + [per_page, offset],
+        params + [PER_PAGE, offset],
     ).fetchall()
 
+    next_cursor = None
+    if keyset and len(jobs) == PER_PAGE:
+        next_cursor = encode_cursor(jobs[-1], keyset)
+    if with_saved:
+        jobs = with_saved_state(conn, jobs)
+    return jobs, next_cursor
+
+
+def feed_args() -> dict:
+    """Normalized feed filter params; they double as cache keys."""
+    def digits(name: str, limit: int | None = None) -> str:
+        value = request.args.get(name, "")
+        if not (value.isascii() and value.isdigit()):
+            return ""
+        # Clamped, so the value always fits an SQLite INTEGER
+        return str(min(int(value), limit)) if limit is not None else value
+
+    sort = request.args.get("sort", "")
+    tags = normalize_tags(",".join(request.args.getlist("tags")))[:MAX_FILTER_TAGS]
+    return {
+        "source": request.args.get("source", ""),
+        "search": " ".join(request.args.get("search", "").split()),
+        "tags": ",".join(tags),
+        "tag_mode": "any" if len(tags) > 1 and request.args.get("tag_mode") == "any" else "",
+        "days": digits("days", MAX_DAYS),
+        "min_salary": digits("min_salary", MAX_SALARY_FILTER),
+        "max_salary": digits("max_salary", MAX_SALARY_FILTER),
+        "sort": sort if sort in SORTS else "",
+        "after": request.args.get("after", ""),
+    }
+
+
+@app.route("/")
+def feed():
+    """Main job feed with filters."""
+    args = feed_args()
+    page = int(request.args.get("page", 1))
+    key = ("feed", page, *args.values())
+    return response_cache.get_or_build(key, lambda: render_feed(args, page))
+
+
+def render_feed(args: dict, page: int) -> str:
+    conn = get_connection()
+
+    source = args["source"]
+    search = args["search"]
+    days = args["days"]
+
+    # Get total count; unfiltered and source-only totals are materialized
+    join_sql, where_sql, params, _, _ = build_feed_query(args)
+    filtered = (
+        search or days or args["tags"] or args["min_salary"] or args["max_salary"]
+        or args["sort"] == "salary"
+    )
+    if not filtered:
+        total = get_count(conn, "source", source) if source else get_count(conn, "jobs")
+    else:
+        count_row = conn.execute(
+            f"SELECT COUNT(*) as cnt FROM job_posts j {join_sql} WHERE {where_sql}", params
+        ).fetchone()
+        total = count_row["cnt"]
+
+    # Tag counts within the results; past FACET_SCAN_LIMIT matches (or with
+    # no filter at all) the maintained counts over the whole feed stand in
+    facets_in_results = bool(source or filtered) and total <= FACET_SCAN_LIMIT
+    if facets_in_results:
+        facets = facet_counts(conn, join_sql, where_sql, params, FACETS)
+    else:
+        facets = top_tags(conn, FACETS)
+
+    # Get paginated jobs with saved status
+    jobs, next_cursor = fetch_feed_page(conn, args, page)
+    job_tags = tags_for(conn, [job["id"] for job in jobs])
+
     # Get available sources for filter dropdown
-    sources = conn.execute(
-        "SELECT DISTINCT source_platform FROM job_posts ORDER BY source_platform"
-    ).fetchall()
+    sources = list(get_counts(conn, "source"))
 
     # Get user lists
     lists = conn.execute("SELECT * FROM lists ORDER BY name").fetchall()
 
-    total_pages = max(1, (total + per_page - 1) // per_page)
+    total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
+
+    # Live updates resume from here, so nothing after this render is missed
+    event_id = last_event_id(conn)
 
     conn.close()
 
+    selected = args["tags"].split(",") if args["tags"] else []
+    filters = {k: v for k, v in args.items() if v and k != "after"}
+
+    def with_tags(tags: list[str]) -> str:
+        return url_for("feed", **{**filters, "tags": ",".join(tags)})
+
     return render_template(
         "feed.html",
         jobs=jobs,
-        sources=[r["source_platform"] for r in sources],
+        job_tags=job_tags,
+        facets=[
+            {
+                "name": name,
+                "count": count,
+                "selected": name in selected,
+                # Toggles the tag in the current filter
+                "url": with_tags([t for t in selected if t != name] if name in selected else selected + [name]),
+            }
+            for name, count in facets
+        ],
+        facets_in_results=facets_in_results,
+        selected_tags=[{"name": name, "url": with_tags([t for t in selected if t != name])} for name in selected],
+        sources=sources,
         lists=lists,
         current_source=source,
         current_search=search,
         current_days=days,
+        current_min_salary=args["min_salary"],
+        current_sort=args["sort"],
+        filters=filters,
         page=page,
         total_pages=total_pages,
         total_jobs=total,
+        next_cursor=next_cursor,
+        last_event_id=event_id,
     )
 
 
+@app.route("/feed/cards")
+def feed_cards():
+    """Rendered cards for ``ids`` that match the feed filters, in feed order.
+
+    Used by app.js to prepend jobs announced on /api/events.
+    """
+    ids = [int(i) for i in request.args.get("ids", "").split(",") if i.isdigit()][:PER_PAGE]
+    if not ids:
+        return ""
+
+    join_sql, where_sql, params, order_sql, _ = build_feed_query(feed_args())
+    conn = get_connection()
+    jobs = conn.execute(
+        f"""
+        SELECT {JOB_COLUMNS}
+        FROM job_posts j
+        {join_sql}
+        WHERE {where_sql} AND j.id IN ({",".join("?" * len(ids))})
+        ORDER BY {order_sql}
+        """,
+        params + ids,
+    ).fetchall()
+    jobs = with_saved_state(conn, jobs)
+    job_tags = tags_for(conn, [job["id"] for job in jobs])
+    lists = conn.execute("SELECT * FROM lists ORDER BY name").fetchall()
+    conn.close()
+
+    return render_template("_job_cards.html", jobs=jobs, job_tags=job_tags, lists=lists)
+
+
+@app.template_filter("epoch_date")
+def epoch_date(ts: int | None) -> str:
+    """YYYY-MM-DD (UTC) for an epoch column such as posted_ts."""
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d") if ts else ""
+
+
 # ── Saved Jobs Page ───────────────────────────────────────────────────────────
 
 
@@ -152,7 +435,7 @@ def saved(list_name: str = ""):
 
     jobs = conn.execute(
         f"""
-        SELECT j.*, s.list_name, s.saved_at, s.id as saved_id
+        SELECT {JOB_COLUMNS}, s.list_name, s.saved_at, s.id as saved_id
         FROM saved_jobs s
         JOIN job_posts j ON j.id = s.job_id
         WHERE {where_sql}
@@ -162,17 +445,15 @@ def saved(list_name: str = ""):
     ).fetchall()
 
     # Count per list
-    list_counts = {}
-    for row in conn.execute(
-        "SELECT list_name, COUNT(*) as cnt FROM saved_jobs GROUP BY list_name"
-    ).fetchall():
-        list_counts[row["list_name"]] = row["cnt"]
+    list_counts = get_counts(conn, "list")
+    job_tags = tags_for(conn, list({job["id"] for job in jobs}))
 
     conn.close()
 
     return render_template(
         "saved.html",
         jobs=jobs,
+        job_tags=job_tags,
         lists=lists,
         list_counts=list_counts,
         current_list=list_name,
@@ -182,50 +463,167 @@ def saved(list_name: str = ""):
 # ── API: Save/Unsave Jobs ────────────────────────────────────────────────────
 
 
+MAX_BATCH = 500  # job_ids per /api/saved/batch request
+SAVE_OPS = ("save", "unsave", "move")
+
+
+def is_job_id(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def apply_saved(conn, op: str, job_ids: list[int], list_name: str = "", from_list: str = "") -> int:
+    """Save, unsave or move jobs with one executemany per step. Call inside a transaction.
+
+    save     add each job to ``list_name`` (created if needed)
+    unsave   remove each job from ``list_name``, or from every list
+    move     move each job from ``from_list`` (or every list) to ``list_name``,
+             keeping when it was first saved
+
+    Returns the number of saved_jobs rows added or removed.
+    """
+    changed = 0
+    if op in ("save", "move"):
+        conn.execute("INSERT OR IGNORE INTO lists (name) VALUES (?)", (list_name,))
+    if op == "save":
+        changed = conn.executemany(
+            "INSERT OR IGNORE INTO saved_jobs (job_id, list_name) VALUES (?, ?)",
+            [(job_id, list_name) for job_id in job_ids],
+        ).rowcount
+    elif op == "move":
+        source = "list_name = ?" if from_list else "list_name != ?"
+        changed = conn.executemany(
+            f"""
+            INSERT OR IGNORE INTO saved_jobs (job_id, list_name, saved_at)
+            SELECT job_id, ?, MIN(saved_at) FROM saved_jobs WHERE job_id = ? AND {source}
+            GROUP BY job_id
+            """,
+            [(list_name, job_id, from_list or list_name) for job_id in job_ids],
+        ).rowcount
+        changed += conn.executemany(
+            f"DELETE FROM saved_jobs WHERE job_id = ? AND {source}",
+            [(job_id, from_list or list_name) for job_id in job_ids],
+        ).rowcount
+    elif list_name:
+        changed = conn.executemany(
+            "DELETE FROM saved_jobs WHERE job_id = ? AND list_name = ?",
+            [(job_id, list_name) for job_id in job_ids],
+        ).rowcount
+    else:
+        changed = conn.executemany(
+            "DELETE FROM saved_jobs WHERE job_id = ?", [(job_id,) for job_id in job_ids]
+        ).rowcount
+
+    if changed:
+        bump_generation(conn)
+    if op == "move":
+        publish_saved(conn, job_ids, from_list, saved=False)
+    publish_saved(conn, job_ids, list_name, saved=op != "unsave")
+    return changed
+
+
+@app.route("/api/saved/batch", methods=["POST"])
+def api_saved_batch():
+    """Save, unsave or move many jobs in one transaction.
+
+    Body: {"op": "save" | "unsave" | "move", "job_ids": [...],
+           "list_name": "...", "from_list": "..."}. See apply_saved().
+    Ids of jobs that no longer exist are skipped and returned as "missing".
+    """
+    data = request.get_json(silent=True) or {}
+    op = data.get("op")
+    job_ids = data.get("job_ids")
+    list_name = (data.get("list_name") or "").strip()
+    from_list = (data.get("from_list") or "").strip()
+
+    if op not in SAVE_OPS:
+        return jsonify({"error": f"op must be one of: {', '.join(SAVE_OPS)}"}), 400
+    if not (isinstance(job_ids, list) and job_ids and all(is_job_id(i) for i in job_ids)):
+        return jsonify({"error": "job_ids must be a non-empty list of integers"}), 400
+    if len(job_ids) > MAX_BATCH:
+        return jsonify({"error": f"at most {MAX_BATCH} job_ids per request"}), 400
+    if op == "save" and not list_name:
+        list_name = "Saved"
+    if op == "move" and not list_name:
+        return jsonify({"error": "list_name required"}), 400
+    if op == "move" and from_list == list_name:
+        return jsonify({"error": "from_list and list_name must differ"}), 400
+
+    job_ids = list(dict.fromkeys(job_ids))
+    with transaction() as conn:
+        found = {
+            row[0]
+            for row in conn.execute(
+                f"SELECT id FROM job_posts WHERE id IN ({','.join('?' * len(job_ids))})", job_ids
+            )
+        }
+        existing = [job_id for job_id in job_ids if job_id in found]
+        changed = apply_saved(conn, op, existing, list_name, from_list) if existing else 0
+    if changed:
+        response_cache.invalidate()
+    return jsonify({
+        "status": "ok",
+        "op": op,
+        "list_name": list_name,
+        "job_ids": existing,
+        "missing": [job_id for job_id in job_ids if job_id not in found],
+        "changed": changed,
+    })
+
+
 @app.route("/api/save", methods=["POST"])
 def api_save_job():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     job_id = data.get("job_id")
     list_name = data.get("list_name", "Saved")
 
-    if not job_id:
-        return jsonify({"error": "job_id required"}), 400
+    if not is_job_id(job_id):
+        return jsonify({"error": "job_id must be an integer"}), 400
 
-    conn = get_connection()
     try:
-        # Ensure list exists
-        conn.execute("INSERT OR IGNORE INTO lists (name) VALUES (?)", (list_name,))
-        conn.execute(
-            "INSERT OR IGNORE INTO saved_jobs (job_id, list_name) VALUES (?, ?)",
-            (job_id, list_name),
-        )
-        conn.commit()
+        with transaction() as conn:
+            apply_saved(conn, "save", [job_id], list_name)
+        response_cache.invalidate()
         return jsonify({"status": "saved", "job_id": job_id, "list": list_name})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
 
 
 @app.route("/api/unsave", methods=["POST"])
 def api_unsave_job():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     job_id = data.get("job_id")
     list_name = data.get("list_name", "")
 
-    conn = get_connection()
-    if list_name:
-        conn.execute(
-            "DELETE FROM saved_jobs WHERE job_id = ? AND list_name = ?",
-            (job_id, list_name),
-        )
-    else:
-        conn.execute("DELETE FROM saved_jobs WHERE job_id = ?", (job_id,))
-    conn.commit()
-    conn.close()
+    if not is_job_id(job_id):
+        return jsonify({"error": "job_id must be an integer"}), 400
+
+    with transaction() as conn:
+        apply_saved(conn, "unsave", [job_id], list_name)
+    response_cache.invalidate()
     return jsonify({"status": "unsaved", "job_id": job_id})
 
 
+def publish_saved(conn, job_ids: list[int], list_name: str, saved: bool) -> None:
+    """Announce a save or unsave, with each job's saved state after it.
+
+    ``job_ids`` must already be validated (see is_job_id).
+    """
+    if not job_ids:
+        return
+    still_saved = {
+        row[0]
+        for row in conn.execute(
+            f"SELECT DISTINCT job_id FROM saved_jobs WHERE job_id IN ({','.join('?' * len(job_ids))})",
+            job_ids,
+        )
+    }
+    publish(conn, "saved", {
+        "list_name": list_name,
+        "saved": saved,
+        "jobs": [{"id": job_id, "is_saved": job_id in still_saved} for job_id in job_ids],
+    })
+
+
 # ── API: Manage Lists ────────────────────────────────────────────────────────
 
 
@@ -236,24 +634,27 @@ def api_create_list():
     if not name:
         return jsonify({"error": "name required"}), 400
 
-    conn = get_connection()
     try:
-        conn.execute("INSERT INTO lists (name) VALUES (?)", (name,))
-        conn.commit()
+        with transaction() as conn:
+            conn.execute("INSERT INTO lists (name) VALUES (?)", (name,))
+            bump_generation(conn)
+        response_cache.invalidate()
         return jsonify({"status": "created", "name": name})
     except sqlite3.IntegrityError:
         return jsonify({"error": "List already exists"}), 409
-    finally:
-        conn.close()
 
 
 @app.route("/api/lists/<name>", methods=["DELETE"])
 def api_delete_list(name: str):
-    conn = get_connection()
-    conn.execute("DELETE FROM saved_jobs WHERE list_name = ?", (name,))
-    conn.execute("DELETE FROM lists WHERE name = ?", (name,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        job_ids = [
+            row[0] for row in conn.execute("SELECT job_id FROM saved_jobs WHERE list_name = ?", (name,))
+        ]
+        conn.execute("DELETE FROM saved_jobs WHERE list_name = ?", (name,))
+        conn.execute("DELETE FROM lists WHERE name = ?", (name,))
+        bump_generation(conn)
+        publish_saved(conn, job_ids, name, saved=False)
+    response_cache.invalidate()
     return jsonify({"status": "deleted", "name": name})
 
 
@@ -262,18 +663,183 @@ def api_delete_list(name: str):
 
 @app.route("/api/scrape", methods=["POST"])
 def api_scrape():
-    """Trigger a scrape in background thread."""
-    data = request.get_json() or {}
+    """Queue a scrape, or join the identical one already queued or running."""
+    data = request.get_json(silent=True) or {}
     terms = data.get("terms")
     sources = data.get("sources")
+    if terms is not None and not (
+        isinstance(terms, list) and all(isinstance(t, str) for t in terms)
+    ):
+        return jsonify({"error": "terms must be a list of strings"}), 400
+    if sources is not None and not (
+        isinstance(sources, list) and all(s in SCRAPERS for s in sources)
+    ):
+        return jsonify({"error": f"sources must be a list of: {', '.join(SCRAPERS)}"}), 400
+
+    run_id, coalesced = request_run(terms, sources)
+    scheduler.start()
+    scheduler.wake()
+
+    return jsonify({
+        "status": "already running" if coalesced else "scraping started",
+        "run_id": run_id,
+        "coalesced": coalesced,
+        "status_url": url_for("api_scrape_status", run_id=run_id),
+        "terms": terms,
+        "sources": sources,
+    }), 202
+
+
+@app.route("/api/scrape/<int:run_id>")
+def api_scrape_status(run_id: int):
+    """Status of a scrape run: queued, running, done or failed, with its stats."""
+    scrape_run = get_run(run_id)
+    if scrape_run is None:
+        return jsonify({"error": "Run not found"}), 404
+    return jsonify(scrape_run)
+
+
+@app.route("/api/scrape/history")
+def api_scrape_history():
+    """p50/p95 stage timings per source over its last ``window`` runs."""
+    window = min(max(request.args.get("window", 50, type=int), 1), 1000)
+    source = request.args.get("source") or None
+    return jsonify(summarize_history(window=window, source=source))
+
+
+# ── API: Jobs ────────────────────────────────────────────────────────────────
+
+
+# Fields /api/jobs can return; ``fields=`` picks a subset
+API_FIELDS = (
+    "id", "title", "company", "location", "role_category", "source_platform", "url",
+    "salary", "salary_min_usd", "salary_max_usd", "salary_currency", "salary_period",
+    "description", "tags", "posted_at", "scraped_at", "posted_ts", "scraped_ts",
+    "is_saved", "saved_lists", "saved_list",
+)
+SAVED_FIELDS = {"is_saved", "saved_lists", "saved_list"}
+
+# Response compression, best first; brotli is optional (pip install brotli)
+COMPRESS_MIN_BYTES = 1024
+ENCODINGS = ["br", "gzip"] if brotli else ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+@app.route("/api/jobs")
+def api_jobs():
+    """JSON feed with the same filters as the home page, paged by cursor.
+
+    ``sort=posted`` orders by posting date instead of first seen,
+    ``sort=salary`` by yearly USD salary.
+    ``fields=id,title,url`` returns only those fields (default: all of
+    API_FIELDS), and only those columns are read. Responses carry a weak
+    ETag from the data generation, so unchanged pages revalidate with a
+    304, and are brotli- or gzip-compressed when the client accepts it.
+    """
+    args = feed_args()
+    if args["after"] and decode_cursor(args["after"]) is None:
+        return jsonify({"error": "invalid cursor"}), 400
+
+    fields = tuple(f.strip() for f in request.args.get("fields", "").split(",") if f.strip())
+    unknown = [f for f in fields if f not in API_FIELDS]
+    if unknown:
+        return jsonify({
+            "error": f"unknown fields: {', '.join(unknown)}",
+            "fields": list(API_FIELDS),
+        }), 400
+    fields = fields or API_FIELDS
+    page = request.args.get("page", 1, type=int)
+
+    generation = response_cache.generation()
+    etag = f"g{generation}"
+    if args["days"]:
+        # "Last N days" results age out without a write; expire with the cache
+        etag += f"-t{int(time.time() // response_cache.ttl)}"
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        key = ("api_jobs", generation, page, fields, *args.values())
+        body = response_cache.get_or_build(key, lambda: build_api_jobs(args, page, fields))
+        response = app.response_class(body, mimetype="application/json")
+        encoding = request.accept_encodings.best_match(ENCODINGS)
+        if encoding and len(body) >= COMPRESS_MIN_BYTES:
+            # Compressed once per page and encoding, like the page itself
+            body = response_cache.get_or_build(key + (encoding,), lambda: compress(body, encoding))
+            response.set_data(body)
+            response.headers["Content-Encoding"] = encoding
+
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def build_api_jobs(args: dict, page: int, fields: tuple[str, ...]) -> bytes:
+    # id and the sort keys are always read: the next cursor is built from them
+    columns = ", ".join(
+        f"j.{f}" for f in dict.fromkeys(("id", *SORTS.values()) + fields) if f not in SAVED_FIELDS
+    )
+    conn = get_connection()
+    jobs, next_cursor = fetch_feed_page(
+        conn, args, page, columns=columns, with_saved=not SAVED_FIELDS.isdisjoint(fields)
+    )
+    conn.close()
 
-    def _run():
-        run_scrapers(search_terms=terms, sources=sources)
-
-    t = threading.Thread(target=_run, daemon=True)
-    t.start()
-
-    return jsonify({"status": "scraping started", "terms": terms, "sources": sources})
+    payload = {"jobs": [{f: job[f] for f in fields} for job in jobs], "next_cursor": next_cursor}
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# ── API: Live Events ──────────────────────────────────────────────────────────
+
+# Streams are closed after STREAM_SECONDS; EventSource reconnects on its own
+# and resumes from Last-Event-ID, so no thread is held by one page forever.
+# Heartbeats keep proxies from timing out idle streams and reveal closed ones.
+STREAM_SECONDS = float(os.environ.get("SSE_STREAM_SECONDS", 300))
+HEARTBEAT_SECONDS = 15
+RETRY_MS = 3000
+
+
+@app.route("/api/events")
+def api_events():
+    """Server-Sent Events stream of new jobs, saves and finished scrapes.
+
+    Resumes after the Last-Event-ID header, or ``?after=<id>`` on the first
+    connect; without either it starts from now. Each worker serves at most
+    SSE_MAX_STREAMS streams and answers 503 beyond that.
+    """
+    after = request.headers.get("Last-Event-ID", type=int)
+    if after is None:
+        after = request.args.get("after", type=int)
+    sub = event_broker.subscribe(after)
+    if sub is None:
+        return jsonify({"error": "too many open event streams"}), 503, {"Retry-After": "30"}
+
+    def stream():
+        yield f"retry: {RETRY_MS}\n\n"
+        deadline = time.monotonic() + STREAM_SECONDS
+        while time.monotonic() < deadline:
+            event = sub.get(timeout=HEARTBEAT_SECONDS)
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            yield f"id: {event.id}\nevent: {event.kind}\ndata: {event.data}\n\n"
+            if event.kind == "reset":
+                break
+
+    response = Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Runs when the server closes the response, even if it never started
+    # streaming (client gone, HEAD request)
+    response.call_on_close(lambda: event_broker.unsubscribe(sub))
+    return response
 
 
 # ── API: Stats ────────────────────────────────────────────────────────────────
@@ -281,26 +847,27 @@ def api_scrape():
 
 @app.route("/api/stats")
 def api_stats():
+    return jsonify(response_cache.get_or_build("stats", build_stats))
+
+
+def build_stats() -> dict:
     conn = get_connection()
-    total = conn.execute("SELECT COUNT(*) as cnt FROM job_posts").fetchone()["cnt"]
-    by_source = conn.execute(
-        "SELECT source_platform, COUNT(*) as cnt FROM job_posts GROUP BY source_platform"
-    ).fetchall()
-    saved_count = conn.execute("SELECT COUNT(*) as cnt FROM saved_jobs").fetchone()["cnt"]
+    stats = {
+        "total_jobs": get_count(conn, "jobs"),
+        "saved_jobs": get_count(conn, "saved"),
+        "by_source": get_counts(conn, "source"),
+    }
     conn.close()
-
-    return jsonify(
-        {
-            "total_jobs": total,
-            "saved_jobs": saved_count,
-            "by_source": {r["source_platform"]: r["cnt"] for r in by_source},
-        }
-    )
+    return stats
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
     init_db()
     print("\n  🚀 Job Feed running at http://localhost:5000\n")
     app.run(debug=True, host="0.0.0.0", port=5000)
@@ -0,0 +1,84 @@
+"""
+Micro-benchmark: client-side search-term filtering.
+
+Compares the old per-item filter (build a lowercased "searchable" string,
+then one substring test per lowercased term) with the shared TermMatcher.
+With the default 6 terms the two are about even (the matcher is ~1.05x
+faster at best) and whole-word matching costs ~1.5x more; the matcher
+pulls ahead as terms grow, ~2.5x faster at 40.
+
+Usage:
+    python -m bench.bench_matcher
+    python -m bench.bench_matcher --items 50000 --terms 40
+"""
+
+import argparse
+import random
+import string
+import timeit
+
+from scrapers.matching import TermMatcher
+
+WORDS = [
+    "data", "analyst", "engineer", "senior", "python", "sql", "power", "bi",
+    "business", "intelligence", "analytics", "backend", "frontend", "react",
+    "marketing", "sales", "manager", "remote", "cloud", "devops",
+]
+
+
+def make_items(n: int, rng: random.Random) -> list[tuple[str, str, str]]:
+    items = []
+    for _ in range(n):
+        title = " ".join(rng.choices(WORDS, k=4)).title()
+        tags = ", ".join(rng.choices(WORDS, k=6))
+        company = "".join(rng.choices(string.ascii_letters, k=10))
+        items.append((title, tags, company))
+    return items
+
+
+def make_terms(n: int, rng: random.Random) -> list[str]:
+    base = ["data analyst", "bi engineer", "business intelligence", "analytics engineer", "power bi"]
+    extra = [" ".join(rng.choices(WORDS, k=2)) for _ in range(max(0, n - len(base)))]
+    return (base + extra)[:n]
+
+
+def naive(items, terms) -> int:
+    kept = 0
+    for title, tags, company in items:
+        searchable = f"{title} {tags} {company}".lower()
+        if any(term.lower() in searchable for term in terms):
+            kept += 1
+    return kept
+
+
+def compiled(items, matcher: TermMatcher) -> int:
+    return sum(1 for title, tags, company in items if matcher.matches(title, tags, company))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark search-term matching")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--terms", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    items = make_items(args.items, rng)
+    terms = make_terms(args.terms, rng)
+    matcher = TermMatcher(terms)
+    whole = TermMatcher(terms, whole_words=True)
+    assert naive(items, terms) == compiled(items, matcher)
+
+    results = {
+        "naive": min(timeit.repeat(lambda: naive(items, terms), number=1, repeat=args.repeat)),
+        "matcher": min(timeit.repeat(lambda: compiled(items, matcher), number=1, repeat=args.repeat)),
+        "matcher (whole words)": min(timeit.repeat(lambda: compiled(items, whole), number=1, repeat=args.repeat)),
+    }
+
+    print(f"\n--- {args.items} items, {len(terms)} terms ---")
+    for name, secs in results.items():
+        print(f"  {name:24} {secs * 1000:8.1f} ms  ({secs / args.items * 1e6:.2f} µs/item)")
+
+
+if __name__ == "__main__":
+    main()
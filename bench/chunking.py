@@ -0,0 +1,91 @@
+"""
+Chunk-boundary regression check for scrapers.jsonstream.
+
+Generates API-shaped documents (strings with escapes and non-ASCII text,
+negative numbers, fractions, exponents, literals, nested objects), splits
+each one at random byte offsets, including inside UTF-8 sequences and
+numbers, and checks that iter_array yields exactly what json.loads reads
+from the whole body. Exits non-zero on any mismatch, so it can gate CI.
+
+Usage:
+    python -m bench.chunking
+    python -m bench.chunking --docs 20000 --seed 7
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from scrapers.jsonstream import iter_array
+
+KEY = "jobs"
+
+
+def make_value(rng: random.Random, depth: int = 0):
+    kinds = ["int", "float", "exp", "str", "bool", "null"] + (["list", "dict"] if depth < 2 else [])
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.randint(-10**9, 10**9)
+    if kind == "float":
+        return round(rng.uniform(-1e6, 1e6), rng.randint(0, 6))
+    if kind == "exp":
+        return float(f"{rng.uniform(-9, 9):.3f}e{rng.randint(-30, 30)}")
+    if kind == "str":
+        return "".join(rng.choices('ab c"\\/\n\té€😀', k=rng.randint(0, 12)))
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    if kind == "list":
+        return [make_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": make_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+def make_document(rng: random.Random) -> tuple[bytes, str | None]:
+    items = [make_value(rng) for _ in range(rng.randint(0, 8))]
+    if rng.random() < 0.5:
+        return json.dumps(items, ensure_ascii=rng.random() < 0.5).encode(), None
+    doc = {"meta": make_value(rng), KEY: items, "links": {"next": None, "page": rng.randint(1, 9)}}
+    return json.dumps(doc, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 1])).encode(), KEY
+
+
+def split(body: bytes, rng: random.Random) -> list[bytes]:
+    if len(body) < 2:
+        return [body]
+    cuts = sorted(rng.sample(range(1, len(body)), min(len(body) - 1, rng.randint(1, 12))))
+    return [body[a:b] for a, b in zip([0] + cuts, cuts + [len(body)])]
+
+
+def check(docs: int, seed: int) -> int:
+    """Parse ``docs`` random documents in random chunks. Returns the number of failures."""
+    rng = random.Random(seed)
+    failures = 0
+    for i in range(docs):
+        body, key = make_document(rng)
+        expected = json.loads(body)
+        if key is not None:
+            expected = expected[key]
+        chunks = split(body, rng)
+        try:
+            got = list(iter_array(chunks, key))
+            error = None if got == expected else f"got {got!r}"
+        except ValueError as e:
+            error = f"raised {e}"
+        if error:
+            failures += 1
+            print(f"FAIL doc {i}: {error}\n  chunks {chunks!r}", file=sys.stderr)
+    print(f"{docs} documents, {failures} parsed differently from json.loads", file=sys.stderr)
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check JSON streaming across chunk boundaries")
+    parser.add_argument("--docs", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.exit(1 if check(args.docs, args.seed) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Generate job databases of a given size for the benchmarks.
+
+Rows look like scraped ones: four sources, a cross-posted duplicate now and
+then (canonical_id set), scrape dates spread over the last 90 days, and a
+few saved jobs in several lists. Triggers on job_posts and job_tags are
+dropped for the bulk load and recreated by init_db(), after which the FTS
+index and the aggregates are rebuilt in one go.
+
+Usage:
+    python -m bench.datagen 10000 100000 1000000
+    python -m bench.datagen 100000 --out /tmp/jobs-100k.db
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bench.fake_api import CATEGORIES, FILLER, LOCATIONS, SOURCES, TAGS, TITLE_WORDS
+from db import database
+from db.database import init_db, recount, transaction
+from db.tags import normalize_tags, set_tags
+from scrapers import dedup
+from scrapers.base import job_timestamps
+from scrapers.salary import salary_columns
+
+DATA_DIR = Path(os.environ.get("BENCH_DATA_DIR", "/tmp/jobfeed-bench"))
+DUPLICATE_RATE = 0.1  # Share of rows that are cross-posted duplicates
+SAVED_RATE = 0.005
+LISTS = ["Saved", "Applied", "Interesting"]
+CHUNK = 20_000
+SALARIES = [
+    "", "", "", "Competitive", "$60,000 – $80,000", "$95,000 – $140,000", "USD 90000 – 120000",
+    "USD 150000+", "€50k", "£45,000 - £60,000", "$45 - $70 per hour", "EUR 4.500 - 5.500 per month",
+]
+
+
+def db_path(rows: int, seed: int = 42) -> Path:
+    return DATA_DIR / f"jobs-{rows}-s{seed}.db"
+
+
+def _rows(rows: int, rng: random.Random):
+    now = datetime.now()
+    for n in range(rows):
+        scraped = now - timedelta(seconds=rng.randrange(90 * 86400))
+        title = " ".join(rng.sample(TITLE_WORDS, 3))
+        company = f"Company {rng.randrange(max(50, rows // 8))}"
+        location = rng.choice(LOCATIONS)
+        source = SOURCES[n % len(SOURCES)]
+        canonical = rng.randrange(1, n + 1) if n and rng.random() < DUPLICATE_RATE else None
+        posted = (scraped - timedelta(days=rng.randrange(5))).strftime("%Y-%m-%d %H:%M")
+        salary = rng.choice(SALARIES)
+        yield (
+            title, company, location, rng.choice(CATEGORIES), source,
+            f"https://{source}.example/jobs/{n}",
+            salary,
+            " ".join(rng.choices(FILLER, k=40)),
+            ", ".join(rng.sample(TAGS, 4)),
+            posted,
+            scraped.isoformat(),
+            *job_timestamps(posted, scraped.isoformat()),
+            *salary_columns(salary),
+            canonical,
+            dedup.fingerprint(company, title, location),
+        )
+
+
+def generate(rows: int, path: Path, seed: int = 42) -> Path:
+    """Build a database with ``rows`` job posts at ``path`` (replacing it)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    previous = database.DB_PATH
+    database.DB_PATH = path
+    try:
+        init_db()
+        rng = random.Random(seed)
+        with transaction() as conn:
+            triggers = [r["name"] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name IN ('job_posts', 'job_tags')"
+            )]
+            for name in triggers:
+                conn.execute(f"DROP TRIGGER {name}")
+
+            batch = []
+            for row in _rows(rows, rng):
+                batch.append(row)
+                if len(batch) >= CHUNK:
+                    _insert(conn, batch)
+                    batch = []
+            if batch:
+                _insert(conn, batch)
+            tagged = conn.execute("SELECT id, tags FROM job_posts").fetchall()
+            set_tags(conn, {r[0]: normalize_tags(r[1]) for r in tagged})
+
+            saved = rng.sample(range(1, rows + 1), int(rows * SAVED_RATE)) if rows else []
+            conn.executemany(
+                "INSERT OR IGNORE INTO saved_jobs (job_id, list_name) VALUES (?, ?)",
+                [(job_id, rng.choice(LISTS)) for job_id in saved],
+            )
+            conn.executemany("INSERT OR IGNORE INTO lists (name) VALUES (?)", [(n,) for n in LISTS])
+
+        init_db()  # Recreates the dropped triggers
+        with transaction() as conn:
+            conn.execute("INSERT INTO job_posts_fts (job_posts_fts) VALUES ('rebuild')")
+            recount(conn)
+        conn = database.get_connection()
+        conn.execute("ANALYZE")
+        # Fold everything into the main file: the suite copies only that
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.close()
+        database.reset_connection()
+    finally:
+        database.DB_PATH = previous
+    return path
+
+
+def _insert(conn, batch: list[tuple]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO job_posts (
+            title, company, location, role_category, source_platform, url, salary,
+            description, tags, posted_at, scraped_at, posted_ts, scraped_ts,
+            salary_min_usd, salary_max_usd, salary_currency, salary_period,
+            canonical_id, fingerprint
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        batch,
+    )
+
+
+def ensure(rows: int, seed: int = 42) -> Path:
+    """Path to a database with ``rows`` job posts, generating it if missing."""
+    path = db_path(rows, seed)
+    if not path.exists():
+        generate(rows, path, seed)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate benchmark job databases")
+    parser.add_argument("rows", type=int, nargs="+")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, help="Output file (one size only)")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        path = args.out or db_path(rows, args.seed)
+        start = time.monotonic()
+        generate(rows, path, args.seed)
+        size_mb = path.stat().st_size / 1e6
+        print(f"  {rows:>9} rows -> {path} ({size_mb:.0f} MB, {time.monotonic() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
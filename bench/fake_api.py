@@ -0,0 +1,296 @@
+"""
+Local stand-in for the four job APIs, for benchmarks and offline runs.
+
+Serves deterministic synthetic listings in each source's response format:
+  /remoteok               RemoteOK: a JSON list headed by a legal notice
+  /remotive               Remotive: {"jobs": [...]}, filtered by ?search=
+  /jobicy                 Jobicy: {"jobs": [...]}, filtered by ?tag=, ?count=
+  /arbeitnow?page=N       Arbeitnow: {"data": [...], "links": {"next": ...}}
+
+Payloads are built and gzipped up front and carry an ETag, so the server
+answers conditional requests with 304 like the real APIs and costs little
+next to the scrapers it is measuring. A JSON file named after a source in
+``--fixtures`` (e.g. remoteok.json, a recorded response) replaces its
+synthetic payload.
+
+Usage:
+    python -m bench.fake_api --port 8099 --jobs 2000
+    # then, in another shell, the printed *_API_URL exports and:
+    python -m scrapers.runner
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+SOURCES = ("remoteok", "remotive", "jobicy", "arbeitnow")
+ARBEITNOW_PAGE_SIZE = 100
+START_EPOCH = 1_767_225_600  # 2026-01-01, newest synthetic posting before advance()
+
+TITLE_WORDS = [
+    "Senior", "Junior", "Lead", "Staff", "Data", "Analyst", "Engineer", "BI",
+    "Business Intelligence", "Analytics", "Backend", "Frontend", "Python",
+    "Power BI", "Product", "Marketing", "Manager", "DevOps", "Cloud", "SQL",
+]
+TAGS = [
+    "python", "sql", "power bi", "tableau", "dbt", "aws", "react", "go",
+    "excel", "looker", "spark", "marketing", "sales", "devops", "kubernetes",
+]
+CATEGORIES = ["software-dev", "data", "devops", "product", "marketing", "business"]
+LOCATIONS = ["Remote", "USA", "Europe", "Germany", "UK", "Worldwide", "LATAM"]
+FILLER = (
+    "we are looking for a motivated person to join our distributed team and "
+    "help us build reliable products for customers around the world with "
+    "modern tooling clear ownership and a friendly culture of written communication"
+).split()
+
+
+class Listing:
+    """One synthetic job, rendered into each source's item format."""
+
+    __slots__ = ("n", "epoch", "title", "company", "tags", "location", "category", "salary", "description")
+
+    def __init__(self, n: int, epoch: int, rng: random.Random) -> None:
+        self.n = n
+        self.epoch = epoch
+        self.title = " ".join(rng.sample(TITLE_WORDS, 3))
+        self.company = f"Company {rng.randrange(max(50, n // 4 + 1))}"
+        self.tags = rng.sample(TAGS, 4)
+        self.location = rng.choice(LOCATIONS)
+        self.category = rng.choice(CATEGORIES)
+        self.salary = rng.choice([0, 0, 60_000, 80_000, 120_000])
+        self.description = " ".join(rng.choices(FILLER, k=40))
+
+    def iso(self, sep: str = "T") -> str:
+        return datetime.fromtimestamp(self.epoch, timezone.utc).strftime(f"%Y-%m-%d{sep}%H:%M:%S")
+
+    def remoteok(self) -> dict:
+        return {
+            "id": str(self.n), "epoch": self.epoch, "date": self.iso() + "+00:00",
+            "slug": f"job-{self.n}", "position": self.title, "company": self.company,
+            "tags": self.tags, "location": self.location, "description": self.description,
+            "salary_min": self.salary, "salary_max": self.salary and self.salary + 20_000,
+            "url": f"https://remoteok.example/remote-jobs/{self.n}",
+        }
+
+    def remotive(self) -> dict:
+        return {
+            "id": self.n, "url": f"https://remotive.example/jobs/{self.n}", "title": self.title,
+            "company_name": self.company, "category": self.category, "tags": self.tags,
+            "job_type": "full_time", "publication_date": self.iso(),
+            "candidate_required_location": self.location,
+            "salary": f"${self.salary // 1000}k" if self.salary else "",
+            "description": self.description,
+        }
+
+    def jobicy(self) -> dict:
+        return {
+            "id": self.n, "url": f"https://jobicy.example/jobs/{self.n}", "jobTitle": self.title,
+            "companyName": self.company, "jobIndustry": [self.category], "jobType": ["full-time"],
+            "jobGeo": self.location, "pubDate": self.iso(" "),
+            "annualSalaryMin": self.salary or "", "annualSalaryMax": self.salary and self.salary + 20_000 or "",
+            "salaryCurrency": "USD", "jobDescription": self.description,
+        }
+
+    def arbeitnow(self) -> dict:
+        return {
+            "slug": f"job-{self.n}", "company_name": self.company, "title": self.title,
+            "description": self.description, "remote": self.location == "Remote",
+            "url": f"https://arbeitnow.example/jobs/{self.n}", "tags": self.tags,
+            "job_types": ["full time"], "location": self.location, "created_at": self.epoch,
+        }
+
+    def matches(self, terms: list[str]) -> bool:
+        text = f"{self.title} {' '.join(self.tags)}".lower()
+        return any(term.lower() in text for term in terms)
+
+
+class Payload:
+    """A prepared response body with its ETag and gzipped variant."""
+
+    __slots__ = ("body", "gzipped", "etag")
+
+    def __init__(self, data) -> None:
+        self.body = json.dumps(data).encode()
+        self.gzipped = gzip.compress(self.body, compresslevel=6)
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=8).hexdigest() + '"'
+
+
+class FakeJobAPI:
+    """Threaded HTTP server serving ``jobs`` listings per source.
+
+    Use as a context manager, or call start()/stop(). ``urls`` maps each
+    source to the API_URL to point its scraper at.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1000,
+        port: int = 0,
+        seed: int = 42,
+        fixtures: Path | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        self.jobs = jobs
+        self.seed = seed
+        self.fixtures = fixtures
+        self.latency = latency  # Added to every response, to mimic a remote API
+        self.requests = 0
+        self._listings: list[Listing] = []
+        self._payloads: dict[str, Payload] = {}
+        self._lock = threading.Lock()
+        self._build(jobs)
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def urls(self) -> dict[str, str]:
+        return {source: f"{self.base_url}/{source}" for source in SOURCES}
+
+    def _build(self, jobs: int, newest: int = START_EPOCH, first_id: int = 0) -> None:
+        rng = random.Random(self.seed + first_id)
+        # Newest first, one posting every ten minutes
+        fresh = [Listing(first_id + i, newest - (jobs - 1 - i) * 600, rng) for i in range(jobs)]
+        with self._lock:
+            self._listings = sorted(fresh + self._listings, key=lambda item: -item.epoch)[: self.jobs]
+            self._payloads.clear()
+
+    def advance(self, new_jobs: int) -> None:
+        """Publish ``new_jobs`` newer postings, pushing the oldest out."""
+        newest = self._listings[0].epoch if self._listings else START_EPOCH
+        first_id = max((item.n for item in self._listings), default=-1) + 1
+        self._build(new_jobs, newest + new_jobs * 600, first_id)
+
+    def payload(self, source: str, query: dict[str, str]) -> Payload:
+        """The response for one request, built once per distinct query.
+
+        ``query`` values are still percent-encoded: search terms are joined
+        with a literal "+" and encoded individually.
+        """
+        key = f"{source}?{sorted(query.items())}"
+        with self._lock:
+            cached = self._payloads.get(key)
+            if cached is not None:
+                return cached
+            listings = self._listings
+
+        if self.fixtures and (self.fixtures / f"{source}.json").exists():
+            data = json.loads((self.fixtures / f"{source}.json").read_text())
+        elif source == "remoteok":
+            data = [{"legal": "Synthetic listings served by bench.fake_api"}]
+            data += [item.remoteok() for item in listings]
+        elif source == "remotive":
+            terms = [unquote(t) for t in query.get("search", "").split("+") if t]
+            data = {"jobs": [item.remotive() for item in listings if not terms or item.matches(terms)]}
+        elif source == "jobicy":
+            terms = [unquote(t) for t in query.get("tag", "").split("+") if t]
+            count = int(query.get("count", "50"))
+            kept = [item.jobicy() for item in listings if not terms or item.matches(terms)]
+            data = {"apiVersion": "2", "jobCount": min(count, len(kept)), "jobs": kept[:count]}
+        else:
+            page = int(query.get("page", "1"))
+            start = (page - 1) * ARBEITNOW_PAGE_SIZE
+            items = listings[start:start + ARBEITNOW_PAGE_SIZE]
+            more = start + ARBEITNOW_PAGE_SIZE < len(listings)
+            data = {
+                "data": [item.arbeitnow() for item in items],
+                "links": {"next": f"{self.base_url}/arbeitnow?page={page + 1}" if more else None},
+                "meta": {"current_page": page, "per_page": ARBEITNOW_PAGE_SIZE},
+            }
+
+        payload = Payload(data)
+        with self._lock:
+            self._payloads[key] = payload
+        return payload
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                api.requests += 1
+                if api.latency:
+                    time.sleep(api.latency)
+                parts = urlsplit(self.path)
+                source = parts.path.strip("/")
+                if source not in SOURCES:
+                    self.send_error(404)
+                    return
+                query = dict(p.partition("=")[::2] for p in parts.query.split("&") if p)
+                payload = api.payload(source, query)
+
+                if self.headers.get("If-None-Match") == payload.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", payload.etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+                body = payload.gzipped if gzipped else payload.body
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", payload.etag)
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "FakeJobAPI":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeJobAPI":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve synthetic job API payloads locally")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--jobs", type=int, default=1000, help="Listings per source")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per response")
+    parser.add_argument("--fixtures", type=Path, help="Directory of recorded <source>.json payloads")
+    args = parser.parse_args()
+
+    api = FakeJobAPI(args.jobs, args.port, args.seed, args.fixtures, args.latency).start()
+    for source, url in api.urls.items():
+        print(f"export {source.upper()}_API_URL={url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
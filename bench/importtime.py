@@ -0,0 +1,89 @@
+"""
+Import-time regression check for the web app.
+
+Imports app in fresh interpreters under ``python -X importtime`` and fails
+if it loads modules a web worker doesn't need until it scrapes (LAZY: the
+runner and the scrapers, which scrapers.registry imports on first use),
+or, with --budget-ms, if importing app takes longer than that (best of
+--runs). Prints the slowest imports either way.
+
+Exits non-zero on any failure, so it can gate CI.
+
+Usage:
+    python -m bench.importtime
+    python -m bench.importtime --budget-ms 500 --top 25
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from scrapers.registry import BUILTIN
+
+ROOT = Path(__file__).parent.parent
+
+LAZY = [
+    "scrapers.runner",
+    "scrapers.base",
+    "scrapers.dedup",
+    "scrapers.salary",
+    *(path.partition(":")[0] for path in BUILTIN.values()),
+]
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(module: str = "app") -> list[tuple[str, int, int, int]]:
+    """(name, self µs, cumulative µs, depth) for each import, in import order."""
+    env = {k: v for k, v in os.environ.items() if k not in ("ENABLE_BG_SCRAPE", "RAILWAY_ENVIRONMENT")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise SystemExit(f"import {module} failed:\n{result.stderr}")
+    imports = []
+    for line in result.stderr.splitlines():
+        if match := LINE.match(line):
+            own, cumulative, indent, name = match.groups()
+            imports.append((name, int(own), int(cumulative), len(indent) // 2))
+    return imports
+
+
+def check(runs: int, budget_ms: float | None, top: int) -> int:
+    """Import app ``runs`` times and report. Returns the number of failures."""
+    samples = [measure() for _ in range(runs)]
+    # The outermost import finishes, and is reported, last
+    best = min(samples, key=lambda imports: imports[-1][2])
+    total_ms = best[-1][2] / 1000
+
+    print(f"import app: {total_ms:.1f} ms (best of {runs})")
+    for name, own, cumulative, depth in sorted(best, key=lambda i: -i[2])[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {own / 1000:8.1f} ms self  {'  ' * depth}{name}")
+
+    failures = 0
+    loaded = {name for name, *_ in best}
+    for name in LAZY:
+        if name in loaded:
+            print(f"FAIL {name} is imported at startup", file=sys.stderr)
+            failures += 1
+    if budget_ms is not None and total_ms > budget_ms:
+        print(f"FAIL import app took {total_ms:.1f} ms, budget {budget_ms:.0f} ms", file=sys.stderr)
+        failures += 1
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check what importing the app costs")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to take the best of")
+    parser.add_argument("--budget-ms", type=float, help="Fail if importing app takes longer")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to print")
+    args = parser.parse_args()
+    sys.exit(1 if check(args.runs, args.budget_ms, args.top) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Query-plan regression check for the pages and API endpoints.
+
+Requests every feed filter combination (source, days, search, tags, salary,
+sort; first page, offset page and cursor page) plus the saved pages and
+stats through the Flask app, records each SELECT it runs, and EXPLAINs it.
+A statement fails the check if its plan scans a whole table or index (any
+SCAN but an FTS lookup) or sorts in a temp B-tree (ORDER BY / GROUP BY /
+DISTINCT), apart from the cases in ALLOWED.
+
+Runs against a generated database (see bench.datagen) so the planner has
+realistic statistics. Exits non-zero on any failure, so it can gate CI.
+
+Usage:
+    python -m bench.plans
+    python -m bench.plans --rows 100000 --verbose
+"""
+
+import argparse
+import itertools
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from bench import datagen
+from db import database
+
+FILTERS = {
+    "source": ["", "remoteok"],
+    "days": ["", "7"],
+    "search": ["", "data analyst"],
+    "tags": ["", "sql,power bi"],
+    "min_salary": ["", "100000"],
+    "sort": ["", "posted", "salary"],
+}
+
+# (reason, statement regex, plan regex) for plans that are fine as they
+# are. Each entry names the query it is for; an entry that no statement
+# needs any more fails the check, so it can't linger and hide a new plan.
+ALLOWED = [
+    # Unfiltered feed (no source, days, search or tags): the page is the
+    # first LIMIT + OFFSET entries of the sort's index, read in order
+    ("unfiltered feed page",
+     r"WHERE j\.canonical_id IS NULL ORDER BY j\.(scraped_ts|posted_ts) DESC, j\.id DESC LIMIT",
+     r"^SCAN j USING INDEX idx_jobs_(feed|posted)$"),
+    # The saved page (all lists) shows every saved job, most recent first
+    ("all saved jobs", r"FROM saved_jobs s JOIN job_posts j ON j\.id = s\.job_id WHERE 1=1 ORDER BY s\.saved_at DESC",
+     r"^SCAN s USING INDEX idx_saved_recent$"),
+    # Every page lists all of the user's (few) lists for the save menu
+    ("list names", r"^SELECT \* FROM lists ORDER BY name$", r"^SCAN lists USING INDEX sqlite_autoindex_lists_1$"),
+    # Feed search ordered by relevance (bm25), which only exists per match
+    ("ranked search", r"ORDER BY bm25\(", r"^USE TEMP B-TREE FOR ORDER BY$"),
+    # Feed search with sort=posted / sort=salary: the FTS index yields
+    # matches in rowid order
+    ("sorted search", r"MATCH.*ORDER BY j\.(posted_ts|salary_max_usd) DESC",
+     r"^USE TEMP B-TREE FOR ORDER BY$"),
+    # min_salary under a date order is two keys no single index serves:
+    # the planner walks the date index and filters on pay, or ranges over
+    # the salary index and sorts, whichever it estimates cheaper
+    ("salary range by date", r"salary_max_usd >= \d+.*ORDER BY j\.(scraped_ts|posted_ts) DESC",
+     r"^(USE TEMP B-TREE FOR ORDER BY|SCAN j USING INDEX idx_jobs_(feed|posted))$"),
+    # days under sort=salary, the same two keys the other way round
+    ("date range by salary", r"posted_ts >= \d+.*ORDER BY j\.salary_max_usd DESC",
+     r"^USE TEMP B-TREE FOR ORDER BY$"),
+    # Tag filters (db.tags.tag_filter) read posting lists, which are in
+    # job id order, so their matches are sorted for the page
+    ("tag posting lists", r"SELECT jt\.job_id FROM job_tags jt JOIN tags t ON t\.id = jt\.tag_id.*ORDER BY j\.",
+     r"^USE TEMP B-TREE FOR ORDER BY$"),
+    # Facets for filtered results (db.tags.facet_counts) group at most
+    # FACET_SCAN_LIMIT matches by tag
+    ("tag facets", r"GROUP BY jt\.tag_id ORDER BY n DESC", r"^USE TEMP B-TREE FOR (GROUP|ORDER) BY$"),
+    # Facets for the whole feed (db.tags.top_tags): one aggregates row per tag
+    ("tag counts", r"WHERE kind = 'tag' AND count > 0", r"^USE TEMP B-TREE FOR ORDER BY$"),
+]
+
+BAD_PLAN = re.compile(r"^SCAN (?!.*\bVIRTUAL TABLE\b)|USE TEMP B-TREE")
+
+
+def urls(lists: list[str]) -> list[str]:
+    found = []
+    for values in itertools.product(*FILTERS.values()):
+        query = "&".join(f"{k}={v}" for k, v in zip(FILTERS, values) if v).replace(" ", "+")
+        found += [f"/?{query}", f"/?{query}&page=2", f"/api/jobs?{query}"]
+    found += ["/?tags=sql,dbt,aws&tag_mode=any", "/?source=remoteok&tags=looker&tag_mode=any"]
+    found += ["/saved"] + [f"/saved/{name}" for name in lists]
+    found += ["/api/stats", "/api/jobs?fields=id,title,is_saved"]
+    return found
+
+
+def plan(conn, sql: str) -> list[str]:
+    return [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def allowed(sql: str, step: str) -> str | None:
+    sql = " ".join(sql.split())
+    for reason, sql_pattern, plan_pattern in ALLOWED:
+        if re.search(sql_pattern, sql) and re.search(plan_pattern, step):
+            return reason
+    return None
+
+
+def check(verbose: bool = False) -> int:
+    """Request every URL, EXPLAIN what it ran. Returns the number of failures."""
+    import app as appmod
+
+    client = appmod.app.test_client()
+    conn = database.get_connection()
+    statements: dict[str, str] = {}  # sql -> first URL that ran it
+
+    def trace(sql: str) -> None:
+        # FTS5 reports its own lookups on the shadow tables ('main'.'..._data') too
+        if sql.lstrip().upper().startswith(("SELECT", "WITH")) and "'main'." not in sql:
+            statements.setdefault(sql, current)
+
+    lists = [row["name"] for row in conn.execute("SELECT name FROM lists")]
+    conn.set_trace_callback(trace)
+    try:
+        for current in urls(lists):
+            appmod.response_cache.invalidate()
+            resp = client.get(current)
+            assert resp.status_code == 200, f"{current}: {resp.status_code}"
+            # Follow the cursor too, which adds a keyset predicate
+            data = resp.get_json(silent=True) or {}
+            if data.get("next_cursor"):
+                current = f"{current}&after={data['next_cursor']}"
+                client.get(current)
+    finally:
+        conn.set_trace_callback(None)
+
+    failures = 0
+    used: set[str] = set()
+    for sql, url in statements.items():
+        steps = plan(conn, sql)
+        excused = {step: allowed(sql, step) for step in steps if BAD_PLAN.search(step)}
+        used.update(reason for reason in excused.values() if reason)
+        bad = [step for step, reason in excused.items() if not reason]
+        if bad or verbose:
+            print(f"{'FAIL' if bad else 'ok  '} {url}\n  {' '.join(sql.split())[:300]}")
+            for step in steps:
+                print(f"    {'!' if step in bad else ' '} {step}")
+        failures += bool(bad)
+    conn.close()
+    print(f"{len(statements)} statements, {failures} with a full scan or temp B-tree", file=sys.stderr)
+    for reason, *_ in ALLOWED:
+        if reason not in used:
+            print(f"FAIL ALLOWED entry {reason!r} no longer matches any plan; remove it", file=sys.stderr)
+            failures += 1
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check query plans for full scans and sorts")
+    parser.add_argument("--rows", type=int, default=10_000, help="Size of the generated database")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not just failures")
+    args = parser.parse_args()
+
+    os.environ.pop("ENABLE_BG_SCRAPE", None)
+    workdir = Path(tempfile.mkdtemp(prefix="jobfeed-plans-"))
+    try:
+        path = workdir / "jobs.db"
+        shutil.copyfile(datagen.ensure(args.rows), path)
+        database.DB_PATH = path
+        database.init_db()  # Brings an older generated database up to date
+        failures = check(args.verbose)
+    finally:
+        database.reset_connection()
+        shutil.rmtree(workdir, ignore_errors=True)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
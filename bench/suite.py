@@ -0,0 +1,341 @@
+"""
+Benchmark suite: scraping against bench.fake_api, plus ingestion and page
+rendering against generated databases of each size.
+
+Cases:
+  scrape    run() on an empty DB (cold), again with nothing changed (304s),
+            and after 5% new postings (watermarks)
+  insert    insert_jobs() batches: new rows, then the same rows unchanged
+            (after checking that an in-batch cross-post keeps its tags)
+  feed      / with every combination of source, days, search and sort,
+            tag filters, the salary filter and sort,
+            the second page, and each one again from the response cache
+  saved     /saved and one list
+  api       /api/jobs (all fields, a projection, gzipped), /api/stats
+
+Results go to a JSON report (sorted, one entry per case) meant to be kept
+and diffed between releases; --compare prints the change against an
+earlier report.
+
+Usage:
+    python -m bench.suite                                # 10k and 100k rows
+    python -m bench.suite --sizes 10000 100000 1000000 --output bench.json
+    python -m bench.suite --compare old.json --output new.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from bench import datagen
+from bench.fake_api import FakeJobAPI
+from db import database
+from scrapers.base import JobPost
+
+logging.disable(logging.INFO)  # Scraper progress logs would drown the report
+
+FEED_FILTERS = {
+    "source": ["", "remoteok"],
+    "days": ["", "7"],
+    "search": ["", "data analyst"],
+    "sort": ["", "posted"],
+}
+SCRAPE_TERMS = ["data analyst", "bi engineer", "analytics engineer", "power bi"]
+
+
+def measure(fn: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> dict:
+    """Time ``fn`` ``repeat`` times (after one warm-up call)."""
+    if setup:
+        setup()
+    fn()
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+
+def _use_db(path: Path) -> None:
+    database.reset_connection()
+    database.DB_PATH = path
+
+
+# ── Scrape ───────────────────────────────────────────────────
+
+
+def bench_scrape(jobs: int, repeat: int) -> list[dict]:
+    from scrapers.registry import SCRAPERS
+    from scrapers.runner import run
+
+    results = []
+    workdir = Path(tempfile.mkdtemp(prefix="jobfeed-scrape-"))
+    try:
+        with FakeJobAPI(jobs=jobs) as api:
+            for name, cls in SCRAPERS.items():
+                cls.api_url = api.urls[name]
+
+            cold, warm, incremental = [], [], []
+            for i in range(repeat):
+                _use_db(workdir / f"scrape-{i}.db")
+                start = time.perf_counter()
+                stats = run(search_terms=SCRAPE_TERMS)
+                cold.append(((time.perf_counter() - start) * 1000, stats))
+
+                start = time.perf_counter()
+                run(search_terms=SCRAPE_TERMS)
+                warm.append(((time.perf_counter() - start) * 1000, None))
+
+                api.advance(max(1, jobs // 20))
+                start = time.perf_counter()
+                stats = run(search_terms=SCRAPE_TERMS)
+                incremental.append(((time.perf_counter() - start) * 1000, stats))
+
+            for case, samples in (("cold", cold), ("unchanged", warm), ("incremental", incremental)):
+                times = sorted(ms for ms, _ in samples)
+                result = {
+                    "bench": "scrape",
+                    "case": case,
+                    "size": jobs,
+                    "runs": repeat,
+                    "min_ms": round(times[0], 3),
+                    "median_ms": round(statistics.median(times), 3),
+                    "p95_ms": round(times[-1], 3),
+                }
+                stats = samples[0][1]
+                if stats:
+                    result["stats"] = {
+                        name: {k: v for k, v in info.items() if k not in ("status", "run_id")}
+                        for name, info in stats.items()
+                    }
+                results.append(result)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+# ── Ingestion ────────────────────────────────────────────────
+
+
+def check_cross_posts() -> None:
+    """In-batch duplicates are stored merged and both keep their tags."""
+    from db.tags import tags_for
+    from scrapers.runner import insert_jobs
+
+    pair = [
+        JobPost(
+            title="Benchmark Cross-post Analyst",
+            company="Bench Co Cross",
+            location="Remote",
+            url=f"https://bench.example/insert/cross/{i}",
+            source_platform="remoteok",
+            description="the same listing posted twice",
+            tags="sql, python",
+        )
+        for i in range(2)
+    ]
+    assert insert_jobs(pair) == (2, 0, 0, 1), "cross-post pair not merged"
+    conn = database.get_connection()
+    ids = [row[0] for row in conn.execute(
+        "SELECT id FROM job_posts WHERE url LIKE 'https://bench.example/insert/cross/%'"
+    )]
+    assert tags_for(conn, ids) == {job_id: ["sql", "python"] for job_id in ids}, "cross-post tags missing"
+    conn.close()
+
+
+def bench_insert(size: int, repeat: int, batch_size: int = 200) -> list[dict]:
+    from scrapers.runner import insert_jobs
+
+    check_cross_posts()
+    counter = itertools.count()
+
+    def batch() -> list[JobPost]:
+        run = next(counter)
+        # The last job is a cross-post of the first (same listing, another
+        # URL), so every batch also goes through the in-batch merge
+        return [
+            JobPost(
+                title=f"Benchmark Analyst {run}-{i % (batch_size - 1)}",
+                company=f"Bench Co {i % (batch_size - 1) % 37}",
+                url=f"https://bench.example/insert/{run}/{i}",
+                source_platform="remoteok",
+                description=" ".join(["benchmark description words"] * 8) + f" {run} {i % (batch_size - 1)}",
+                tags="sql, python",
+                posted_at="2026-01-01 00:00",
+            )
+            for i in range(batch_size)
+        ]
+
+    current: list[JobPost] = []
+
+    def fresh() -> None:
+        current[:] = batch()
+
+    results = [
+        {"bench": "insert", "case": f"new x{batch_size}", "size": size,
+         **measure(lambda: insert_jobs(current), repeat, setup=fresh)},
+        {"bench": "insert", "case": f"unchanged x{batch_size}", "size": size,
+         **measure(lambda: insert_jobs(current), repeat)},
+    ]
+
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM job_posts WHERE url LIKE 'https://bench.example/insert/%'")
+        database.bump_generation(conn)
+    return results
+
+
+# ── Pages ────────────────────────────────────────────────────
+
+
+def bench_pages(size: int, repeat: int) -> list[dict]:
+    import app as appmod
+
+    client = appmod.app.test_client()
+    cache = appmod.response_cache
+    results = []
+
+    def get(url: str, headers: dict | None = None) -> None:
+        resp = client.get(url, headers=headers)
+        assert resp.status_code == 200, f"{url}: {resp.status_code}"
+
+    def add(bench: str, case: str, url: str, headers: dict | None = None) -> None:
+        results.append({"bench": bench, "case": case, "size": size,
+                        **measure(lambda: get(url, headers), repeat, setup=cache.invalidate)})
+
+    for values in itertools.product(*FEED_FILTERS.values()):
+        params = "&".join(f"{k}={v}" for k, v in zip(FEED_FILTERS, values) if v)
+        case = params.replace("data analyst", "data+analyst") or "none"
+        url = "/?" + params
+        add("feed", case, url)
+        add("feed", f"{case} page=2", url + "&page=2")
+        results.append({"bench": "feed", "case": f"{case} cached", "size": size,
+                        **measure(lambda: get(url), repeat)})
+
+    add("feed", "tags=sql,python", "/?tags=sql,python")
+    add("feed", "tags=sql,dbt any", "/?tags=sql,dbt&tag_mode=any")
+    add("feed", "min_salary=100000", "/?min_salary=100000")
+    add("feed", "sort=salary", "/?sort=salary")
+    add("feed", "sort=salary page=2", "/?sort=salary&page=2")
+
+    add("saved", "all", "/saved")
+    add("saved", "list", "/saved/Applied")
+    add("api", "jobs", "/api/jobs")
+    add("api", "jobs search", "/api/jobs?search=data+analyst")
+    add("api", "jobs fields", "/api/jobs?fields=id,title,company,url,posted_ts")
+    add("api", "jobs gzip", "/api/jobs", {"Accept-Encoding": "gzip"})
+    add("api", "stats", "/api/stats")
+    return results
+
+
+# ── Report ───────────────────────────────────────────────────
+
+
+def _meta(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "sizes": args.sizes,
+        "repeat": args.repeat,
+        "scrape_jobs": args.scrape_jobs,
+    }
+
+
+def _key(result: dict) -> tuple:
+    return (result["bench"], result["size"], result["case"])
+
+
+def compare(old: dict, new: dict) -> None:
+    before = {_key(r): r for r in old["results"]}
+    print(f"\n--- {old['meta'].get('commit') or 'old'} -> {new['meta'].get('commit') or 'new'} (median) ---")
+    for result in new["results"]:
+        prev = before.get(_key(result))
+        if not prev:
+            continue
+        ratio = result["median_ms"] / prev["median_ms"] if prev["median_ms"] else float("inf")
+        flag = "  SLOWER" if ratio > 1.2 else "  faster" if ratio < 0.8 else ""
+        print(
+            f"  {result['bench']:7} {result['size']:>8} {result['case']:40} "
+            f"{prev['median_ms']:10.2f} -> {result['median_ms']:10.2f} ms  x{ratio:.2f}{flag}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scrape-jobs", type=int, default=2000, help="Listings per fake source")
+    parser.add_argument("--skip", nargs="+", default=[], choices=["scrape", "insert", "pages"])
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Earlier report to compare against")
+    args = parser.parse_args()
+
+    os.environ.pop("ENABLE_BG_SCRAPE", None)  # No scheduler thread in the app under test
+    results: list[dict] = []
+
+    if "scrape" not in args.skip:
+        print(f"scrape: {args.scrape_jobs} listings per source", file=sys.stderr)
+        results += bench_scrape(args.scrape_jobs, args.repeat)
+
+    for size in args.sizes:
+        print(f"{size} rows: preparing database", file=sys.stderr)
+        source = datagen.ensure(size)
+        # Work on a copy so insert benchmarks never touch the cached database
+        workdir = Path(tempfile.mkdtemp(prefix="jobfeed-bench-"))
+        path = workdir / source.name
+        shutil.copyfile(source, path)
+        _use_db(path)
+        database.init_db()  # Migrates databases generated by older revisions
+        try:
+            if "insert" not in args.skip:
+                results += bench_insert(size, args.repeat)
+            if "pages" not in args.skip:
+                results += bench_pages(size, args.repeat)
+        finally:
+            database.reset_connection()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results.sort(key=_key)
+    report = {"meta": _meta(args), "results": results}
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""In-process response cache invalidated by the shared data generation."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from db.database import get_connection, read_generation
+
+
+class ResponseCache:
+    """LRU + TTL cache for rendered pages and API payloads.
+
+    Entries are tagged with the data generation they were built from (see
+    ``db.database.bump_generation``). When the generation moves on, because
+    this or another worker wrote to the DB, every older entry is stale.
+
+    To keep cache hits free of DB access, the generation is re-read at most
+    every ``check_interval`` seconds. Writes made by this process call
+    ``invalidate()`` and are seen immediately; writes by another worker are
+    picked up within ``check_interval``.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300, check_interval: float = 1.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = -1
+        self._checked_at = 0.0
+
+    def _current_generation(self) -> int:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            conn = get_connection()
+            try:
+                generation = read_generation(conn)
+            finally:
+                conn.close()
+            with self._lock:
+                if generation != self._generation:
+                    self._entries.clear()
+                    self._generation = generation
+                self._checked_at = now
+        return self._generation
+
+    def generation(self) -> int:
+        """The data generation entries are currently checked against."""
+        return self._current_generation()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``build`` on a miss."""
+        generation = self._current_generation()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        # Tagged with the generation read *before* building, so a write that
+        # lands mid-build leaves this entry stale rather than wrongly fresh
+        value = build()
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop everything and re-read the generation on next access."""
+        with self._lock:
+            self._entries.clear()
+            self._checked_at = 0.0
@@ -1,21 +1,242 @@
-"""SQLite database setup and helpers for the Job Feed app."""
+"""
+SQLite database setup and helpers for the Job Feed app.
 
+Usage:
+    python -m db.database init       # Create or migrate the schema
+    python -m db.database recount    # Rebuild the aggregates table
+"""
+
+import argparse
+import os
+import re
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 DB_PATH = Path(__file__).parent / "jobs.db"
 
 
-def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
+# ── Connections ──────────────────────────────────────────────
+# Each thread keeps one open, pre-configured connection. get_connection()
+# hands it out (nesting is fine) and close() hands it back instead of
+# closing it, so requests skip connect + PRAGMA setup and reuse the
+# connection's prepared-statement cache.
+
+BUSY_TIMEOUT_MS = int(os.environ.get("DB_BUSY_TIMEOUT_MS", 10000))
+CACHED_STATEMENTS = 256
+# Every worker thread holds a connection, so the page cache is paid once per
+# thread (2 workers x 16 threads in start.sh); the mmap is shared OS cache.
+CACHE_KB = int(os.environ.get("DB_CACHE_KB", 4000))
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",  # Durable across app crashes in WAL mode
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    f"PRAGMA cache_size=-{CACHE_KB}",  # Page cache per connection, in KiB
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+)
+
+_local = threading.local()
+
+# Optional callback(sql, seconds, executed) timing statements run through
+# pooled connections; called once for execute() (executed=True) and once
+# per fetch call, since SQLite produces most rows lazily while fetching.
+QueryHook = Callable[[str, float, bool], None]
+_query_hook: QueryHook | None = None
+
+
+def set_query_hook(hook: QueryHook | None) -> None:
+    """Install (or with None, remove) the SQL timing hook."""
+    global _query_hook
+    _query_hook = hook
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that reports execute and fetch times to the query hook."""
+
+    def _report(self, start: float, executed: bool) -> None:
+        hook = _query_hook
+        if hook is not None:
+            hook(self.sql, time.perf_counter() - start, executed)
+
+    def execute(self, sql, parameters=(), /):
+        self.sql = sql
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._report(start, True)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        self.sql = sql
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._report(start, True)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            self._report(start, False)
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        try:
+            return super().fetchmany(self.arraysize if size is None else size)
+        finally:
+            self._report(start, False)
+
+    def fetchall(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            self._report(start, False)
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection whose close() returns it to its thread instead.
+
+    While a query hook is installed, statements run through timed cursors.
+    """
+
+    def close(self) -> None:
+        release_connection(self)
+
+    def execute(self, sql, parameters=(), /):
+        if _query_hook is None:
+            return super().execute(sql, parameters)
+        return self.cursor(_TimedCursor).execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        if _query_hook is None:
+            return super().executemany(sql, seq_of_parameters)
+        return self.cursor(_TimedCursor).executemany(sql, seq_of_parameters)
+
+
+def _open() -> PooledConnection:
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        factory=PooledConnection,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def get_connection() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    # Never reuse a connection across fork() or after DB_PATH changed
+    if conn is None or _local.pid != os.getpid() or _local.path != DB_PATH:
+        if conn is not None and _local.pid == os.getpid():
+            sqlite3.Connection.close(conn)
+        conn = _open()
+        _local.conn, _local.pid, _local.path, _local.depth = conn, os.getpid(), DB_PATH, 0
+    _local.depth += 1
     return conn
 
 
+def release_connection(conn: sqlite3.Connection) -> None:
+    """Give a connection back. Uncommitted work is rolled back, as on close."""
+    if conn is not getattr(_local, "conn", None):
+        sqlite3.Connection.close(conn)
+        return
+    _local.depth = max(0, _local.depth - 1)
+    if _local.depth == 0 and conn.in_transaction:
+        conn.rollback()
+
+
+def reset_connection() -> None:
+    """Roll back anything left open on this thread's connection.
+
+    Registered as a Flask teardown hook so a request that errors out before
+    closing its connection can't leak a transaction into the next one.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.pid != os.getpid():
+        return
+    _local.depth = 0
+    if conn.in_transaction:
+        conn.rollback()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Write transaction: BEGIN IMMEDIATE, then commit, or roll back on error.
+
+    Taking the write lock up front means concurrent writers wait on
+    busy_timeout instead of failing with "database is locked" mid-way.
+    """
+    conn = get_connection()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def fts_query(search: str) -> str:
+    """Turn free-text search input into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, and terms are ANDed, so
+    "power b" matches "Power BI Developer". Returns "" if there is nothing
+    to search for.
+    """
+    words = re.findall(r"\w+", search.lower())
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def bump_generation(conn: sqlite3.Connection) -> None:
+    """Mark the data as changed. Call inside the writing transaction."""
+    conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+
+
+def read_generation(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+    return row[0] if row else 0
+
+
 def init_db() -> None:
     conn = get_connection()
+    has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_posts_fts'"
+    ).fetchone()
+    has_aggregates = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'aggregates'"
+    ).fetchone()
+
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(job_posts)")}
+    needs_recount = not has_aggregates
+    if columns and "canonical_id" not in columns:
+        # Migration: cross-source dedup columns. Job counts now skip
+        # duplicates, so the old aggregate triggers are recreated below.
+        conn.executescript(
+            """
+            ALTER TABLE job_posts ADD COLUMN
+                canonical_id INTEGER REFERENCES job_posts(id) ON DELETE SET NULL;
+            ALTER TABLE job_posts ADD COLUMN fingerprint TEXT;
+            ALTER TABLE job_posts ADD COLUMN minhash BLOB;
+            DROP TRIGGER IF EXISTS aggregates_jobs_ai;
+            DROP TRIGGER IF EXISTS aggregates_jobs_ad;
+            DROP TRIGGER IF EXISTS aggregates_jobs_au;
+            """
+        )
+        needs_recount = True
     conn.executescript(
         """
         CREATE TABLE IF NOT EXISTS job_posts (
@@ -30,7 +251,11 @@ def init_db() -> None:
             description TEXT,
             tags TEXT,
             posted_at TEXT,
-            scraped_at TEXT DEFAULT (datetime('now'))
+            scraped_at TEXT DEFAULT (datetime('now')),
+            -- Cross-source dedup: duplicates point at their canonical row
+            canonical_id INTEGER REFERENCES job_posts(id) ON DELETE SET NULL,
+            fingerprint TEXT,
+            minhash BLOB
         );
 
         CREATE TABLE IF NOT EXISTS saved_jobs (
@@ -50,12 +275,484 @@ def init_db() -> None:
         -- Seed default list
         INSERT OR IGNORE INTO lists (name) VALUES ('Saved');
 
-        CREATE INDEX IF NOT EXISTS idx_jobs_source ON job_posts(source_platform);
-        CREATE INDEX IF NOT EXISTS idx_jobs_role ON job_posts(role_category);
-        CREATE INDEX IF NOT EXISTS idx_jobs_posted ON job_posts(posted_at DESC);
-        CREATE INDEX IF NOT EXISTS idx_jobs_url ON job_posts(url);
-        CREATE INDEX IF NOT EXISTS idx_saved_list ON saved_jobs(list_name);
+        -- Small key/value counters shared by all processes. "generation" is
+        -- bumped by every write that changes what the pages show, and is
+        -- how each gunicorn worker knows to drop its response cache.
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        );
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+
+        -- The feed and saved-page indexes are created by MIGRATIONS below
+        DROP INDEX IF EXISTS idx_jobs_scraped;
+
+        -- Duplicates of a cluster, for ON DELETE SET NULL and retention
+        CREATE INDEX IF NOT EXISTS idx_jobs_canonical
+            ON job_posts(canonical_id) WHERE canonical_id IS NOT NULL;
+
+        -- Expired jobs (see db/maintenance.py), moved out of job_posts so
+        -- the hot table stays small. Each archive row is one batch of jobs
+        -- as zlib-compressed JSON; job_archive_urls finds a job's batch.
+        CREATE TABLE IF NOT EXISTS job_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            archived_at TEXT DEFAULT (datetime('now')),
+            jobs INTEGER NOT NULL,
+            data BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS job_archive_urls (
+            url TEXT PRIMARY KEY,
+            archive_id INTEGER NOT NULL REFERENCES job_archive(id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+
+        -- Dedup lookups: exact fingerprint, and MinHash LSH bands of
+        -- canonical rows (see scrapers/dedup.py)
+        CREATE INDEX IF NOT EXISTS idx_jobs_fingerprint ON job_posts(fingerprint);
+        CREATE TABLE IF NOT EXISTS job_minhash_bands (
+            band INTEGER NOT NULL,
+            key INTEGER NOT NULL,
+            job_id INTEGER NOT NULL REFERENCES job_posts(id) ON DELETE CASCADE,
+            PRIMARY KEY (band, key, job_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_minhash_job ON job_minhash_bands(job_id);
+
+        -- Tag inverted index (see db/tags.py): a tag's posting list is a
+        -- primary key range, a job's tags a range on idx_job_tags_job.
+        -- Rows leave with their job through job_tags_jobs_ad.
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS job_tags (
+            tag_id INTEGER NOT NULL REFERENCES tags(id),
+            job_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,              -- Order the source listed it in
+            PRIMARY KEY (tag_id, job_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_job_tags_job ON job_tags(job_id, position);
+
+        -- Conditional GET validators for scraper requests, by URL (+ variant)
+        CREATE TABLE IF NOT EXISTS http_cache (
+            cache_key TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at TEXT
+        );
+
+        -- Newest posting date (epoch seconds) seen per source and search terms
+        CREATE TABLE IF NOT EXISTS scrape_watermarks (
+            source TEXT NOT NULL,
+            terms TEXT NOT NULL,
+            newest_posted REAL NOT NULL,
+            updated_at TEXT,
+            PRIMARY KEY (source, terms)
+        );
+
+        -- Scrape runs, queued by the scheduler or /api/scrape and executed
+        -- by whichever process holds the scheduler lease
+        CREATE TABLE IF NOT EXISTS scrape_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, done, failed
+            trigger TEXT NOT NULL,                  -- schedule or manual
+            terms TEXT,                             -- JSON list, NULL = no filter
+            sources TEXT,                           -- JSON list, NULL = all
+            requested_at TEXT DEFAULT (datetime('now')),
+            started_at TEXT,
+            finished_at TEXT,
+            stats TEXT,                             -- JSON from scrapers.runner.run()
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_scrape_runs_status ON scrape_runs(status);
+        CREATE TABLE IF NOT EXISTS scrape_source_runs (
+            run_id INTEGER NOT NULL REFERENCES scrape_runs(id) ON DELETE CASCADE,
+            source TEXT NOT NULL,
+            status TEXT NOT NULL,                   -- ok or error
+            error TEXT,
+            total_ms INTEGER,
+            fetch_ms INTEGER,                       -- Connecting + reading the body
+            parse_ms INTEGER,                       -- JSON decoding
+            filter_ms INTEGER,                      -- Search term matching
+            insert_ms INTEGER,                      -- insert_jobs()
+            bytes INTEGER,                          -- As received, before gunzip
+            fetched INTEGER,
+            skipped INTEGER,
+            inserted INTEGER,
+            updated INTEGER,
+            unchanged INTEGER,
+            merged INTEGER,
+            PRIMARY KEY (run_id, source)
+        );
+        CREATE INDEX IF NOT EXISTS idx_source_runs_source ON scrape_source_runs(source, run_id);
+        CREATE TABLE IF NOT EXISTS scrape_schedule (
+            source TEXT PRIMARY KEY,
+            next_run_at REAL NOT NULL,              -- Epoch seconds
+            failures INTEGER NOT NULL DEFAULT 0,    -- Consecutive, drives backoff
+            last_error TEXT
+        );
+        CREATE TABLE IF NOT EXISTS scheduler_lock (
+            name TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL                -- Epoch seconds
+        );
+
+        -- Change feed for live page updates (see db/events.py), appended
+        -- in the writing transaction and pruned to the newest rows
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,                     -- jobs, saved or scrape
+            data TEXT NOT NULL,                     -- JSON
+            created_at TEXT DEFAULT (datetime('now'))
+        );
+
+        -- Full-text index for the feed search box, kept in sync by triggers
+        CREATE VIRTUAL TABLE IF NOT EXISTS job_posts_fts USING fts5(
+            title, company, tags, description,
+            content='job_posts', content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS job_posts_fts_ai AFTER INSERT ON job_posts BEGIN
+            INSERT INTO job_posts_fts (rowid, title, company, tags, description)
+            VALUES (new.id, new.title, new.company, new.tags, new.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS job_posts_fts_ad AFTER DELETE ON job_posts BEGIN
+            INSERT INTO job_posts_fts (job_posts_fts, rowid, title, company, tags, description)
+            VALUES ('delete', old.id, old.title, old.company, old.tags, old.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS job_posts_fts_au AFTER UPDATE ON job_posts BEGIN
+            INSERT INTO job_posts_fts (job_posts_fts, rowid, title, company, tags, description)
+            VALUES ('delete', old.id, old.title, old.company, old.tags, old.description);
+            INSERT INTO job_posts_fts (rowid, title, company, tags, description)
+            VALUES (new.id, new.title, new.company, new.tags, new.description);
+        END;
+
+        -- Materialized counts, kept exact by triggers in the writing
+        -- transaction: ('jobs', '') total jobs, ('source', <platform>) jobs
+        -- per source, ('saved', '') total saves, ('list', <name>) per list,
+        -- ('tag', <name>) jobs per tag. Job and tag counts only include
+        -- canonical rows, matching the feed.
+        CREATE TABLE IF NOT EXISTS aggregates (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, key)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_jobs_ai AFTER INSERT ON job_posts
+        WHEN new.canonical_id IS NULL BEGIN
+            INSERT INTO aggregates (kind, key, count) VALUES ('jobs', '', 1), ('source', new.source_platform, 1)
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_jobs_ad AFTER DELETE ON job_posts
+        WHEN old.canonical_id IS NULL BEGIN
+            UPDATE aggregates SET count = count - 1
+            WHERE (kind = 'jobs' AND key = '') OR (kind = 'source' AND key = old.source_platform);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_jobs_cluster
+        AFTER UPDATE OF canonical_id ON job_posts
+        WHEN (old.canonical_id IS NULL) != (new.canonical_id IS NULL) BEGIN
+            INSERT INTO aggregates (kind, key, count)
+            VALUES ('jobs', '', IIF(new.canonical_id IS NULL, 1, -1)),
+                   ('source', new.source_platform, IIF(new.canonical_id IS NULL, 1, -1))
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_jobs_au
+        AFTER UPDATE OF source_platform ON job_posts
+        WHEN old.source_platform IS NOT new.source_platform AND new.canonical_id IS NULL BEGIN
+            UPDATE aggregates SET count = count - 1 WHERE kind = 'source' AND key = old.source_platform;
+            INSERT INTO aggregates (kind, key, count) VALUES ('source', new.source_platform, 1)
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_tags_ai AFTER INSERT ON job_tags
+        WHEN EXISTS (SELECT 1 FROM job_posts WHERE id = new.job_id AND canonical_id IS NULL) BEGIN
+            INSERT INTO aggregates (kind, key, count)
+            SELECT 'tag', name, 1 FROM tags WHERE id = new.tag_id
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_tags_ad AFTER DELETE ON job_tags
+        WHEN EXISTS (SELECT 1 FROM job_posts WHERE id = old.job_id AND canonical_id IS NULL) BEGIN
+            UPDATE aggregates SET count = count - 1
+            WHERE kind = 'tag' AND key = (SELECT name FROM tags WHERE id = old.tag_id);
+        END;
+
+        -- The job row is already gone when its tags are deleted here, so
+        -- they are uncounted first (aggregates_tags_ad no longer sees it)
+        CREATE TRIGGER IF NOT EXISTS job_tags_jobs_ad AFTER DELETE ON job_posts BEGIN
+            UPDATE aggregates SET count = count - 1
+            WHERE old.canonical_id IS NULL AND kind = 'tag' AND key IN (
+                SELECT t.name FROM job_tags jt JOIN tags t ON t.id = jt.tag_id WHERE jt.job_id = old.id
+            );
+            DELETE FROM job_tags WHERE job_id = old.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_tags_cluster
+        AFTER UPDATE OF canonical_id ON job_posts
+        WHEN (old.canonical_id IS NULL) != (new.canonical_id IS NULL) BEGIN
+            INSERT INTO aggregates (kind, key, count)
+            SELECT 'tag', t.name, IIF(new.canonical_id IS NULL, 1, -1)
+            FROM job_tags jt JOIN tags t ON t.id = jt.tag_id WHERE jt.job_id = new.id
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_saved_ai AFTER INSERT ON saved_jobs BEGIN
+            INSERT INTO aggregates (kind, key, count) VALUES ('saved', '', 1), ('list', new.list_name, 1)
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_saved_ad AFTER DELETE ON saved_jobs BEGIN
+            UPDATE aggregates SET count = count - 1
+            WHERE (kind = 'saved' AND key = '') OR (kind = 'list' AND key = old.list_name);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS aggregates_saved_au
+        AFTER UPDATE OF list_name ON saved_jobs
+        WHEN old.list_name IS NOT new.list_name BEGIN
+            UPDATE aggregates SET count = count - 1 WHERE kind = 'list' AND key = old.list_name;
+            INSERT INTO aggregates (kind, key, count) VALUES ('list', new.list_name, 1)
+            ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+        END;
         """
     )
+    if not has_fts:
+        # Migration: index rows that existed before the FTS table did
+        conn.execute("INSERT INTO job_posts_fts (job_posts_fts) VALUES ('rebuild')")
+    if needs_recount:
+        # Migration: count rows that existed before the aggregates did
+        recount(conn)
     conn.commit()
     conn.close()
+    migrate()
+
+
+# ── Migrations ───────────────────────────────────────────────
+# Schema revisions that CREATE ... IF NOT EXISTS can't express, applied in
+# order by init_db(). PRAGMA user_version holds the number applied so far:
+# append new revisions, never edit or reorder released ones.
+
+
+def _execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run several statements in the current transaction (executescript() commits)."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+def _feed_indexes(conn: sqlite3.Connection) -> None:
+    _execute_script(
+        conn,
+        """
+        -- url already has the UNIQUE constraint's index; the feed never
+        -- filters on role_category or sorts on the posted_at text
+        DROP INDEX IF EXISTS idx_jobs_url;
+        DROP INDEX IF EXISTS idx_jobs_role;
+        DROP INDEX IF EXISTS idx_jobs_posted;
+
+        -- Source filter, newest first, with or without days / cursor
+        DROP INDEX IF EXISTS idx_jobs_source;
+        CREATE INDEX idx_jobs_source_feed
+            ON job_posts(source_platform, scraped_at DESC, id DESC) WHERE canonical_id IS NULL;
+
+        -- Saved pages: one list, or all lists, most recently saved first.
+        -- Lookups by job_id use UNIQUE(job_id, list_name).
+        DROP INDEX IF EXISTS idx_saved_list;
+        CREATE INDEX idx_saved_list ON saved_jobs(list_name, saved_at DESC);
+        CREATE INDEX idx_saved_recent ON saved_jobs(saved_at DESC);
+        """,
+    )
+
+
+def _epoch_columns(conn: sqlite3.Connection) -> None:
+    # The runner's parser, so old rows read exactly like new ones
+    from scrapers.base import job_timestamps
+
+    conn.execute("ALTER TABLE job_posts ADD COLUMN posted_ts INTEGER")
+    conn.execute("ALTER TABLE job_posts ADD COLUMN scraped_ts INTEGER")
+    rows = conn.execute("SELECT id, posted_at, scraped_at FROM job_posts").fetchall()
+    conn.executemany(
+        "UPDATE job_posts SET posted_ts = ?, scraped_ts = ? WHERE id = ?",
+        [(*job_timestamps(r[1], r[2]), r[0]) for r in rows],
+    )
+    _execute_script(
+        conn,
+        """
+        -- Newest first by first-seen or by posting time, alone or within a
+        -- source; "last N days" is a range on the same keys
+        DROP INDEX IF EXISTS idx_jobs_feed;
+        CREATE INDEX idx_jobs_feed
+            ON job_posts(scraped_ts DESC, id DESC) WHERE canonical_id IS NULL;
+        DROP INDEX IF EXISTS idx_jobs_source_feed;
+        CREATE INDEX idx_jobs_source_feed
+            ON job_posts(source_platform, scraped_ts DESC, id DESC) WHERE canonical_id IS NULL;
+        CREATE INDEX idx_jobs_posted
+            ON job_posts(posted_ts DESC, id DESC) WHERE canonical_id IS NULL;
+        CREATE INDEX idx_jobs_source_posted
+            ON job_posts(source_platform, posted_ts DESC, id DESC) WHERE canonical_id IS NULL;
+        """,
+    )
+
+
+def _salary_columns(conn: sqlite3.Connection) -> None:
+    from scrapers.salary import salary_columns
+
+    for column in ("salary_min_usd INTEGER", "salary_max_usd INTEGER",
+                   "salary_currency TEXT", "salary_period TEXT"):
+        conn.execute(f"ALTER TABLE job_posts ADD COLUMN {column}")
+    rows = conn.execute("SELECT id, salary FROM job_posts WHERE salary != ''").fetchall()
+    conn.executemany(
+        """
+        UPDATE job_posts SET salary_min_usd = ?, salary_max_usd = ?,
+            salary_currency = ?, salary_period = ?
+        WHERE id = ?
+        """,
+        [(*salary_columns(r[1]), r[0]) for r in rows],
+    )
+    _execute_script(
+        conn,
+        """
+        -- Best paid first, alone or within a source, and "pays at least X"
+        -- as a range on the same key; jobs without a readable salary are
+        -- left out of the index
+        CREATE INDEX idx_jobs_salary
+            ON job_posts(salary_max_usd DESC, id DESC)
+            WHERE canonical_id IS NULL AND salary_max_usd IS NOT NULL;
+        CREATE INDEX idx_jobs_source_salary
+            ON job_posts(source_platform, salary_max_usd DESC, id DESC)
+            WHERE canonical_id IS NULL AND salary_max_usd IS NOT NULL;
+        """,
+    )
+
+
+def _job_tags(conn: sqlite3.Connection) -> None:
+    from db.tags import normalize_tags, set_tags
+
+    rows = conn.execute("SELECT id, tags FROM job_posts WHERE tags != ''").fetchall()
+    set_tags(conn, {r[0]: normalize_tags(r[1]) for r in rows})
+    recount(conn)
+
+
+def _scrape_run_owner(conn: sqlite3.Connection) -> None:
+    # The scheduler that claimed a run; NULL for runs started outside it
+    conn.execute("ALTER TABLE scrape_runs ADD COLUMN owner TEXT")
+
+
+MIGRATIONS: list[tuple[str, Callable[[sqlite3.Connection], None]]] = [
+    ("Composite indexes for the feed and saved pages", _feed_indexes),
+    ("Epoch posted_ts / scraped_ts columns and their feed indexes", _epoch_columns),
+    ("Annual USD salary columns and the salary index", _salary_columns),
+    ("Tag inverted index for existing jobs", _job_tags),
+    ("Owner of each scrape run", _scrape_run_owner),
+]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate() -> list[str]:
+    """Apply pending MIGRATIONS, each in its own transaction. Returns their names.
+
+    Safe to run from several processes at once: the version is re-read
+    under the write lock, so each revision is applied exactly once.
+    """
+    conn = get_connection()
+    try:
+        if schema_version(conn) >= len(MIGRATIONS):
+            return []
+    finally:
+        conn.close()
+
+    applied = []
+    for number, (name, step) in enumerate(MIGRATIONS, start=1):
+        with transaction() as conn:
+            if schema_version(conn) >= number:
+                continue
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+        applied.append(name)
+    return applied
+
+
+def recount(conn: sqlite3.Connection) -> None:
+    """Rebuild the aggregates table from scratch. Call inside a transaction."""
+    conn.execute("DELETE FROM aggregates")
+    conn.execute(
+        """
+        INSERT INTO aggregates (kind, key, count)
+        SELECT 'jobs', '', COUNT(*) FROM job_posts WHERE canonical_id IS NULL
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO aggregates (kind, key, count)
+        SELECT 'source', source_platform, COUNT(*) FROM job_posts
+        WHERE canonical_id IS NULL GROUP BY source_platform
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO aggregates (kind, key, count)
+        SELECT 'tag', t.name, COUNT(*) FROM job_tags jt
+        JOIN tags t ON t.id = jt.tag_id
+        JOIN job_posts j ON j.id = jt.job_id
+        WHERE j.canonical_id IS NULL GROUP BY jt.tag_id
+        """
+    )
+    conn.execute(
+        "INSERT INTO aggregates (kind, key, count) SELECT 'saved', '', COUNT(*) FROM saved_jobs"
+    )
+    conn.execute(
+        """
+        INSERT INTO aggregates (kind, key, count)
+        SELECT 'list', list_name, COUNT(*) FROM saved_jobs GROUP BY list_name
+        """
+    )
+
+
+def get_count(conn: sqlite3.Connection, kind: str, key: str = "") -> int:
+    """O(1) lookup of a single materialized count."""
+    row = conn.execute(
+        "SELECT count FROM aggregates WHERE kind = ? AND key = ?", (kind, key)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def get_counts(conn: sqlite3.Connection, kind: str) -> dict[str, int]:
+    """All non-zero materialized counts of one kind, e.g. jobs per source."""
+    rows = conn.execute(
+        "SELECT key, count FROM aggregates WHERE kind = ? AND count > 0 ORDER BY key", (kind,)
+    ).fetchall()
+    return {r[0]: r[1] for r in rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Job Feed database maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("init", help="Create or migrate the schema")
+    sub.add_parser("recount", help="Rebuild the materialized aggregates table")
+    args = parser.parse_args()
+
+    init_db()
+    if args.command == "init":
+        conn = get_connection()
+        print(f"  schema version {schema_version(conn)} of {len(MIGRATIONS)}")
+        conn.close()
+    if args.command == "recount":
+        with transaction() as conn:
+            recount(conn)
+        conn = get_connection()
+        for kind in ("jobs", "source", "saved", "list"):
+            print(f"  {kind}: {get_counts(conn, kind)}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
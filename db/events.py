@@ -0,0 +1,171 @@
+"""
+Change events for live page updates.
+
+Writers call publish() inside their transaction, so an event shows up in
+every worker exactly when the change it describes commits. Each worker
+has one EventBroker: while anybody is subscribed, a thread polls the
+events table and fans new rows out to the subscribers' queues, so open
+streams cost one small query per POLL_INTERVAL per worker, not per client.
+
+Event kinds:
+  jobs     {"ids": [...], "count": n}    new jobs visible in the feed
+  saved    {"list_name", "saved", "jobs": [{"id", "is_saved"}]}
+  scrape   {"run_id", "status", "error", "inserted"}
+  reset    {}   the subscriber missed events; reload to catch up
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from db.database import get_connection
+
+EVENTS_KEEP = 1000  # Rows kept for clients resuming with Last-Event-ID
+MAX_JOB_IDS = 100  # Ids listed in one "jobs" event; "count" has the total
+MAX_STREAMS = int(os.environ.get("SSE_MAX_STREAMS", 8))  # Per worker
+POLL_INTERVAL = float(os.environ.get("SSE_POLL_SECONDS", 1.0))
+QUEUE_SIZE = 256
+
+
+class Event(NamedTuple):
+    id: int
+    kind: str
+    data: str  # JSON
+
+
+def publish(conn: sqlite3.Connection, kind: str, data: dict) -> int:
+    """Append an event. Call inside the writing transaction."""
+    event_id = conn.execute(
+        "INSERT INTO events (kind, data) VALUES (?, ?)", (kind, json.dumps(data))
+    ).lastrowid
+    if event_id % 100 == 0:
+        conn.execute("DELETE FROM events WHERE id <= ?", (event_id - EVENTS_KEEP,))
+    return event_id
+
+
+def publish_jobs(conn: sqlite3.Connection, job_ids: list[int]) -> None:
+    if job_ids:
+        publish(conn, "jobs", {"ids": job_ids[:MAX_JOB_IDS], "count": len(job_ids)})
+
+
+def last_event_id(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+
+def read_events(conn: sqlite3.Connection, after: int, limit: int = QUEUE_SIZE) -> list[Event]:
+    rows = conn.execute(
+        "SELECT id, kind, data FROM events WHERE id > ? ORDER BY id LIMIT ?", (after, limit)
+    ).fetchall()
+    return [Event(*row) for row in rows]
+
+
+class Subscription:
+    """One client's view of the event stream."""
+
+    def __init__(self, after: int) -> None:
+        self.last_id = after
+        self.overflowed = False
+        self._queue: queue.Queue[Event] = queue.Queue(QUEUE_SIZE)
+
+    def put(self, event: Event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # A client this far behind is better off reconnecting
+            self.overflowed = True
+
+    def get(self, timeout: float) -> Event | None:
+        """Next event, or None if nothing arrived within ``timeout``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.overflowed:
+                return Event(self.last_id, "reset", "{}")
+            try:
+                event = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return None
+            # The backlog and the broker can both deliver an event
+            if event.id > self.last_id:
+                self.last_id = event.id
+                return event
+
+
+class EventBroker:
+    """Polls the events table for this worker while anybody is subscribed."""
+
+    def __init__(self, max_streams: int = MAX_STREAMS, poll_interval: float = POLL_INTERVAL) -> None:
+        self.max_streams = max_streams
+        self.poll_interval = poll_interval
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._last_id = 0  # Newest event the poller has delivered
+
+    def subscribe(self, after: int | None = None) -> Subscription | None:
+        """Start a subscription, replaying events after ``after`` if given.
+
+        Returns None when this worker already has ``max_streams`` open.
+        """
+        conn = get_connection()
+        try:
+            with self._lock:
+                if len(self._subscribers) >= self.max_streams:
+                    return None
+                # The poller delivers everything after its cursor to every
+                # subscriber registered by then; a new one starts there
+                if self._thread is None:
+                    self._last_id = last_event_id(conn)
+                current = self._last_id
+                sub = Subscription(current if after is None else min(after, current))
+                # Queued before registering, so the replay precedes (and
+                # never overlaps) what the poller delivers next
+                if after is not None and after < current:
+                    backlog = read_events(conn, after, QUEUE_SIZE + 1)
+                    if len(backlog) > QUEUE_SIZE or (backlog and backlog[0].id > after + 1):
+                        sub.overflowed = True  # Too far behind, or the gap was pruned
+                    for event in backlog[:QUEUE_SIZE]:
+                        if event.id <= current:
+                            sub.put(event)
+                self._subscribers.add(sub)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+            return sub
+        finally:
+            conn.close()
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def streams(self) -> int:
+        return len(self._subscribers)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+                last_id = self._last_id
+            conn = get_connection()
+            try:
+                events = read_events(conn, last_id)
+            except sqlite3.Error:
+                events = []
+            finally:
+                conn.close()
+            if not events:
+                continue
+            with self._lock:
+                self._last_id = events[-1].id
+                subscribers = list(self._subscribers)
+            for sub in subscribers:
+                for event in events:
+                    sub.put(event)
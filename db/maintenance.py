@@ -0,0 +1,227 @@
+"""
+Retention and housekeeping for the jobs database.
+
+Jobs first scraped more than RETENTION_DAYS ago are moved out of job_posts
+into job_archive, in zlib-compressed JSON batches, so the hot table
+(and its indexes and FTS index) stays small enough to live in the page
+cache. A job that is saved, or belongs to a duplicate cluster with a saved
+member, is never expired; duplicates leave together with their canonical
+row. The delete triggers keep the FTS index and aggregates in step, and
+archived URLs are not re-inserted by later scrapes.
+
+After expiry, maintain() merges FTS segments, refreshes planner statistics
+(PRAGMA optimize), VACUUMs when enough of the file is free pages, and
+truncates the WAL. The scheduler leader runs it every
+MAINTENANCE_INTERVAL_HOURS.
+
+Usage:
+    python -m db.maintenance                 # Expire, optimize, checkpoint
+    python -m db.maintenance --days 30 --vacuum
+    python -m db.maintenance --dry-run       # Count what would expire
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+
+from db.database import bump_generation, get_connection, init_db, transaction
+
+logger = logging.getLogger(__name__)
+
+RETENTION_DAYS = int(os.environ.get("JOB_RETENTION_DAYS", 90))  # 0 keeps everything
+MAINTENANCE_INTERVAL = float(os.environ.get("MAINTENANCE_INTERVAL_HOURS", 24)) * 3600
+VACUUM_FREE_RATIO = 0.2  # VACUUM once this share of pages is on the freelist
+BATCH_SIZE = 500  # Clusters per write transaction, to keep the write lock short
+
+# Columns kept in the archive blob; the dedup keys are derived data
+ARCHIVED_COLUMNS = (
+    "id", "title", "company", "location", "role_category", "source_platform", "url",
+    "salary", "description", "tags", "posted_at", "scraped_at", "posted_ts", "scraped_ts",
+    "canonical_id",
+)
+
+
+# ── Retention ────────────────────────────────────────────────
+
+
+def _expired_clusters(conn: sqlite3.Connection, cutoff: int, limit: int) -> list[int]:
+    """Ids of canonical rows older than ``cutoff`` with no saved cluster member."""
+    rows = conn.execute(
+        """
+        SELECT j.id FROM job_posts j
+        WHERE j.canonical_id IS NULL AND j.scraped_ts < ?
+          AND NOT EXISTS (SELECT 1 FROM saved_jobs s WHERE s.job_id = j.id)
+          AND NOT EXISTS (
+              SELECT 1 FROM job_posts d JOIN saved_jobs s ON s.job_id = d.id
+              WHERE d.canonical_id = j.id
+          )
+        LIMIT ?
+        """,
+        (cutoff, limit),
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def archive_jobs(conn: sqlite3.Connection, canonical_ids: list[int]) -> int:
+    """Move clusters into one job_archive batch. Call inside a transaction.
+
+    Returns the number of rows moved, duplicates included.
+    """
+    if not canonical_ids:
+        return 0
+    marks = ",".join("?" * len(canonical_ids))
+    rows = conn.execute(
+        f"""
+        SELECT {", ".join(ARCHIVED_COLUMNS)} FROM job_posts
+        WHERE id IN ({marks}) OR canonical_id IN ({marks})
+        """,
+        canonical_ids + canonical_ids,
+    ).fetchall()
+
+    # Compressed as one batch: similar postings compress far better together
+    data = zlib.compress(json.dumps([dict(r) for r in rows]).encode(), 6)
+    archive_id = conn.execute(
+        "INSERT INTO job_archive (jobs, data) VALUES (?, ?)", (len(rows), data)
+    ).lastrowid
+    conn.executemany(
+        "INSERT OR REPLACE INTO job_archive_urls (url, archive_id) VALUES (?, ?)",
+        [(r["url"], archive_id) for r in rows],
+    )
+    # Duplicates first: deleting a canonical row would otherwise promote
+    # them into the feed (ON DELETE SET NULL)
+    conn.execute(f"DELETE FROM job_posts WHERE canonical_id IN ({marks})", canonical_ids)
+    conn.execute(f"DELETE FROM job_posts WHERE id IN ({marks})", canonical_ids)
+    return len(rows)
+
+
+def expire_jobs(days: int = RETENTION_DAYS, batch_size: int = BATCH_SIZE, dry_run: bool = False) -> int:
+    """Archive jobs first scraped more than ``days`` ago. Returns rows moved."""
+    if days <= 0:
+        return 0
+    cutoff = int(time.time()) - days * 86400
+
+    if dry_run:
+        conn = get_connection()
+        try:
+            return len(_expired_clusters(conn, cutoff, -1))
+        finally:
+            conn.close()
+
+    moved = 0
+    while True:
+        with transaction() as conn:
+            ids = _expired_clusters(conn, cutoff, batch_size)
+            moved += archive_jobs(conn, ids)
+            if ids:
+                bump_generation(conn)
+        if len(ids) < batch_size:
+            return moved
+
+
+def read_archived(conn: sqlite3.Connection, url: str) -> dict | None:
+    """The archived row for ``url``, or None."""
+    row = conn.execute(
+        """
+        SELECT a.data FROM job_archive_urls u JOIN job_archive a ON a.id = u.archive_id
+        WHERE u.url = ?
+        """,
+        (url,),
+    ).fetchone()
+    if row is None:
+        return None
+    return next((job for job in json.loads(zlib.decompress(row[0])) if job["url"] == url), None)
+
+
+# ── Housekeeping ─────────────────────────────────────────────
+
+
+def _pragma(conn: sqlite3.Connection, name: str) -> int:
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def optimize(vacuum: bool | None = None) -> dict:
+    """Merge FTS segments, refresh statistics, VACUUM if needed, checkpoint.
+
+    ``vacuum`` forces (True) or skips (False) the VACUUM; by default it runs
+    when at least VACUUM_FREE_RATIO of the file is free pages.
+    """
+    conn = get_connection()
+    try:
+        with transaction() as tx:
+            tx.execute("INSERT INTO job_posts_fts (job_posts_fts) VALUES ('optimize')")
+
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        # PRAGMA optimize skips tables that were never analyzed
+        conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+        conn.commit()
+
+        pages, free = _pragma(conn, "page_count"), _pragma(conn, "freelist_count")
+        if vacuum is None:
+            vacuum = pages > 0 and free / pages >= VACUUM_FREE_RATIO
+        if vacuum:
+            conn.execute("VACUUM")
+
+        busy, wal_pages, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        page_size = _pragma(conn, "page_size")
+        return {
+            "vacuumed": vacuum,
+            "free_pages_before": free,
+            "size_mb": round(_pragma(conn, "page_count") * page_size / 1e6, 1),
+            "checkpoint": "busy" if busy else f"{wal_pages} WAL pages",
+        }
+    finally:
+        conn.close()
+
+
+def maintenance_due(now: float | None = None) -> bool:
+    conn = get_connection()
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'maintained_at'").fetchone()
+    finally:
+        conn.close()
+    return not row or (now or time.time()) - row[0] >= MAINTENANCE_INTERVAL
+
+
+def maintain(days: int = RETENTION_DAYS, vacuum: bool | None = None) -> dict:
+    """Expire old jobs, then tidy up the database file. Returns a summary."""
+    started = time.monotonic()
+    archived = expire_jobs(days)
+    stats = {"archived": archived, **optimize(vacuum)}
+    stats["seconds"] = round(time.monotonic() - started, 2)
+    with transaction() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('maintained_at', ?)", (int(time.time()),)
+        )
+    logger.info(f"Maintenance: {stats}")
+    return stats
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Expire old jobs and compact the database")
+    parser.add_argument("--days", type=int, default=RETENTION_DAYS, help="Retention in days (0 = keep all)")
+    vacuum = parser.add_mutually_exclusive_group()
+    vacuum.add_argument("--vacuum", action="store_const", const=True, help="Always VACUUM")
+    vacuum.add_argument("--no-vacuum", dest="vacuum", action="store_const", const=False)
+    parser.add_argument("--dry-run", action="store_true", help="Only count the clusters that would expire")
+    args = parser.parse_args()
+
+    init_db()
+    if args.dry_run:
+        print(f"  {expire_jobs(args.days, dry_run=True)} job clusters older than {args.days} days")
+        return
+    for key, value in maintain(args.days, args.vacuum).items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
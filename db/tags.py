@@ -0,0 +1,105 @@
+"""
+Normalized job tags: the tags / job_tags inverted index.
+
+Sources send tags as free-form comma lists ("SQL, Python ,sql"). They are
+stored lowercased and deduplicated, one job_tags row per (tag, job): the
+primary key makes each tag's posting list an index range, so tag filters
+are exact indexed lookups rather than substring scans of job_posts.tags.
+Triggers keep the number of feed jobs per tag in aggregates (kind 'tag')
+for the facet sidebar.
+"""
+
+import sqlite3
+
+MAX_TAG_LENGTH = 50
+MAX_FILTER_TAGS = 5  # Tags one feed filter can combine
+FACET_SCAN_LIMIT = 5000  # Larger result sets show the overall tag counts
+
+
+def normalize_tags(text: str | None) -> list[str]:
+    """Lowercased, deduplicated tags from a comma-separated string, in order."""
+    tags = (" ".join(tag.split()).lower()[:MAX_TAG_LENGTH] for tag in (text or "").split(","))
+    return list(dict.fromkeys(tag for tag in tags if tag))
+
+
+def set_tags(conn: sqlite3.Connection, tags_by_job: dict[int, list[str]]) -> None:
+    """Replace the tags of each job. Call inside a transaction."""
+    if not tags_by_job:
+        return
+    conn.executemany("DELETE FROM job_tags WHERE job_id = ?", [(job_id,) for job_id in tags_by_job])
+
+    names = list(dict.fromkeys(name for tags in tags_by_job.values() for name in tags))
+    conn.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(name,) for name in names])
+    ids: dict[str, int] = {}
+    for i in range(0, len(names), 500):
+        chunk = names[i:i + 500]
+        rows = conn.execute(
+            f"SELECT id, name FROM tags WHERE name IN ({','.join('?' * len(chunk))})", chunk
+        ).fetchall()
+        ids.update({r[1]: r[0] for r in rows})
+
+    conn.executemany(
+        "INSERT INTO job_tags (tag_id, job_id, position) VALUES (?, ?, ?)",
+        [
+            (ids[name], job_id, position)
+            for job_id, tags in tags_by_job.items()
+            for position, name in enumerate(tags)
+        ],
+    )
+
+
+def tags_for(conn: sqlite3.Connection, job_ids: list[int]) -> dict[int, list[str]]:
+    """Tags of each job, in the order the source listed them."""
+    found: dict[int, list[str]] = {}
+    for i in range(0, len(job_ids), 500):
+        chunk = job_ids[i:i + 500]
+        rows = conn.execute(
+            f"""
+            SELECT jt.job_id, t.name FROM job_tags jt JOIN tags t ON t.id = jt.tag_id
+            WHERE jt.job_id IN ({','.join('?' * len(chunk))})
+            ORDER BY jt.job_id, jt.position
+            """,
+            chunk,
+        ).fetchall()
+        for job_id, name in rows:
+            found.setdefault(job_id, []).append(name)
+    return found
+
+
+def tag_filter(tags: list[str], match_any: bool = False) -> tuple[list[str], list]:
+    """WHERE clauses (on job_posts j) and params for jobs tagged with ``tags``.
+
+    All of the tags by default, one subquery per tag so the planner can
+    start from the shortest posting list; any of them with ``match_any``.
+    """
+    lookup = "SELECT jt.job_id FROM job_tags jt JOIN tags t ON t.id = jt.tag_id WHERE t.name"
+    if match_any:
+        return [f"j.id IN ({lookup} IN ({','.join('?' * len(tags))}))"], list(tags)
+    return [f"j.id IN ({lookup} = ?)" for _ in tags], list(tags)
+
+
+def top_tags(conn: sqlite3.Connection, limit: int) -> list[tuple[str, int]]:
+    """The most common tags among all feed jobs, from the maintained counts."""
+    rows = conn.execute(
+        """
+        SELECT key, count FROM aggregates WHERE kind = 'tag' AND count > 0
+        ORDER BY count DESC, key LIMIT ?
+        """,
+        (limit,),
+    ).fetchall()
+    return [(r[0], r[1]) for r in rows]
+
+
+def facet_counts(
+    conn: sqlite3.Connection, join_sql: str, where_sql: str, params: list, limit: int
+) -> list[tuple[str, int]]:
+    """The most common tags among the feed jobs matching a filter."""
+    rows = conn.execute(
+        f"""
+        SELECT t.name, COUNT(*) AS n FROM job_tags jt JOIN tags t ON t.id = jt.tag_id
+        WHERE jt.job_id IN (SELECT j.id FROM job_posts j {join_sql} WHERE {where_sql})
+        GROUP BY jt.tag_id ORDER BY n DESC, t.name LIMIT ?
+        """,
+        params + [limit],
+    ).fetchall()
+    return [(r[0], r[1]) for r in rows]
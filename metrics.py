@@ -0,0 +1,294 @@
+"""
+Request metrics and profiling for the Flask app.
+
+init_app() records, per worker process:
+  - request latency histograms by route, method and status
+  - SQL time per statement (through the db.database query hook) and per request
+  - template render time
+  - response cache hits and misses
+and serves them at /metrics in Prometheus text format. Every sample carries
+a ``worker`` label (the pid), since each gunicorn worker keeps its own.
+
+Profiling is opt-in. With PROFILE_SAMPLE_RATE > 0 that fraction of requests
+runs under cProfile, and those slower than PROFILE_SLOW_MS are dumped as
+.prof files (plus a pstats summary in the log) to PROFILE_DIR. Adding
+``?__profile=1`` to a URL profiles that request and returns the pstats
+report instead of the page; it only works when profiling is enabled or in
+debug mode.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+from pathlib import Path
+
+from flask import Flask, Response, before_render_template, g, has_request_context, request, template_rendered
+
+from db.database import set_query_hook
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+PROFILE_SLOW_MS = float(os.environ.get("PROFILE_SLOW_MS", 500))
+PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", "/tmp/jobfeed-profiles"))
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_STATEMENTS = 200  # Distinct SQL statements tracked; the rest count as "other"
+
+
+# ── Metric Types ─────────────────────────────────────────────
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    pairs = [f'{n}="{escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        self.name, self.help, self.label_names = name, help, ("worker",) + labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        key = (os.getpid(),) + labels
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in self._values.items():
+                lines.append(f"{self.name}{_labels(self.label_names, key)} {value:g}")
+        return lines
+
+
+class Sampled:
+    """Counter or gauge whose value is read by a callback at scrape time."""
+
+    def __init__(self, name: str, help: str, read, kind: str = "gauge") -> None:
+        self.name, self.help, self.read, self.kind = name, help, read, kind
+
+    def render(self) -> list[str]:
+        value = self.read()
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+            f"{self.name}{_labels(('worker',), (os.getpid(),))} {value:g}",
+        ]
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name, self.help, self.label_names = name, help, ("worker",) + labels
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        key = (os.getpid(),) + labels
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in self._series.items():
+                for bound, count in zip(self.buckets, series):
+                    le = _labels(self.label_names, key, f'le="{bound:g}"')
+                    lines.append(f"{self.name}_bucket{le} {count}")
+                inf = _labels(self.label_names, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{inf} {series[-1]}")
+                lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {series[-2]:g}")
+                lines.append(f"{self.name}_count{_labels(self.label_names, key)} {series[-1]}")
+        return lines
+
+
+# ── Registry ─────────────────────────────────────────────────
+
+REQUEST_SECONDS = Histogram(
+    "jobfeed_request_seconds", "Request latency", ("route", "method", "status")
+)
+REQUEST_SQL_SECONDS = Histogram(
+    "jobfeed_request_sql_seconds", "Time spent in SQL per request", ("route",)
+)
+TEMPLATE_SECONDS = Histogram(
+    "jobfeed_template_render_seconds", "Template render time", ("template",)
+)
+SQL_SECONDS = Counter(
+    "jobfeed_sql_seconds_total", "Time spent executing and fetching, by statement", ("statement",)
+)
+SQL_CALLS = Counter(
+    "jobfeed_sql_statements_total", "Statements executed, by statement", ("statement",)
+)
+PROFILES = Counter("jobfeed_profiles_total", "Requests profiled, by outcome", ("outcome",))
+
+_registry: list = [REQUEST_SECONDS, REQUEST_SQL_SECONDS, TEMPLATE_SECONDS, SQL_SECONDS, SQL_CALLS, PROFILES]
+
+_statements: dict[str, str] = {}
+_statements_lock = threading.Lock()
+
+
+def render() -> str:
+    lines: list[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _statement_label(sql: str) -> str:
+    """Whitespace-collapsed statement text, capped at MAX_STATEMENTS labels."""
+    label = _statements.get(sql)
+    if label is None:
+        with _statements_lock:
+            if len(_statements) < MAX_STATEMENTS:
+                label = _statements[sql] = " ".join(sql.split())[:200]
+            else:
+                label = "other"
+    return label
+
+
+def _on_query(sql: str, seconds: float, executed: bool) -> None:
+    label = _statement_label(sql)
+    SQL_SECONDS.inc(label, amount=seconds)
+    if executed:
+        SQL_CALLS.inc(label)
+    if has_request_context() and "metrics_sql" in g:
+        g.metrics_sql += seconds
+
+
+# ── Flask Hooks ──────────────────────────────────────────────
+
+_profiler_lock = threading.Lock()  # cProfile can only run one profiler at a time
+
+
+def _route() -> str:
+    return request.url_rule.rule if request.url_rule else "unmatched"
+
+
+def _start_profile(forced: bool) -> None:
+    if not (forced or (PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE)):
+        return
+    if not _profiler_lock.acquire(blocking=False):
+        PROFILES.inc("busy")
+        return
+    g.metrics_profiler = cProfile.Profile()
+    g.metrics_profiler.enable()
+
+
+def _stop_profile() -> cProfile.Profile | None:
+    profiler = g.pop("metrics_profiler", None)
+    if profiler is not None:
+        profiler.disable()
+        _profiler_lock.release()
+    return profiler
+
+
+def _report(profiler: cProfile.Profile, limit: int = 40) -> str:
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+def _dump_profile(profiler: cProfile.Profile, elapsed: float) -> None:
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.endpoint or 'unmatched'}-{round(elapsed * 1000)}ms.prof"
+    profiler.dump_stats(PROFILE_DIR / name)
+    logger.warning(
+        f"Slow request {request.method} {request.full_path} took {elapsed * 1000:.0f}ms; "
+        f"profile saved to {PROFILE_DIR / name}\n{_report(profiler, limit=15)}"
+    )
+
+
+def init_app(app: Flask, cache=None) -> None:
+    """Install the metrics hooks on ``app`` and add the /metrics route.
+
+    ``cache`` is the app's ResponseCache; its hit ratio is exported too.
+    """
+    set_query_hook(_on_query)
+
+    if cache is not None:
+        _registry.extend([
+            Sampled("jobfeed_response_cache_hits_total", "Response cache hits", lambda: cache.hits, "counter"),
+            Sampled("jobfeed_response_cache_misses_total", "Response cache misses", lambda: cache.misses, "counter"),
+            Sampled(
+                "jobfeed_response_cache_hit_ratio",
+                "Response cache hits / lookups since start",
+                lambda: cache.hits / ((cache.hits + cache.misses) or 1),
+            ),
+        ])
+
+    @app.before_request
+    def _before() -> None:
+        g.metrics_start = time.perf_counter()
+        g.metrics_sql = 0.0
+        forced = request.args.get("__profile") == "1" and (PROFILE_SAMPLE_RATE > 0 or app.debug)
+        g.metrics_forced = forced
+        _start_profile(forced)
+
+    @app.after_request
+    def _after(response: Response) -> Response:
+        if "metrics_start" not in g:
+            return response
+        elapsed = time.perf_counter() - g.pop("metrics_start")
+        REQUEST_SECONDS.observe(elapsed, _route(), request.method, response.status_code)
+        REQUEST_SQL_SECONDS.observe(g.pop("metrics_sql", 0.0), _route())
+
+        profiler = _stop_profile()
+        if profiler is None:
+            return response
+        if g.get("metrics_forced"):
+            PROFILES.inc("requested")
+            return Response(_report(profiler), mimetype="text/plain")
+        if elapsed * 1000 >= PROFILE_SLOW_MS:
+            PROFILES.inc("dumped")
+            _dump_profile(profiler, elapsed)
+        else:
+            PROFILES.inc("fast")
+        return response
+
+    @app.teardown_request
+    def _teardown(exc) -> None:
+        # after_request is skipped when a view raises
+        _stop_profile()
+        if "metrics_start" in g:
+            elapsed = time.perf_counter() - g.pop("metrics_start")
+            REQUEST_SECONDS.observe(elapsed, _route(), request.method, 500)
+
+    def _template_started(sender, template, context, **extra) -> None:
+        g.setdefault("metrics_templates", []).append(time.perf_counter())
+
+    def _template_done(sender, template, context, **extra) -> None:
+        starts = g.get("metrics_templates")
+        if starts:
+            TEMPLATE_SECONDS.observe(time.perf_counter() - starts.pop(), template.name or "string")
+
+    before_render_template.connect(_template_started, app, weak=False)
+    template_rendered.connect(_template_done, app, weak=False)
+
+    @app.route("/metrics")
+    def metrics() -> Response:
+        return Response(render(), mimetype="text/plain; version=0.0.4")
@@ -1,82 +1,116 @@
 """Scraper for Arbeitnow.com free API."""
 
-import json
 import logging
-import urllib.request
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
-from scrapers.base import BaseScraper, JobPost
+from scrapers.base import BaseScraper, JobPost, TimedMatcher
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://www.arbeitnow.com/api/job-board-api"
+# Override with ARBEITNOW_API_URL, e.g. to point at bench.fake_api
+API_URL = os.environ.get("ARBEITNOW_API_URL", "https://www.arbeitnow.com/api/job-board-api")
 
 
 class ArbeitnowScraper(BaseScraper):
     name = "arbeitnow"
-
-    def fetch_jobs(self, search_terms: list[str] | None = None) -> list[JobPost]:
+    api_url = API_URL
+    max_pages = 3  # Limit to avoid hammering the API
+
+    def _parse_item(self, item: dict, matcher: TimedMatcher | None) -> JobPost | None:
+        title = item.get("title", "").strip()
+        company = item.get("company_name", "").strip()
+        job_url = item.get("url", "")
+        if not job_url or not title:
+            return None
+
+        tags_list = item.get("tags", [])
+        tags_str = ", ".join(tags_list) if isinstance(tags_list, list) else str(tags_list)
+
+        # Filter by search terms
+        if matcher and not matcher.matches(title, tags_str, company):
+            return None
+
+        location = item.get("location", "Remote") or "Remote"
+        remote = item.get("remote", False)
+        if remote:
+            location = f"{location} (Remote)" if location != "Remote" else "Remote"
+
+        posted = item.get("created_at", "")
+
+        return JobPost(
+            title=title,
+            company=company,
+            url=job_url,
+            source_platform=self.name,
+            location=location,
+            salary="",
+            description=item.get("description", "")[:500],
+            tags=tags_str,
+            posted_at=str(posted),
+        )
+
+    def _fetch_page(self, page: int, search_terms: list[str] | None) -> tuple[list[JobPost], bool]:
+        """Stream one page. Returns (jobs, whether to go on to the next page)."""
         jobs: list[JobPost] = []
-        page = 1
-        max_pages = 3  # Limit to avoid hammering the API
-
-        while page <= max_pages:
-            url = f"{API_URL}?page={page}"
-            try:
-                req = urllib.request.Request(
-                    url,
-                    headers={"User-Agent": "JobFeedApp/1.0"},
-                )
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    data = json.loads(resp.read().decode())
-            except Exception as e:
-                logger.error(f"Arbeitnow fetch page {page} failed: {e}")
-                break
-
-            items = data.get("data", [])
-            if not items:
-                break
-
-            for item in items:
-                title = item.get("title", "").strip()
-                company = item.get("company_name", "").strip()
-                job_url = item.get("url", "")
-                if not job_url or not title:
+        extras: dict = {}
+        items = 0
+        reached_watermark = False
+        url = f"{self.api_url}?page={page}"
+        matcher = self.matcher(search_terms)
+
+        try:
+            chunks = self.stream(url, vary=self.filter_key(search_terms))
+            if chunks is None:
+                logger.info(f"Arbeitnow page {page} unchanged since last run")
+                # Listings are newest first: with a watermark, an unchanged
+                # page means nothing new was posted further down either.
+                return jobs, not self.watermark
+            for item in self.parse_items(chunks, key="data", extras=extras):
+                items += 1
+                if self.is_known(item.get("created_at")):
+                    reached_watermark = True
                     continue
-
-                tags_list = item.get("tags", [])
-                tags_str = ", ".join(tags_list) if isinstance(tags_list, list) else str(tags_list)
-
-                # Filter by search terms
-                if search_terms:
-                    searchable = f"{title} {tags_str} {company}".lower()
-                    if not any(term.lower() in searchable for term in search_terms):
-                        continue
-
-                location = item.get("location", "Remote") or "Remote"
-                remote = item.get("remote", False)
-                if remote:
-                    location = f"{location} (Remote)" if location != "Remote" else "Remote"
-
-                posted = item.get("created_at", "")
-
-                jobs.append(
-                    JobPost(
-                        title=title,
-                        company=company,
-                        url=job_url,
-                        source_platform=self.name,
-                        location=location,
-                        salary="",
-                        description=item.get("description", "")[:500],
-                        tags=tags_str,
-                        posted_at=str(posted),
-                    )
-                )
-
-            # Check if there are more pages
-            if not data.get("links", {}).get("next"):
+                job = self._parse_item(item, matcher)
+                if job:
+                    jobs.append(job)
+        except Exception as e:
+            with self._stats_lock:
+                self.errors += 1
+            logger.error(f"Arbeitnow fetch page {page} failed: {e}")
+            return jobs, False
+
+        # Later pages only hold older listings once the watermark is reached
+        if reached_watermark:
+            return jobs, False
+        # Check if there are more pages
+        return jobs, bool(items) and bool(extras.get("links", {}).get("next"))
+
+    def iter_jobs(self, search_terms: list[str] | None = None) -> Iterator[JobPost]:
+        count = 0
+        pages: list[tuple[list[JobPost], bool]] = []
+        remaining = range(1, self.max_pages + 1)
+
+        # On an incremental run the first page usually reaches the watermark,
+        # so fetch it alone before deciding whether the rest are needed.
+        if self.watermark:
+            pages.append(self._fetch_page(1, search_terms))
+            remaining = range(2, self.max_pages + 1) if pages[0][1] else range(0)
+
+        # Pages are fetched in parallel, then yielded in order so that an
+        # empty page or a missing "next" link still ends the listing.
+        if remaining:
+            with ThreadPoolExecutor(max_workers=len(remaining)) as pool:
+                pages.extend(pool.map(
+                    lambda page: self._fetch_page(page, search_terms),
+                    remaining,
+                ))
+
+        for jobs, has_next in pages:
+            count += len(jobs)
+            yield from jobs
+            if not has_next:
                 break
-            page += 1
 
-        logger.info(f"Arbeitnow: fetched {len(jobs)} jobs")
-        return jobs
+        logger.info(f"Arbeitnow: fetched {count} jobs")
@@ -1,11 +1,26 @@
 """Base scraper interface for all job source scrapers."""
 
+import http.client
+import logging
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional
+from urllib.parse import urljoin, urlsplit
 
+from scrapers.jsonstream import iter_array
+from scrapers.matching import TermMatcher, matcher_for
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "JobFeedApp/1.0"
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
 class JobPost:
     title: str
     company: str
@@ -19,12 +34,396 @@ class JobPost:
     posted_at: str = ""
 
 
+def posted_timestamp(value) -> float | None:
+    """Epoch seconds for a source's posting date, or None if it can't be read.
+
+    Sources send either epoch numbers or ISO 8601 strings; naive times are
+    taken as UTC.
+    """
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def job_timestamps(posted_at, scraped_at: str) -> tuple[int, int]:
+    """(posted_ts, scraped_ts) epoch seconds for a stored job.
+
+    ``scraped_at`` is the local ISO time the runner stamps on a batch. A
+    posting can't be newer than the scrape that found it, so an unreadable
+    or future ``posted_at`` counts as the scrape time; the feed's date
+    filter relies on posted_ts <= scraped_ts.
+    """
+    scraped = int(datetime.fromisoformat(scraped_at).timestamp())
+    posted = posted_timestamp(posted_at)
+    return (scraped if posted is None else min(int(posted), scraped)), scraped
+
+
+# ── HTTP Layer ───────────────────────────────────────────────
+
+
+class HTTPError(Exception):
+    """Raised for any response that isn't 2xx or 304."""
+
+
+class HTTPClient:
+    """Minimal keep-alive HTTP client shared by all scrapers.
+
+    Idle connections are pooled per (scheme, host) so repeated requests to
+    the same API (e.g. Arbeitnow's pages) reuse one TCP/TLS session.
+    Responses are requested gzip-compressed and decoded transparently.
+    """
+
+    max_redirects = 5
+
+    def __init__(self) -> None:
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(
+        self, scheme: str, host: str, timeout: float, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle and not fresh:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, timeout=timeout), False
+
+    def _release(self, scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault((scheme, host), []).append(conn)
+
+    def open(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        on_read: Optional[Callable[[int], None]] = None,
+    ) -> tuple[int, dict[str, str], Iterator[bytes]]:
+        """GET a URL, following redirects. Returns (status, headers, chunks).
+
+        The body is not read up front: ``chunks`` yields it decompressed,
+        CHUNK_SIZE bytes of wire data at a time, and hands the connection
+        back to the pool once fully consumed. Closing the iterator early
+        closes the connection instead. ``on_read`` is called with the size
+        of each chunk as received, before decompression.
+        """
+        fresh = False
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            conn, reused = self._acquire(parts.scheme, parts.netloc, timeout, fresh)
+            fresh = False
+            try:
+                conn.request("GET", path, headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept-Encoding": "gzip",
+                    **headers,
+                })
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # Stale pooled connection; retry on a fresh one
+                fresh = True
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp.status in (301, 302, 303, 307, 308) and "location" in resp_headers:
+                resp.read()
+                self._finish(parts.scheme, parts.netloc, conn, resp)
+                url = urljoin(url, resp_headers["location"])
+                continue
+            if resp.status != 304 and not 200 <= resp.status < 300:
+                conn.close()
+                raise HTTPError(f"HTTP {resp.status} {resp.reason} for {url}")
+
+            if resp.status == 304:
+                resp.read()
+                self._finish(parts.scheme, parts.netloc, conn, resp)
+                return resp.status, resp_headers, iter(())
+
+            gzipped = resp_headers.get("content-encoding") == "gzip"
+            chunks = self._iter_body(parts.scheme, parts.netloc, conn, resp, gzipped, on_read)
+            return resp.status, resp_headers, chunks
+
+        raise HTTPError(f"Too many redirects for {url}")
+
+    def _finish(self, scheme: str, host: str, conn, resp) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(scheme, host, conn)
+
+    def _iter_body(
+        self, scheme: str, host: str, conn, resp, gzipped: bool, on_read=None
+    ) -> Iterator[bytes]:
+        decomp = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+        done = False
+        try:
+            while chunk := resp.read(CHUNK_SIZE):
+                if on_read:
+                    on_read(len(chunk))
+                yield decomp.decompress(chunk) if decomp else chunk
+            if decomp:
+                yield decomp.flush()
+            done = True
+        finally:
+            if done:
+                self._finish(scheme, host, conn, resp)
+            else:
+                conn.close()
+
+    def get(
+        self, url: str, headers: dict[str, str], timeout: float
+    ) -> tuple[int, dict[str, str], bytes]:
+        """GET a URL and read the whole body. Returns (status, headers, body)."""
+        status, resp_headers, chunks = self.open(url, headers, timeout)
+        return status, resp_headers, b"".join(chunks)
+
+
+http_client = HTTPClient()
+
+
+# ── Timing Hooks ─────────────────────────────────────────────
+
+
+class _TimedChunks:
+    """Body chunk iterator that adds up the time spent waiting on the network."""
+
+    __slots__ = ("_chunks", "waited")
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self.waited = 0.0
+
+    def __iter__(self) -> "_TimedChunks":
+        return self
+
+    def __next__(self) -> bytes:
+        start = time.perf_counter()
+        try:
+            return next(self._chunks)
+        finally:
+            self.waited += time.perf_counter() - start
+
+    def close(self) -> None:
+        self._chunks.close()
+
+
+class TimedMatcher:
+    """TermMatcher wrapper that adds up the time spent filtering."""
+
+    __slots__ = ("_matcher", "seconds")
+
+    def __init__(self, matcher: TermMatcher) -> None:
+        self._matcher = matcher
+        self.seconds = 0.0
+
+    def matches(self, *fields: str) -> bool:
+        start = time.perf_counter()
+        try:
+            return self._matcher.matches(*fields)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
 class BaseScraper(ABC):
-    """All scrapers must implement the fetch_jobs method."""
+    """All scrapers must implement the iter_jobs generator."""
 
     name: str = "base"
+    api_url: str = ""  # Source endpoint; subclasses default to their module's API_URL
+    timeout: float = 30  # Per-request timeout, set by the runner
+    whole_words: bool = False  # Match search terms on word boundaries only
+
+    def __init__(
+        self,
+        validators: Optional[dict[str, tuple[str, str]]] = None,
+        watermark: float = 0.0,
+    ) -> None:
+        # Validators (etag, last_modified) from the previous run, by cache key.
+        # New ones are collected separately and only persisted by the runner
+        # once the jobs have been stored, so a failed run is retried in full.
+        self.validators = validators or {}
+        self.new_validators: dict[str, tuple[str, str]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # High-water mark: newest posting date (epoch seconds) stored by the
+        # last complete run. Listings older than it are skipped and counted.
+        self.watermark = watermark
+        self.newest = watermark
+        self.skipped = 0
+        self.errors = 0  # Fetches that failed and were only logged
+        # Timing hooks for the run history: seconds per stage, wire bytes
+        self.timings = {"fetch": 0.0, "parse": 0.0}
+        self.bytes_downloaded = 0
+        self._matchers: list[TimedMatcher] = []
+        self._stats_lock = threading.Lock()
+
+    def stream(self, url: str, vary: str = "") -> Optional[Iterator[bytes]]:
+        """Conditionally GET a URL. Returns body chunks, or None if unchanged.
+
+        ``vary`` is folded into the cache key; scrapers that filter client-side
+        pass their search terms so a new term list forces a full download.
+        """
+        key = f"{url} {vary}" if vary else url
+        headers = {}
+        etag, last_modified = self.validators.get(key, ("", ""))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        start = time.perf_counter()
+        status, resp_headers, chunks = http_client.open(
+            url, headers, self.timeout, on_read=self._count_bytes
+        )
+
+        with self._stats_lock:
+            self.timings["fetch"] += time.perf_counter() - start
+            if status == 304:
+                self.cache_hits += 1
+                return None
+            self.cache_misses += 1
+            validators = (resp_headers.get("etag", ""), resp_headers.get("last-modified", ""))
+            if any(validators):
+                self.new_validators[key] = validators
+        return _TimedChunks(chunks)
+
+    def _count_bytes(self, size: int) -> None:
+        with self._stats_lock:
+            self.bytes_downloaded += size
+
+    def parse_items(
+        self,
+        chunks: Iterator[bytes],
+        key: str | None = None,
+        extras: dict | None = None,
+    ) -> Iterator[dict]:
+        """iter_array() over a body from stream(), timing the JSON parsing.
+
+        Parsing pulls chunks as it goes, so the time spent waiting on them
+        is taken out of the parse time and charged to fetching instead.
+        """
+        items = iter_array(chunks, key, extras)
+        elapsed = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                finally:
+                    elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            waited = getattr(chunks, "waited", 0.0)
+            with self._stats_lock:
+                self.timings["fetch"] += waited
+                self.timings["parse"] += max(0.0, elapsed - waited)
+
+    def stage_timings(self) -> dict[str, int]:
+        """Totals from the timing hooks, in milliseconds (and bytes)."""
+        with self._stats_lock:
+            filter_seconds = sum(m.seconds for m in self._matchers)
+            return {
+                "fetch_ms": round(self.timings["fetch"] * 1000),
+                "parse_ms": round(self.timings["parse"] * 1000),
+                "filter_ms": round(filter_seconds * 1000),
+                "bytes": self.bytes_downloaded,
+            }
+
+    def fetch(self, url: str, vary: str = "") -> Optional[bytes]:
+        """Like stream(), but reads the whole body into memory."""
+        chunks = self.stream(url, vary)
+        return None if chunks is None else b"".join(chunks)
+
+    def stream_items(
+        self,
+        url: str,
+        key: str | None = None,
+        vary: str = "",
+        extras: dict | None = None,
+    ) -> Iterator[dict]:
+        """Yield raw listings from the JSON array at ``key`` of a response.
+
+        Network and parse errors are logged and end the stream early; items
+        yielded before the failure are kept. Yields nothing on a 304.
+        """
+        try:
+            chunks = self.stream(url, vary)
+            if chunks is None:
+                logger.info(f"{self.name}: {url} unchanged since last run")
+                return
+            yield from self.parse_items(chunks, key, extras)
+        except Exception as e:
+            with self._stats_lock:
+                self.errors += 1
+            logger.error(f"{self.name} fetch {url} failed: {e}")
+
+    def is_known(self, posted) -> bool:
+        """True if a listing predates the watermark, i.e. was ingested before.
+
+        Call it on the raw posting date before doing any other work on an
+        item; it also tracks the newest date seen for the next watermark.
+        Listings with an unreadable date are never skipped.
+        """
+        ts = posted_timestamp(posted)
+        if ts is None:
+            return False
+        with self._stats_lock:
+            if ts > self.newest:
+                self.newest = ts
+            if ts < self.watermark:
+                self.skipped += 1
+                return True
+        return False
+
+    def matcher(self, search_terms: list[str] | None) -> TimedMatcher | None:
+        """Compiled matcher for client-side filtering, or None to keep everything."""
+        matcher = matcher_for(search_terms, self.whole_words)
+        if matcher is None:
+            return None
+        timed = TimedMatcher(matcher)
+        with self._stats_lock:
+            self._matchers.append(timed)
+        return timed
+
+    def filter_key(self, search_terms: list[str] | None) -> str:
+        """Cache ``vary`` value for scrapers that filter client-side."""
+        key = ",".join(search_terms or [])
+        return f"{key} words" if key and self.whole_words else key
 
     @abstractmethod
-    def fetch_jobs(self, search_terms: list[str] | None = None) -> list[JobPost]:
-        """Fetch jobs from the source. Returns list of JobPost dataclasses."""
+    def iter_jobs(self, search_terms: list[str] | None = None) -> Iterator[JobPost]:
+        """Yield jobs from the source one at a time as the response streams in."""
         ...
+
+    def fetch_jobs(self, search_terms: list[str] | None = None, **kwargs) -> list[JobPost]:
+        """Fetch jobs from the source. Returns list of JobPost dataclasses."""
+        return list(self.iter_jobs(search_terms=search_terms, **kwargs))
@@ -0,0 +1,90 @@
+"""
+Near-duplicate detection for job posts scraped from different sources.
+
+Two signals are used:
+
+- ``fingerprint``: hash of normalized company + canonical title + location.
+  Equal fingerprints are the same role posted twice.
+- ``minhash``: MinHash signature of the description's word shingles, for
+  reposts whose title or location was written differently. Signatures are
+  split into LSH bands; two descriptions with Jaccard similarity around
+  MIN_SIMILARITY or more share at least one band with high probability, so
+  candidates come from an indexed equality lookup per band rather than a
+  comparison against every stored job.
+"""
+
+import hashlib
+import random
+import re
+from array import array
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+MIN_SIMILARITY = 0.6
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240101)  # Fixed seed: signatures are persisted
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+# Format noise that differs between boards for the same role
+_NOISE = re.compile(
+    r"\b(remote|hybrid|onsite|on-site|full[- ]?time|part[- ]?time|contract|m/w/d|f/m/d|m/f/d|w/m/d)\b"
+)
+_COMPANY_SUFFIX = re.compile(r"\b(inc|llc|ltd|gmbh|corp|corporation|co|plc|ag|bv|sa|sas)\b")
+_NON_WORD = re.compile(r"[^\w]+")
+_TAGS = re.compile(r"<[^>]+>")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def normalize_company(company: str) -> str:
+    return _normalize(_COMPANY_SUFFIX.sub(" ", company.lower()))
+
+
+def canonical_title(title: str) -> str:
+    # Drop bracketed qualifiers like "(Remote, EU)" before the noise words
+    title = re.sub(r"[(\[].*?[)\]]", " ", title.lower())
+    return _normalize(_NOISE.sub(" ", title))
+
+
+def normalize_location(location: str) -> str:
+    return _normalize(_NOISE.sub(" ", location.lower())) or "remote"
+
+
+def fingerprint(company: str, title: str, location: str) -> str:
+    key = f"{normalize_company(company)}|{canonical_title(title)}|{normalize_location(location)}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def minhash(text: str, shingle: int = 3) -> bytes | None:
+    """MinHash signature of the text's word shingles, or None if too short."""
+    words = _normalize(_TAGS.sub(" ", text)).split()
+    if len(words) < shingle * 4:
+        return None
+    shingles = {_hash64(" ".join(words[i:i + shingle])) for i in range(len(words) - shingle + 1)}
+    signature = array("Q", (min((a * x + b) % _PRIME for x in shingles) for a, b in _PERMS))
+    return signature.tobytes()
+
+
+def band_keys(signature: bytes) -> list[tuple[int, int]]:
+    """(band number, band key) pairs for the LSH candidate index."""
+    values = array("Q", signature)
+    keys = []
+    for band in range(BANDS):
+        raw = values[band * ROWS:(band + 1) * ROWS].tobytes()
+        # Signed, to fit an SQLite INTEGER
+        keys.append((band, int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big", signed=True)))
+    return keys
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    va, vb = array("Q", a), array("Q", b)
+    return sum(x == y for x, y in zip(va, vb)) / NUM_PERM
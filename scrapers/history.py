@@ -0,0 +1,151 @@
+"""
+Scrape run history: one scrape_runs row per run, one scrape_source_runs row
+per source in it, with the per-stage timings from the scraper and insert
+hooks. summarize() turns the recent history into per-source percentiles.
+"""
+
+import json
+import math
+
+from db.database import get_connection, transaction
+from db.events import publish
+
+HISTORY_RUNS = 1000  # Finished runs kept; older ones are pruned when a run is recorded
+
+# Per-source columns that summarize() reports percentiles for
+TIMING_COLUMNS = ("total_ms", "fetch_ms", "parse_ms", "filter_ms", "insert_ms", "bytes")
+
+
+def start_run(trigger: str, terms: list[str] | None, sources: list[str] | None) -> int:
+    """Record a run that starts right away (not queued). Returns its id."""
+    with transaction() as conn:
+        cur = conn.execute(
+            """
+            INSERT INTO scrape_runs (status, trigger, terms, sources, started_at)
+            VALUES ('running', ?, ?, ?, datetime('now'))
+            """,
+            (
+                trigger,
+                json.dumps(terms) if terms else None,
+                json.dumps(sources) if sources else None,
+            ),
+        )
+        return cur.lastrowid
+
+
+def finish_run(run_id: int, stats: dict | None, error: str | None) -> None:
+    with transaction() as conn:
+        conn.execute(
+            """
+            UPDATE scrape_runs
+            SET status = ?, finished_at = datetime('now'), stats = ?, error = ?
+            WHERE id = ?
+            """,
+            ("failed" if error else "done", json.dumps(stats) if stats else None, error, run_id),
+        )
+        publish(conn, "scrape", {
+            "run_id": run_id,
+            "status": "failed" if error else "done",
+            "error": error,
+            "inserted": (stats or {}).get("_total", {}).get("inserted", 0),
+        })
+
+
+def record_sources(run_id: int, stats: dict) -> None:
+    """Store the per-source part of run() stats and prune old history."""
+    rows = [
+        (
+            run_id,
+            name,
+            "ok" if info.get("status") == "ok" else "error",
+            None if info.get("status") == "ok" else info.get("status"),
+            info.get("latency_ms"),
+            info.get("fetch_ms"),
+            info.get("parse_ms"),
+            info.get("filter_ms"),
+            info.get("insert_ms"),
+            info.get("bytes"),
+            info.get("fetched", 0),
+            info.get("skipped", 0),
+            info.get("inserted", 0),
+            info.get("updated", 0),
+            info.get("unchanged", 0),
+            info.get("merged", 0),
+        )
+        for name, info in stats.items()
+        if not name.startswith("_")
+    ]
+    with transaction() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO scrape_source_runs (
+                run_id, source, status, error, total_ms, fetch_ms, parse_ms,
+                filter_ms, insert_ms, bytes, fetched, skipped, inserted,
+                updated, unchanged, merged
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.execute(
+            """
+            DELETE FROM scrape_runs
+            WHERE status IN ('done', 'failed') AND id <= (
+                SELECT id FROM scrape_runs ORDER BY id DESC LIMIT 1 OFFSET ?
+            )
+            """,
+            (HISTORY_RUNS,),
+        )
+
+
+def _percentile(values: list[int], pct: float) -> int | None:
+    """Nearest-rank percentile of already sorted values."""
+    if not values:
+        return None
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def summarize(window: int = 50, source: str | None = None) -> dict:
+    """p50/p95 of each stage over the last ``window`` runs of every source."""
+    conn = get_connection()
+    rows = conn.execute(
+        f"""
+        SELECT * FROM (
+            SELECT s.*, r.started_at,
+                   ROW_NUMBER() OVER (PARTITION BY s.source ORDER BY s.run_id DESC) AS n
+            FROM scrape_source_runs s JOIN scrape_runs r ON r.id = s.run_id
+            {"WHERE s.source = ?" if source else ""}
+        )
+        WHERE n <= ?
+        ORDER BY source, run_id DESC
+        """,
+        (source, window) if source else (window,),
+    ).fetchall()
+    recent = conn.execute(
+        """
+        SELECT id, status, trigger, requested_at, started_at, finished_at, error
+        FROM scrape_runs ORDER BY id DESC LIMIT 20
+        """
+    ).fetchall()
+    conn.close()
+
+    by_source: dict[str, list] = {}
+    for row in rows:
+        by_source.setdefault(row["source"], []).append(row)
+
+    sources = {}
+    for name, runs in by_source.items():
+        summary = {
+            "runs": len(runs),
+            "errors": sum(1 for r in runs if r["status"] != "ok"),
+            "last_run_at": runs[0]["started_at"],
+            "last_status": runs[0]["error"] or runs[0]["status"],
+            "p50": {},
+            "p95": {},
+        }
+        for column in TIMING_COLUMNS:
+            values = sorted(r[column] for r in runs if r[column] is not None)
+            summary["p50"][column] = _percentile(values, 50)
+            summary["p95"][column] = _percentile(values, 95)
+        sources[name] = summary
+
+    return {"window": window, "sources": sources, "recent_runs": [dict(r) for r in recent]}
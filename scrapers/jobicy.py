@@ -1,27 +1,30 @@
 """Scraper for Jobicy.com free API."""
 
-import json
 import logging
-import urllib.request
+import os
+from typing import Iterator
+from urllib.parse import quote
 
 from scrapers.base import BaseScraper, JobPost
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://jobicy.com/api/v2/remote-jobs"
+# Override with JOBICY_API_URL, e.g. to point at bench.fake_api
+API_URL = os.environ.get("JOBICY_API_URL", "https://jobicy.com/api/v2/remote-jobs")
 
 
 class JobicyScraper(BaseScraper):
     name = "jobicy"
+    api_url = API_URL
 
-    def fetch_jobs(
+    def iter_jobs(
         self,
         search_terms: list[str] | None = None,
         geo: str = "",
         industry: str = "",
         count: int = 50,
-    ) -> list[JobPost]:
-        jobs: list[JobPost] = []
+    ) -> Iterator[JobPost]:
+        fetched = 0
 
         params = [f"count={count}"]
         if geo:
@@ -29,22 +32,14 @@ class JobicyScraper(BaseScraper):
         if industry:
             params.append(f"industry={industry}")
         if search_terms:
-            params.append(f"tag={'+'.join(search_terms)}")
+            params.append(f"tag={'+'.join(quote(t) for t in search_terms)}")
 
-        url = API_URL + "?" + "&".join(params)
+        url = self.api_url + "?" + "&".join(params)
 
-        try:
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "JobFeedApp/1.0"},
-            )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
-        except Exception as e:
-            logger.error(f"Jobicy fetch failed: {e}")
-            return jobs
+        for item in self.stream_items(url, key="jobs"):
+            if self.is_known(item.get("pubDate")):
+                continue
 
-        for item in data.get("jobs", []):
             title = item.get("jobTitle", "").strip()
             company = item.get("companyName", "").strip()
             job_url = item.get("url", "")
@@ -65,22 +60,24 @@ class JobicyScraper(BaseScraper):
             if isinstance(industry_label, list):
                 industry_label = ", ".join(industry_label)
 
+            job_type = item.get("jobType", "")
+            if isinstance(job_type, list):
+                job_type = ", ".join(job_type)
+
             posted = item.get("pubDate", "")
 
-            jobs.append(
-                JobPost(
-                    title=title,
-                    company=company,
-                    url=job_url,
-                    source_platform=self.name,
-                    location=location,
-                    role_category=industry_label,
-                    salary=salary,
-                    description=item.get("jobDescription", "")[:500],
-                    tags=item.get("jobType", ""),
-                    posted_at=posted,
-                )
+            fetched += 1
+            yield JobPost(
+                title=title,
+                company=company,
+                url=job_url,
+                source_platform=self.name,
+                location=location,
+                role_category=industry_label,
+                salary=salary,
+                description=item.get("jobDescription", "")[:500],
+                tags=job_type,
+                posted_at=posted,
             )
 
-        logger.info(f"Jobicy: fetched {len(jobs)} jobs")
-        return jobs
+        logger.info(f"Jobicy: fetched {fetched} jobs")
@@ -0,0 +1,130 @@
+"""Incremental parsing of large JSON API responses.
+
+The job APIs return one big document whose bulk is a single array of
+listings (the top-level array for RemoteOK, ``jobs`` for Remotive/Jobicy,
+``data`` for Arbeitnow). ``iter_array`` yields that array's elements one by
+one while the body is still downloading, so only a chunk of raw bytes and
+a single listing are held in memory at a time.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _Buffer:
+    """Decoded text window over a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk. Returns False once the stream is exhausted."""
+        if self.eof:
+            return False
+        # Drop what's already been consumed before growing the window
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            piece = self._utf8.decode(chunk)
+            if piece:
+                self.text += piece
+                return True
+        self.text += self._utf8.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of stream."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.text, self.pos)
+                # A value that touches the end of the window may be cut short
+                # (e.g. the number 12 of 123), so only trust it with lookahead.
+                # A number can also stop short of the edge: "-2500." decodes
+                # as -2500 until the fraction arrives.
+                if self.eof or (end < len(self.text) and not (
+                    isinstance(obj, (int, float)) and self.text[end] in _NUMBER_CHARS
+                )):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+
+def _iter_elements(buf: _Buffer) -> Iterator[Any]:
+    buf.expect("[")
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        yield buf.value()
+        if buf.peek() == ",":
+            buf.pos += 1
+            continue
+        buf.expect("]")
+        return
+
+
+def iter_array(
+    chunks: Iterable[bytes],
+    key: str | None = None,
+    extras: dict | None = None,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array from a stream of byte chunks.
+
+    With ``key=None`` the document itself must be an array. Otherwise it
+    must be an object, and the array under ``key`` is streamed; any other
+    top-level members are decoded whole and stored in ``extras`` if given
+    (e.g. Arbeitnow's ``links``, which follows its ``data`` array).
+    """
+    buf = _Buffer(chunks)
+
+    if key is None:
+        yield from _iter_elements(buf)
+        return
+
+    buf.expect("{")
+    if buf.peek() == "}":
+        return
+    while True:
+        name = buf.value()
+        buf.expect(":")
+        if name == key and buf.peek() == "[":
+            yield from _iter_elements(buf)
+        else:
+            value = buf.value()
+            if extras is not None:
+                extras[name] = value
+        if buf.peek() == ",":
+            buf.pos += 1
+            continue
+        buf.expect("}")
+        return
@@ -0,0 +1,71 @@
+"""Search-term matching shared by the scrapers that filter client-side."""
+
+import re
+from functools import lru_cache
+
+
+def _trie_pattern(terms: tuple[str, ...]) -> str:
+    """Regex alternation with shared prefixes factored out.
+
+    ("data analyst", "data engineer") becomes "data (?:analyst|engineer)",
+    which lets the regex engine reject a position after one character
+    comparison instead of trying every term in turn.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        if "" in node and len(node) == 1:
+            return ""
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # A complete term ends here, so the rest is optional
+        return group + "?" if optional else group
+
+    return emit(trie)
+
+
+class TermMatcher:
+    """Case-insensitive "contains any of these terms" test.
+
+    Terms are lowercased once and folded into one compiled, prefix-factored
+    alternation, so checking a listing is a single regex scan over its
+    lowercased text instead of one substring search per term. With
+    ``whole_words`` a term only matches on word boundaries ("bi" no longer
+    matches "mobile").
+    """
+
+    __slots__ = ("terms", "whole_words", "_pattern")
+
+    def __init__(self, terms: list[str], whole_words: bool = False) -> None:
+        self.terms = tuple(sorted({t.strip().lower() for t in terms if t.strip()}))
+        self.whole_words = whole_words
+        alternation = _trie_pattern(self.terms)
+        if whole_words:
+            alternation = rf"\b(?:{alternation})\b"
+        self._pattern = re.compile(alternation) if self.terms else None
+
+    def matches(self, *fields: str) -> bool:
+        """True if any term occurs in the fields joined by spaces."""
+        if self._pattern is None:
+            return True
+        return self._pattern.search(" ".join(fields).lower()) is not None
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(terms: tuple[str, ...], whole_words: bool) -> TermMatcher:
+    return TermMatcher(list(terms), whole_words)
+
+
+def matcher_for(terms: list[str] | None, whole_words: bool = False) -> TermMatcher | None:
+    """Shared matcher for a term list, compiled once and reused across scrapers."""
+    if not terms:
+        return None
+    return _cached_matcher(tuple(terms), whole_words)
@@ -0,0 +1,107 @@
+"""
+Scraper registry: the sources there are and the classes that scrape them.
+
+Classes are named by import path and imported the first time a source is
+looked up, so processes that only list or validate source names (the web
+workers, the scheduler between runs) never load the scraping code.
+
+Sources come from, later ones replacing earlier ones of the same name:
+
+  BUILTIN                          the sources that ship with the app
+  "jobfeed.scrapers" entry points  installed plugin packages, declared as
+                                   [project.entry-points."jobfeed.scrapers"]
+                                   mysource = "mypackage.scraper:MySourceScraper"
+  SCRAPER_PLUGINS                  "name=module:Class,..." in the environment
+
+A plugin class subclasses scrapers.base.BaseScraper like the built-in ones.
+"""
+
+import importlib
+import os
+from collections.abc import Iterator, Mapping
+
+ENTRY_POINT_GROUP = "jobfeed.scrapers"
+
+BUILTIN = {
+    "remoteok": "scrapers.remoteok:RemoteOKScraper",
+    "remotive": "scrapers.remotive:RemotiveScraper",
+    "jobicy": "scrapers.jobicy:JobicyScraper",
+    "arbeitnow": "scrapers.arbeitnow:ArbeitnowScraper",
+}
+
+# ── Time Budgets ─────────────────────────────────────────────
+# A full concurrent run never takes longer than SCRAPE_DEADLINE seconds.
+# Each source additionally gets its own budget, which is also used as its
+# request timeout; a source that overruns is reported as failed and stops
+# being read (batches it already delivered stay stored). Time spent
+# inserting batches doesn't count against the per-source budgets.
+
+SCRAPE_DEADLINE = float(os.environ.get("SCRAPE_DEADLINE_SECONDS", 90))
+DEFAULT_SOURCE_BUDGET = 30.0
+SOURCE_BUDGETS = {
+    "arbeitnow": 45.0,  # Several pages per run
+}
+
+
+def _parse_paths(spec: str) -> dict[str, str]:
+    paths = {}
+    for part in spec.split(","):
+        name, _, path = part.partition("=")
+        if name.strip() and path.strip():
+            paths[name.strip()] = path.strip()
+    return paths
+
+
+def _entry_points() -> dict[str, str]:
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def discover() -> dict[str, str]:
+    """Source name -> "module:Class" from all three places, in precedence order."""
+    return {
+        **BUILTIN,
+        **_entry_points(),
+        **_parse_paths(os.environ.get("SCRAPER_PLUGINS", "")),
+    }
+
+
+class ScraperRegistry(Mapping):
+    """Source name -> scraper class, importing each class on first lookup.
+
+    Names, membership and iteration only need the paths; looking a name up
+    imports its module. ``paths`` defaults to discover(), run on first use.
+    """
+
+    def __init__(self, paths: dict[str, str] | None = None):
+        self._paths = paths
+        self._classes: dict[str, type] = {}
+
+    @property
+    def paths(self) -> dict[str, str]:
+        if self._paths is None:
+            self._paths = discover()
+        return self._paths
+
+    def __getitem__(self, name: str) -> type:
+        cls = self._classes.get(name)
+        if cls is None:
+            module, _, attr = self.paths[name].partition(":")
+            cls = getattr(importlib.import_module(module), attr)
+
+            from scrapers.base import BaseScraper
+
+            if not (isinstance(cls, type) and issubclass(cls, BaseScraper)):
+                raise TypeError(f"Scraper {name!r} ({self.paths[name]}) is not a BaseScraper")
+            self._classes[name] = cls
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+SCRAPERS = ScraperRegistry()
@@ -1,37 +1,34 @@
 """Scraper for RemoteOK.com free API."""
 
-import json
 import logging
-import urllib.request
+import os
 from datetime import datetime
+from typing import Iterator
 
 from scrapers.base import BaseScraper, JobPost
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://remoteok.com/api"
+# Override with REMOTEOK_API_URL, e.g. to point at bench.fake_api
+API_URL = os.environ.get("REMOTEOK_API_URL", "https://remoteok.com/api")
 
 
 class RemoteOKScraper(BaseScraper):
     name = "remoteok"
+    api_url = API_URL
 
-    def fetch_jobs(self, search_terms: list[str] | None = None) -> list[JobPost]:
-        jobs: list[JobPost] = []
-        try:
-            req = urllib.request.Request(
-                API_URL,
-                headers={"User-Agent": "JobFeedApp/1.0"},
-            )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
-        except Exception as e:
-            logger.error(f"RemoteOK fetch failed: {e}")
-            return jobs
+    def iter_jobs(self, search_terms: list[str] | None = None) -> Iterator[JobPost]:
+        count = 0
+        matcher = self.matcher(search_terms)
+        listings = self.stream_items(self.api_url, vary=self.filter_key(search_terms))
 
         # First item is a legal notice, skip it
-        listings = data[1:] if len(data) > 1 else data
+        next(listings, None)
 
         for item in listings:
+            if self.is_known(item.get("epoch") or item.get("date")):
+                continue
+
             title = item.get("position", "").strip()
             company = item.get("company", "").strip()
             url = item.get("url", "")
@@ -44,10 +41,8 @@ class RemoteOKScraper(BaseScraper):
             tags_str = ", ".join(tags_list) if isinstance(tags_list, list) else str(tags_list)
 
             # Filter by search terms if provided
-            if search_terms:
-                searchable = f"{title} {tags_str} {company}".lower()
-                if not any(term.lower() in searchable for term in search_terms):
-                    continue
+            if matcher and not matcher.matches(title, tags_str, company):
+                continue
 
             posted = item.get("date", "")
             if posted:
@@ -67,19 +62,17 @@ class RemoteOKScraper(BaseScraper):
 
             location = item.get("location", "Remote") or "Remote"
 
-            jobs.append(
-                JobPost(
-                    title=title,
-                    company=company,
-                    url=url,
-                    source_platform=self.name,
-                    location=location,
-                    salary=salary,
-                    description=item.get("description", "")[:500],
-                    tags=tags_str,
-                    posted_at=posted,
-                )
+            count += 1
+            yield JobPost(
+                title=title,
+                company=company,
+                url=url,
+                source_platform=self.name,
+                location=location,
+                salary=salary,
+                description=item.get("description", "")[:500],
+                tags=tags_str,
+                posted_at=posted,
             )
 
-        logger.info(f"RemoteOK: fetched {len(jobs)} jobs")
-        return jobs
+        logger.info(f"RemoteOK: fetched {count} jobs")
@@ -1,15 +1,17 @@
 """Scraper for Remotive.com free API."""
 
-import json
 import logging
-import urllib.request
+import os
 from datetime import datetime
+from typing import Iterator
+from urllib.parse import quote
 
 from scrapers.base import BaseScraper, JobPost
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://remotive.com/api/remote-jobs"
+# Override with REMOTIVE_API_URL, e.g. to point at bench.fake_api
+API_URL = os.environ.get("REMOTIVE_API_URL", "https://remotive.com/api/remote-jobs")
 
 # Map Remotive categories to our role categories
 CATEGORY_MAP = {
@@ -25,35 +27,28 @@ CATEGORY_MAP = {
 
 class RemotiveScraper(BaseScraper):
     name = "remotive"
+    api_url = API_URL
 
-    def fetch_jobs(
+    def iter_jobs(
         self,
         search_terms: list[str] | None = None,
         category: str = "",
-    ) -> list[JobPost]:
-        jobs: list[JobPost] = []
+    ) -> Iterator[JobPost]:
+        count = 0
 
-        url = API_URL
+        url = self.api_url
         params = []
         if category:
             params.append(f"category={category}")
         if search_terms:
-            params.append(f"search={'+'.join(search_terms)}")
+            params.append(f"search={'+'.join(quote(t) for t in search_terms)}")
         if params:
             url += "?" + "&".join(params)
 
-        try:
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "JobFeedApp/1.0"},
-            )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
-        except Exception as e:
-            logger.error(f"Remotive fetch failed: {e}")
-            return jobs
+        for item in self.stream_items(url, key="jobs"):
+            if self.is_known(item.get("publication_date")):
+                continue
 
-        for item in data.get("jobs", []):
             title = item.get("title", "").strip()
             company = item.get("company_name", "").strip()
             job_url = item.get("url", "")
@@ -75,20 +70,18 @@ class RemotiveScraper(BaseScraper):
             location = item.get("candidate_required_location", "Remote") or "Remote"
             category_label = item.get("category", "")
 
-            jobs.append(
-                JobPost(
-                    title=title,
-                    company=company,
-                    url=job_url,
-                    source_platform=self.name,
-                    location=location,
-                    role_category=category_label,
-                    salary=salary,
-                    description=item.get("description", "")[:500],
-                    tags=tags_str,
-                    posted_at=posted,
-                )
+            count += 1
+            yield JobPost(
+                title=title,
+                company=company,
+                url=job_url,
+                source_platform=self.name,
+                location=location,
+                role_category=category_label,
+                salary=salary,
+                description=item.get("description", "")[:500],
+                tags=tags_str,
+                posted_at=posted,
             )
 
-        logger.info(f"Remotive: fetched {len(jobs)} jobs")
-        return jobs
+        logger.info(f"Remotive: fetched {count} jobs")
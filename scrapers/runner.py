@@ -5,117 +5,702 @@ Usage:
     python -m scrapers.runner                          # Fetch all, no filter
     python -m scrapers.runner --terms "data analyst" "bi engineer" "analytics"
     python -m scrapers.runner --sources remoteok remotive
+    python -m scrapers.runner --serial                 # One source at a time
+    python -m scrapers.runner --full                   # Ignore watermarks
 """
 
 import argparse
 import logging
-import sys
+import queue
+import threading
+import time
 from datetime import datetime
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from db.database import get_connection, init_db
-from scrapers.arbeitnow import ArbeitnowScraper
-from scrapers.base import JobPost
-from scrapers.jobicy import JobicyScraper
-from scrapers.remoteok import RemoteOKScraper
-from scrapers.remotive import RemotiveScraper
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
+from typing import Iterator
+
+from db.database import bump_generation, get_connection, init_db, transaction
+from db.events import publish_jobs
+from db.tags import normalize_tags, set_tags, tags_for
+from scrapers import dedup, history
+from scrapers.base import BaseScraper, JobPost, job_timestamps
+from scrapers.registry import DEFAULT_SOURCE_BUDGET, SCRAPE_DEADLINE, SCRAPERS, SOURCE_BUDGETS
+from scrapers.salary import salary_columns
+
 logger = logging.getLogger(__name__)
 
-ALL_SCRAPERS = {
-    "remoteok": RemoteOKScraper,
-    "remotive": RemotiveScraper,
-    "jobicy": JobicyScraper,
-    "arbeitnow": ArbeitnowScraper,
-}
+# Jobs are written in batches of this size while scrapers are still
+# streaming, and at most QUEUE_BATCHES batches wait in memory at once.
+INSERT_BATCH_SIZE = 200
+QUEUE_BATCHES = 8
 
 
-def insert_jobs(jobs: list[JobPost]) -> tuple[int, int]:
-    """Insert jobs into DB, skipping duplicates. Returns (inserted, skipped)."""
-    conn = get_connection()
-    inserted = 0
-    skipped = 0
+UPSERT_SQL = """
+    INSERT INTO job_posts
+        (title, company, location, role_category, source_platform,
+         url, salary, description, tags, posted_at, scraped_at,
+         posted_ts, scraped_ts, salary_min_usd, salary_max_usd, salary_currency,
+         salary_period, canonical_id, fingerprint, minhash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        title = excluded.title,
+        company = excluded.company,
+        location = excluded.location,
+        role_category = excluded.role_category,
+        salary = excluded.salary,
+        salary_min_usd = excluded.salary_min_usd,
+        salary_max_usd = excluded.salary_max_usd,
+        salary_currency = excluded.salary_currency,
+        salary_period = excluded.salary_period,
+        description = excluded.description,
+        tags = excluded.tags,
+        posted_at = excluded.posted_at,
+        -- Measured against when the job was first seen, not this scrape
+        posted_ts = MIN(excluded.posted_ts, job_posts.scraped_ts)
+    WHERE job_posts.title IS NOT excluded.title
+       OR job_posts.company IS NOT excluded.company
+       OR job_posts.location IS NOT excluded.location
+       OR job_posts.role_category IS NOT excluded.role_category
+       OR job_posts.salary IS NOT excluded.salary
+       OR job_posts.description IS NOT excluded.description
+       OR job_posts.tags IS NOT excluded.tags
+       OR job_posts.posted_at IS NOT excluded.posted_at
+"""
 
-    for job in jobs:
-        try:
-            conn.execute(
+
+# ── Dedup Stage ──────────────────────────────────────────────
+
+
+class _Signature:
+    """Dedup keys of one job, plus the canonical job it duplicates (if any)."""
+
+    __slots__ = ("fingerprint", "minhash", "company", "canonical")
+
+    def __init__(self, company: str, title: str, location: str, description: str) -> None:
+        self.fingerprint = dedup.fingerprint(company, title, location)
+        self.minhash = dedup.minhash(description)
+        self.company = dedup.normalize_company(company)
+        # Existing job id, or URL of an earlier canonical job in the same batch
+        self.canonical: int | str | None = None
+
+
+class _BatchIndex:
+    """In-memory counterpart of the DB dedup indexes for not-yet-stored jobs."""
+
+    def __init__(self) -> None:
+        self.fingerprints: dict[str, str] = {}
+        self.bands: dict[tuple[int, int], list[tuple[str, _Signature]]] = {}
+
+    def add(self, url: str, sig: _Signature) -> None:
+        if sig.company:
+            self.fingerprints.setdefault(sig.fingerprint, url)
+        if sig.minhash:
+            for band in dedup.band_keys(sig.minhash):
+                self.bands.setdefault(band, []).append((url, sig))
+
+
+def _is_near_duplicate(sig: _Signature, company: str, minhash: bytes | None) -> bool:
+    if not sig.minhash or not minhash:
+        return False
+    if sig.company and company and sig.company != company:
+        return False
+    return dedup.similarity(sig.minhash, minhash) >= dedup.MIN_SIMILARITY
+
+
+def _find_canonical(conn, sig: _Signature, batch: _BatchIndex) -> int | str | None:
+    """Look a job up in the dedup indexes. Returns what it duplicates, if anything."""
+    # Without a company the fingerprint is only title + location, which
+    # unrelated postings share; leave those to the description check.
+    if sig.company:
+        row = conn.execute(
+            "SELECT COALESCE(canonical_id, id) FROM job_posts WHERE fingerprint = ? LIMIT 1",
+            (sig.fingerprint,),
+        ).fetchone()
+        if row:
+            return row[0]
+        if sig.fingerprint in batch.fingerprints:
+            return batch.fingerprints[sig.fingerprint]
+    if not sig.minhash:
+        return None
+
+    keys = dedup.band_keys(sig.minhash)
+    candidates = conn.execute(
+        f"""
+        SELECT DISTINCT j.id, j.company, j.minhash
+        FROM job_minhash_bands b JOIN job_posts j ON j.id = b.job_id
+        WHERE {" OR ".join(["(b.band = ? AND b.key = ?)"] * len(keys))}
+        """,
+        [v for key in keys for v in key],
+    ).fetchall()
+    for job_id, company, minhash in candidates:
+        if _is_near_duplicate(sig, dedup.normalize_company(company or ""), minhash):
+            return job_id
+    for key in keys:
+        for url, other in batch.bands.get(key, []):
+            if _is_near_duplicate(sig, other.company, other.minhash):
+                return url
+    return None
+
+
+def _index_bands(conn, ids_and_signatures: list[tuple[int, _Signature]]) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO job_minhash_bands (band, key, job_id) VALUES (?, ?, ?)",
+        [
+            (band, key, job_id)
+            for job_id, sig in ids_and_signatures
+            if sig.minhash
+            for band, key in dedup.band_keys(sig.minhash)
+        ],
+    )
+
+
+def _ids_by_url(conn, urls: list[str]) -> dict[str, int]:
+    ids: dict[str, int] = {}
+    for i in range(0, len(urls), 500):
+        chunk = urls[i:i + 500]
+        rows = conn.execute(
+            f"SELECT id, url FROM job_posts WHERE url IN ({','.join('?' * len(chunk))})", chunk
+        ).fetchall()
+        ids.update({r["url"]: r["id"] for r in rows})
+    return ids
+
+
+def _archived_urls(conn, urls: list[str]) -> set[str]:
+    archived: set[str] = set()
+    for i in range(0, len(urls), 500):
+        chunk = urls[i:i + 500]
+        rows = conn.execute(
+            f"SELECT url FROM job_archive_urls WHERE url IN ({','.join('?' * len(chunk))})", chunk
+        ).fetchall()
+        archived.update(r["url"] for r in rows)
+    return archived
+
+
+def insert_jobs(jobs: list[JobPost], scraped_at: str | None = None) -> tuple[int, int, int, int]:
+    """Upsert jobs into DB in a single transaction.
+
+    New URLs are inserted; known URLs get their fields refreshed if anything
+    changed. New jobs that duplicate a stored job (or an earlier one in the
+    batch) are stored pointing at it via canonical_id, which hides them
+    from the feed. Returns (inserted, updated, unchanged, merged), where
+    merged counts the inserted rows that joined an existing cluster.
+    """
+    # Last occurrence wins if a batch contains the same URL twice
+    unique = list({job.url: job for job in jobs}.values())
+    if not unique:
+        return 0, 0, 0, 0
+
+    scraped_at = scraped_at or datetime.now().isoformat()
+
+    def row(job: JobPost, sig: _Signature | None, canonical_id: int | None) -> tuple:
+        return (
+            job.title,
+            job.company,
+            job.location,
+            job.role_category,
+            job.source_platform,
+            job.url,
+            job.salary,
+            job.description,
+            job.tags,
+            job.posted_at,
+            scraped_at,
+            *job_timestamps(job.posted_at, scraped_at),
+            *salary_columns(job.salary),
+            canonical_id,
+            sig.fingerprint if sig else None,
+            sig.minhash if sig else None,
+        )
+
+    with transaction() as conn:
+        # Jobs expired by retention stay gone while the APIs still list them
+        archived = _archived_urls(conn, [job.url for job in unique])
+        if archived:
+            unique = [job for job in unique if job.url not in archived]
+
+        max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM job_posts").fetchone()[0]
+        known = _ids_by_url(conn, [job.url for job in unique])
+
+        # Dedup stage: only brand-new URLs are checked
+        batch = _BatchIndex()
+        signatures: dict[str, _Signature] = {}
+        for job in unique:
+            if job.url in known:
+                continue
+            sig = _Signature(job.company, job.title, job.location, job.description)
+            sig.canonical = _find_canonical(conn, sig, batch)
+            if sig.canonical is None:
+                batch.add(job.url, sig)
+            signatures[job.url] = sig
+
+        # Canonical rows (and updates) first, so in-batch duplicates can
+        # then point at their freshly assigned ids
+        first: list[tuple] = []
+        second: list[tuple[JobPost, _Signature]] = []
+        for job in unique:
+            sig = signatures.get(job.url)
+            if sig and isinstance(sig.canonical, str):
+                second.append((job, sig))
+            else:
+                first.append(row(job, sig, sig.canonical if sig else None))
+        changed = conn.executemany(UPSERT_SQL, first).rowcount
+
+        new_ids = _ids_by_url(conn, list(signatures))
+        if second:
+            changed += conn.executemany(
+                UPSERT_SQL, [row(job, sig, new_ids[sig.canonical]) for job, sig in second]
+            ).rowcount
+            # The tag index below needs the duplicates' ids too
+            new_ids.update(_ids_by_url(conn, [job.url for job, _ in second]))
+
+        _index_bands(conn, [
+            (new_ids[url], sig) for url, sig in signatures.items() if sig.canonical is None
+        ])
+
+        # Tag index: every new job, and known ones whose tags changed
+        tags = {job.url: normalize_tags(job.tags) for job in unique}
+        stored = tags_for(conn, list(known.values()))
+        set_tags(conn, {
+            **{new_ids[url]: tags[url] for url in signatures},
+            **{job_id: tags[url] for url, job_id in known.items() if stored.get(job_id, []) != tags[url]},
+        })
+
+        inserted = conn.execute(
+            "SELECT COUNT(*) FROM job_posts WHERE id > ?", (max_id,)
+        ).fetchone()[0]
+        if changed:
+            bump_generation(conn)
+        # Newest first, like the feed; merged duplicates never show up there
+        publish_jobs(conn, sorted(
+            (new_ids[url] for url, sig in signatures.items() if sig.canonical is None), reverse=True
+        ))
+
+    merged = sum(1 for sig in signatures.values() if sig.canonical is not None)
+    updated = changed - inserted
+    return inserted, updated, len(unique) - inserted - updated, merged
+
+
+def backfill_clusters(chunk_size: int = 500) -> int:
+    """Compute dedup keys for rows stored before dedup existed.
+
+    Rows are processed oldest first, so the earliest posting of a role
+    becomes its cluster's canonical row. Returns the number of rows merged.
+    """
+    merged = 0
+    while True:
+        with transaction() as conn:
+            rows = conn.execute(
                 """
-                INSERT INTO job_posts
-                    (title, company, location, role_category, source_platform,
-                     url, salary, description, tags, posted_at, scraped_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                SELECT id, company, title, location, description FROM job_posts
+                WHERE fingerprint IS NULL ORDER BY id LIMIT ?
                 """,
-                (
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.role_category,
-                    job.source_platform,
-                    job.url,
-                    job.salary,
-                    job.description,
-                    job.tags,
-                    job.posted_at,
-                    datetime.now().isoformat(),
-                ),
-            )
-            inserted += 1
-        except Exception:
-            skipped += 1  # URL already exists (duplicate)
+                (chunk_size,),
+            ).fetchall()
+            if not rows:
+                return merged
 
-    conn.commit()
+            # Each row is indexed in the DB before the next one is checked,
+            # so the in-memory batch index stays empty
+            batch = _BatchIndex()
+            chunk_merged = 0
+            for r in rows:
+                sig = _Signature(r["company"] or "", r["title"], r["location"] or "", r["description"] or "")
+                canonical = _find_canonical(conn, sig, batch)
+                conn.execute(
+                    "UPDATE job_posts SET canonical_id = ?, fingerprint = ?, minhash = ? WHERE id = ?",
+                    (canonical, sig.fingerprint, sig.minhash, r["id"]),
+                )
+                if canonical is None:
+                    _index_bands(conn, [(r["id"], sig)])
+                else:
+                    chunk_merged += 1
+            if chunk_merged:
+                bump_generation(conn)
+            merged += chunk_merged
+
+
+def load_validators() -> dict[str, tuple[str, str]]:
+    """HTTP cache validators (etag, last_modified) saved by earlier runs."""
+    conn = get_connection()
+    rows = conn.execute("SELECT cache_key, etag, last_modified FROM http_cache").fetchall()
     conn.close()
-    return inserted, skipped
+    return {r["cache_key"]: (r["etag"], r["last_modified"]) for r in rows}
 
 
-def run(
-    search_terms: list[str] | None = None,
-    sources: list[str] | None = None,
-) -> dict:
-    """Run scrapers and return stats."""
-    init_db()
-    stats: dict[str, dict] = {}
+def save_validators(scrapers: list[BaseScraper]) -> None:
+    """Persist validators from scrapers whose jobs were stored."""
+    rows = [
+        (key, etag, last_modified)
+        for scraper in scrapers
+        for key, (etag, last_modified) in scraper.new_validators.items()
+    ]
+    if not rows:
+        return
+    with transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO http_cache (cache_key, etag, last_modified, updated_at)
+            VALUES (?, ?, ?, datetime('now'))
+            ON CONFLICT(cache_key) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+
+def watermark_key(scraper: BaseScraper, search_terms: list[str] | None) -> str:
+    """Watermarks are kept per search-term list: other terms select other jobs."""
+    return scraper.filter_key(search_terms)
+
+
+def load_watermarks() -> dict[tuple[str, str], float]:
+    """Newest posting date stored per (source, terms) by earlier runs."""
+    conn = get_connection()
+    rows = conn.execute("SELECT source, terms, newest_posted FROM scrape_watermarks").fetchall()
+    conn.close()
+    return {(r["source"], r["terms"]): r["newest_posted"] for r in rows}
+
+
+def save_watermarks(scrapers: list[BaseScraper], search_terms: list[str] | None) -> None:
+    """Advance watermarks of scrapers that read their whole listing.
+
+    A source that logged a fetch error may have missed listings newer than
+    the ones it stored, so its watermark stays put until a clean run.
+    """
+    rows = [
+        (scraper.name, watermark_key(scraper, search_terms), scraper.newest)
+        for scraper in scrapers
+        if not scraper.errors and scraper.newest > scraper.watermark
+    ]
+    if not rows:
+        return
+    with transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO scrape_watermarks (source, terms, newest_posted, updated_at)
+            VALUES (?, ?, ?, datetime('now'))
+            ON CONFLICT(source, terms) DO UPDATE SET
+                newest_posted = MAX(newest_posted, excluded.newest_posted),
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+
+class _Totals:
+    """Running ingestion counts for one scrape run, overall and per source."""
+
+    def __init__(self, scraped_at: str) -> None:
+        self.scraped_at = scraped_at
+        self.fetched = self.inserted = self.updated = self.unchanged = self.merged = 0
+        self.by_source: dict[str, dict] = {}
+
+    def insert(self, jobs: list[JobPost], source: str) -> None:
+        start = time.perf_counter()
+        inserted, updated, unchanged, merged = insert_jobs(jobs, self.scraped_at)
+        elapsed = time.perf_counter() - start
 
-    scrapers_to_run = {
-        name: cls
-        for name, cls in ALL_SCRAPERS.items()
-        if sources is None or name in sources
+        self.fetched += len(jobs)
+        self.inserted += inserted
+        self.updated += updated
+        self.unchanged += unchanged
+        self.merged += merged
+
+        counts = self.by_source.setdefault(source, {
+            "inserted": 0, "updated": 0, "unchanged": 0, "merged": 0, "insert_s": 0.0,
+        })
+        counts["inserted"] += inserted
+        counts["updated"] += updated
+        counts["unchanged"] += unchanged
+        counts["merged"] += merged
+        counts["insert_s"] += elapsed
+
+    def source_stats(self, source: str) -> dict:
+        counts = dict(self.by_source.get(source, {}))
+        insert_s = counts.pop("insert_s", 0.0)
+        return {"inserted": 0, "updated": 0, "unchanged": 0, "merged": 0, **counts,
+                "insert_ms": round(insert_s * 1000)}
+
+
+def _batches(scraper: BaseScraper, search_terms: list[str] | None) -> Iterator[list[JobPost]]:
+    batch: list[JobPost] = []
+    for job in scraper.iter_jobs(search_terms=search_terms):
+        batch.append(job)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _ok_stats(scraper: BaseScraper, fetched: int, elapsed: float) -> dict:
+    # Scrapers log failed requests and carry on; the source still counts as
+    # failed so that its watermark stays put and the scheduler backs off.
+    return {
+        "fetched": fetched,
+        "status": f"error: {scraper.errors} failed request(s)" if scraper.errors else "ok",
+        "skipped": scraper.skipped,
+        "latency_ms": round(elapsed * 1000),
+        "cache_hits": scraper.cache_hits,
+        "cache_misses": scraper.cache_misses,
     }
 
-    all_jobs: list[JobPost] = []
 
-    for name, scraper_cls in scrapers_to_run.items():
+def _run_serial(
+    scrapers_to_run: dict[str, BaseScraper],
+    search_terms: list[str] | None,
+    stats: dict[str, dict],
+    totals: _Totals,
+) -> list[BaseScraper]:
+    succeeded: list[BaseScraper] = []
+
+    for name, scraper in scrapers_to_run.items():
         logger.info(f"Running {name} scraper...")
-        scraper = scraper_cls()
+        start = time.monotonic()
+        fetched = 0
         try:
-            jobs = scraper.fetch_jobs(search_terms=search_terms)
-            all_jobs.extend(jobs)
-            stats[name] = {"fetched": len(jobs), "status": "ok"}
+            for batch in _batches(scraper, search_terms):
+                totals.insert(batch, name)
+                fetched += len(batch)
+            succeeded.append(scraper)
+            stats[name] = _ok_stats(scraper, fetched, time.monotonic() - start)
         except Exception as e:
             logger.error(f"{name} failed: {e}")
-            stats[name] = {"fetched": 0, "status": f"error: {e}"}
+            elapsed = time.monotonic() - start
+            stats[name] = {"fetched": fetched, "status": f"error: {e}", "latency_ms": round(elapsed * 1000)}
+
+    return succeeded
+
+
+def _put(out: queue.Queue, item: tuple, cancelled: threading.Event) -> bool:
+    """Blocking put that gives up once the run has been cancelled."""
+    while not cancelled.is_set():
+        try:
+            out.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(
+    name: str,
+    scraper: BaseScraper,
+    search_terms: list[str] | None,
+    out: queue.Queue,
+    cancelled: threading.Event,
+) -> None:
+    """Worker thread: stream one source's batches into the queue."""
+    start = time.monotonic()
+    try:
+        for batch in _batches(scraper, search_terms):
+            if not _put(out, ("batch", name, batch), cancelled):
+                return
+        _put(out, ("done", name, time.monotonic() - start), cancelled)
+    except Exception as e:
+        _put(out, ("error", name, e), cancelled)
+
+
+def _run_concurrent(
+    scrapers_to_run: dict[str, BaseScraper],
+    search_terms: list[str] | None,
+    stats: dict[str, dict],
+    totals: _Totals,
+    deadline: float,
+) -> list[BaseScraper]:
+    """Fetch all sources in parallel threads and insert from this thread.
+
+    Workers hand over batches through a bounded queue, so memory stays
+    bounded and SQLite only ever sees a single writer.
+    """
+    succeeded: list[BaseScraper] = []
+    start = time.monotonic()
+    global_deadline = start + deadline
+    out: queue.Queue = queue.Queue(maxsize=QUEUE_BATCHES)
+    cancelled = threading.Event()
+
+    pending: dict[str, float] = {}
+    fetched: dict[str, int] = {}
+    for name, scraper in scrapers_to_run.items():
+        logger.info(f"Running {name} scraper...")
+        pending[name] = min(start + scraper.timeout, global_deadline)
+        fetched[name] = 0
+        threading.Thread(
+            target=_produce,
+            args=(name, scraper, search_terms, out, cancelled),
+            daemon=True,
+        ).start()
+
+    try:
+        while pending:
+            now = time.monotonic()
+            # Drop sources that ran past their own budget or the global deadline
+            for name, source_deadline in list(pending.items()):
+                if now >= source_deadline:
+                    logger.error(f"{name} exceeded its time budget")
+                    stats[name] = {
+                        "fetched": fetched[name],
+                        "status": "error: time budget exceeded",
+                        "latency_ms": round((now - start) * 1000),
+                    }
+                    del pending[name]
+            if not pending:
+                break
+
+            try:
+                kind, name, payload = out.get(timeout=max(0.0, min(pending.values()) - now))
+            except queue.Empty:
+                continue
+            if name not in pending:
+                continue  # Late message from a source that already timed out
+
+            if kind == "batch":
+                insert_start = time.monotonic()
+                try:
+                    totals.insert(payload, name)
+                except Exception as e:
+                    del pending[name]
+                    logger.error(f"{name} failed: {e}")
+                    stats[name] = {
+                        "fetched": fetched[name],
+                        "status": f"error: {e}",
+                        "latency_ms": round((time.monotonic() - start) * 1000),
+                    }
+                    continue
+                fetched[name] += len(payload)
+                # Budgets cover waiting on the sources, not this thread's
+                # writes, which hold up every producer once the queue fills
+                spent = time.monotonic() - insert_start
+                for other in pending:
+                    pending[other] = min(pending[other] + spent, global_deadline)
+            elif kind == "done":
+                del pending[name]
+                succeeded.append(scrapers_to_run[name])
+                stats[name] = _ok_stats(scrapers_to_run[name], fetched[name], payload)
+            else:
+                del pending[name]
+                logger.error(f"{name} failed: {payload}")
+                stats[name] = {
+                    "fetched": fetched[name],
+                    "status": f"error: {payload}",
+                    "latency_ms": round((time.monotonic() - start) * 1000),
+                }
+    finally:
+        # Tell stragglers to stop; their request timeouts bound them anyway
+        cancelled.set()
 
-    inserted, skipped = insert_jobs(all_jobs)
+    # Keep the stats in registry order regardless of completion order
+    for name in scrapers_to_run:
+        stats[name] = stats.pop(name)
+
+    return succeeded
+
+
+def run(
+    search_terms: list[str] | None = None,
+    sources: list[str] | None = None,
+    concurrent: bool = True,
+    deadline: float = SCRAPE_DEADLINE,
+    whole_words: bool = False,
+    full: bool = False,
+    run_id: int | None = None,
+) -> dict:
+    """Run scrapers and return stats.
+
+    With ``concurrent`` (the default) all sources are fetched in parallel,
+    so a full refresh takes roughly as long as the slowest source. Jobs are
+    streamed into the DB in batches of INSERT_BATCH_SIZE as they arrive.
+
+    Listings posted before a source's watermark (the newest posting date
+    seen by its last clean run with the same terms) are skipped unread;
+    ``full`` ignores the watermarks and re-processes everything.
+
+    The run and each source's counts and stage timings are recorded in the
+    run history, under ``run_id`` if the caller already queued the run.
+    """
+    init_db()
+    if run_id is not None:
+        return _run(search_terms, sources, concurrent, deadline, whole_words, full, run_id)
+
+    run_id = history.start_run("cli", search_terms, sources)
+    try:
+        stats = _run(search_terms, sources, concurrent, deadline, whole_words, full, run_id)
+    except Exception as e:
+        history.finish_run(run_id, None, str(e))
+        raise
+    history.finish_run(run_id, stats, None)
+    return stats
+
+
+def _run(
+    search_terms: list[str] | None,
+    sources: list[str] | None,
+    concurrent: bool,
+    deadline: float,
+    whole_words: bool,
+    full: bool,
+    run_id: int,
+) -> dict:
+    backfilled = backfill_clusters()
+    if backfilled:
+        logger.info(f"Merged {backfilled} previously stored duplicates")
+    stats: dict[str, dict] = {}
+    started = time.monotonic()
+
+    validators = load_validators()
+    watermarks = {} if full else load_watermarks()
+    scrapers_to_run: dict[str, BaseScraper] = {}
+    for name in SCRAPERS:
+        if sources is None or name in sources:
+            scraper = SCRAPERS[name](validators=validators)
+            scraper.timeout = SOURCE_BUDGETS.get(name, DEFAULT_SOURCE_BUDGET)
+            scraper.whole_words = whole_words
+            scraper.watermark = scraper.newest = watermarks.get(
+                (name, watermark_key(scraper, search_terms)), 0.0
+            )
+            scrapers_to_run[name] = scraper
+
+    totals = _Totals(datetime.now().isoformat())
+    if concurrent:
+        succeeded = _run_concurrent(scrapers_to_run, search_terms, stats, totals, deadline)
+    else:
+        succeeded = _run_serial(scrapers_to_run, search_terms, stats, totals)
+
+    save_validators(succeeded)
+    save_watermarks(succeeded, search_terms)
+    for name, scraper in scrapers_to_run.items():
+        stats[name] = {
+            **stats[name],
+            "skipped": scraper.skipped,
+            **totals.source_stats(name),
+            **scraper.stage_timings(),
+        }
+    skipped = sum(scraper.skipped for scraper in scrapers_to_run.values())
     stats["_total"] = {
-        "fetched": len(all_jobs),
-        "inserted": inserted,
-        "skipped_duplicates": skipped,
+        "run_id": run_id,
+        "fetched": totals.fetched,
+        "skipped": skipped,
+        "inserted": totals.inserted,
+        "updated": totals.updated,
+        "unchanged": totals.unchanged,
+        "merged_duplicates": totals.merged,
+        "latency_ms": round((time.monotonic() - started) * 1000),
     }
 
     logger.info(
-        f"Done: {len(all_jobs)} fetched, {inserted} new, {skipped} duplicates"
+        f"Done: {totals.fetched} fetched, {skipped} skipped by watermark, {totals.inserted} new, "
+        f"{totals.updated} updated, {totals.unchanged} unchanged, "
+        f"{totals.merged} merged into existing clusters"
     )
+    history.record_sources(run_id, stats)
     return stats
 
 
 def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
     parser = argparse.ArgumentParser(description="Run job scrapers")
     parser.add_argument(
         "--terms",
@@ -125,12 +710,33 @@ def main() -> None:
     parser.add_argument(
         "--sources",
         nargs="+",
-        choices=list(ALL_SCRAPERS.keys()),
+        choices=list(SCRAPERS),
         help="Which sources to scrape",
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run scrapers one after another instead of concurrently",
+    )
+    parser.add_argument(
+        "--whole-words",
+        action="store_true",
+        help="Only match search terms on word boundaries",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore per-source watermarks and re-process every listing",
+    )
     args = parser.parse_args()
 
-    stats = run(search_terms=args.terms, sources=args.sources)
+    stats = run(
+        search_terms=args.terms,
+        sources=args.sources,
+        concurrent=not args.serial,
+        whole_words=args.whole_words,
+        full=args.full,
+    )
 
     print("\n--- Scrape Results ---")
     for source, info in stats.items():
@@ -0,0 +1,123 @@
+"""
+Salary normalization: turns the display strings the scrapers build
+("$80,000 – $120,000", "USD 80000+", "€50k", "£40 - £55 per hour") into
+numbers the feed can filter and sort on.
+
+parse_salary() reads the amounts, currency and pay period as written;
+annual_usd() converts them with USD_RATES and PERIODS so that jobs from
+every source compare on one scale. Anything ambiguous (no amount, a small
+number without a period, an implausible yearly total) gives None rather
+than a guess: a job missing from a salary filter beats a wrong match.
+"""
+
+import re
+from typing import NamedTuple
+
+# USD per unit of currency. Rough, hand-maintained rates: good enough to
+# rank and filter pay bands, not for accounting.
+USD_RATES = {
+    "USD": 1.0,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "CHF": 1.13,
+    "CAD": 0.73,
+    "AUD": 0.66,
+    "NZD": 0.60,
+    "SEK": 0.095,
+    "NOK": 0.094,
+    "DKK": 0.145,
+    "PLN": 0.25,
+    "INR": 0.012,
+    "BRL": 0.18,
+    "SGD": 0.74,
+    "JPY": 0.0067,
+}
+
+# Paid periods per year
+PERIODS = {"year": 1, "month": 12, "week": 52, "day": 260, "hour": 2080}
+
+# Annual USD amounts outside this band are parsing accidents
+MIN_ANNUAL_USD = 1_000
+MAX_ANNUAL_USD = 2_000_000
+
+_SYMBOLS = [  # Longest first: "CA$" before "$"
+    ("CA$", "CAD"), ("C$", "CAD"), ("AU$", "AUD"), ("A$", "AUD"),
+    ("NZ$", "NZD"), ("S$", "SGD"), ("R$", "BRL"),
+    ("$", "USD"), ("€", "EUR"), ("£", "GBP"), ("₹", "INR"), ("¥", "JPY"),
+]
+_CODE = re.compile(r"\b([A-Z]{3})\b")
+_AMOUNT = re.compile(r"(\d{1,3}(?:[,.\u00a0\u202f]\d{3})+|\d+(?:\.\d+)?)\s*([kK]\b)?")
+_PERIOD = [
+    ("hour", re.compile(r"\b(hour|hourly|hr)\b|/\s*h\b", re.I)),
+    ("day", re.compile(r"\b(day|daily)\b|/\s*d\b", re.I)),
+    ("week", re.compile(r"\b(week|weekly|wk)\b", re.I)),
+    ("month", re.compile(r"\b(month|monthly|mo)\b|/\s*m\b", re.I)),
+    ("year", re.compile(r"\b(year|yearly|yr|annum|annual|annually|pa)\b|/\s*y\b", re.I)),
+]
+
+
+class Salary(NamedTuple):
+    min: float
+    max: float
+    currency: str
+    period: str
+
+
+def _currency(text: str) -> str | None:
+    for code in _CODE.findall(text):
+        if code in USD_RATES:
+            return code
+    for symbol, code in _SYMBOLS:
+        if symbol in text:
+            return code
+    return None
+
+
+def _amounts(text: str) -> list[float]:
+    amounts = []
+    for digits, k in _AMOUNT.findall(text):
+        value = float(re.sub(r"\D", "", digits) if re.search(r"\D\d{3}$", digits) else digits)
+        amounts.append((value, bool(k)))
+    # "80-100k": the suffix covers both ends
+    if len(amounts) >= 2 and amounts[1][1] and not amounts[0][1] and amounts[0][0] < 1000:
+        amounts[0] = (amounts[0][0], True)
+    return [value * 1000 if k else value for value, k in amounts]
+
+
+def parse_salary(text: str) -> Salary | None:
+    """Amounts, currency and period as written, or None if unreadable."""
+    if not text or not any(c.isdigit() for c in text):
+        return None
+    amounts = [a for a in _amounts(text) if a > 0][:2]
+    if not amounts:
+        return None
+    low, high = min(amounts), max(amounts)
+
+    period = next((name for name, pattern in _PERIOD if pattern.search(text)), None)
+    if period is None:
+        if low < 10_000:
+            return None  # Hourly? Monthly? Can't tell
+        period = "year"
+
+    currency = _currency(text) or "USD"  # The boards are US-centric
+    return Salary(low, high, currency, period)
+
+
+def annual_usd(salary: Salary | None) -> tuple[int, int] | None:
+    """(min, max) yearly pay in USD, or None if out of the plausible range."""
+    if salary is None or salary.currency not in USD_RATES:
+        return None
+    factor = USD_RATES[salary.currency] * PERIODS[salary.period]
+    low, high = round(salary.min * factor), round(salary.max * factor)
+    if low < MIN_ANNUAL_USD or high > MAX_ANNUAL_USD:
+        return None
+    return low, high
+
+
+def salary_columns(text: str) -> tuple[int | None, int | None, str | None, str | None]:
+    """(salary_min_usd, salary_max_usd, salary_currency, salary_period) for a row."""
+    salary = parse_salary(text)
+    usd = annual_usd(salary)
+    if usd is None:
+        return None, None, None, None
+    return usd[0], usd[1], salary.currency, salary.period
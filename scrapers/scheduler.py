@@ -0,0 +1,383 @@
+"""
+Scrape scheduler: runs scheduled and requested scrapes in a single process.
+
+Every web worker may start a Scheduler thread, but only the process holding
+the lease in the scheduler_lock table scrapes; the others stand by and take
+over once the lease expires. The leader renews it on a heartbeat while it
+scrapes or runs maintenance, so it only expires once the leader is gone,
+and the new leader fails just the runs its predecessor had claimed. Requests for a scrape (the "Refresh Jobs"
+button, or a source falling due) are rows in scrape_runs, so any worker can
+queue one and report its status, and a request matching a run that is
+already queued or running joins it instead of starting another. The leader
+also runs db.maintenance (retention, VACUUM, checkpoint) once it is due.
+
+Usage:
+    python -m scrapers.scheduler                       # Foreground scheduler
+    python -m scrapers.scheduler --terms "data analyst" "power bi"
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from db.database import get_connection, init_db, transaction
+from db.maintenance import maintain, maintenance_due
+from scrapers.history import finish_run
+from scrapers.registry import SCRAPE_DEADLINE, SCRAPERS
+
+logger = logging.getLogger(__name__)
+
+# ── Settings ─────────────────────────────────────────────────
+# Sources are scraped every SCRAPE_INTERVAL_HOURS, unless overridden per
+# source with SCRAPE_SOURCE_INTERVALS, e.g. "remoteok=6,arbeitnow=24".
+# A failing source is retried after BACKOFF_BASE seconds, doubling with
+# each consecutive failure up to its regular interval, with jitter.
+
+POLL_INTERVAL = float(os.environ.get("SCHEDULER_POLL_SECONDS", 5))
+DEFAULT_INTERVAL = float(os.environ.get("SCRAPE_INTERVAL_HOURS", 12)) * 3600
+BACKOFF_BASE = 60.0
+LEASE_NAME = "scrape"
+LEASE_SECONDS = SCRAPE_DEADLINE + 60
+HEARTBEAT_SECONDS = LEASE_SECONDS / 5  # Lease renewal while a run or maintenance is busy
+
+
+def _parse_intervals(spec: str) -> dict[str, float]:
+    intervals = {}
+    for part in spec.split(","):
+        name, _, hours = part.partition("=")
+        if name.strip() and hours.strip():
+            intervals[name.strip()] = float(hours) * 3600
+    return intervals
+
+
+SOURCE_INTERVALS = _parse_intervals(os.environ.get("SCRAPE_SOURCE_INTERVALS", ""))
+
+
+def source_interval(name: str) -> float:
+    return SOURCE_INTERVALS.get(name, DEFAULT_INTERVAL)
+
+
+def retry_delay(failures: int, interval: float) -> float:
+    """Jittered exponential backoff after ``failures`` consecutive failures."""
+    delay = min(interval, BACKOFF_BASE * 2 ** (failures - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+# ── Run Requests ─────────────────────────────────────────────
+
+
+def _normalize(terms: list[str] | None, sources: list[str] | None) -> tuple[str | None, str | None]:
+    """JSON column values for a request; equivalent requests compare equal."""
+    terms = [t for t in (terms or []) if t.strip()]
+    if sources is not None:
+        sources = [name for name in SCRAPERS if name in sources]
+        if len(sources) == len(SCRAPERS):
+            sources = None
+    return (
+        json.dumps(terms) if terms else None,
+        json.dumps(sources) if sources is not None else None,
+    )
+
+
+def request_run(
+    terms: list[str] | None = None,
+    sources: list[str] | None = None,
+    trigger: str = "manual",
+) -> tuple[int, bool]:
+    """Queue a scrape. Returns (run_id, coalesced).
+
+    If a run for the same terms and sources is already queued or running,
+    its id is returned with ``coalesced`` set and nothing new is queued.
+    """
+    terms_json, sources_json = _normalize(terms, sources)
+    with transaction() as conn:
+        row = conn.execute(
+            """
+            SELECT id FROM scrape_runs
+            WHERE status IN ('queued', 'running') AND terms IS ? AND sources IS ?
+            ORDER BY id LIMIT 1
+            """,
+            (terms_json, sources_json),
+        ).fetchone()
+        if row:
+            return row["id"], True
+        cur = conn.execute(
+            "INSERT INTO scrape_runs (trigger, terms, sources) VALUES (?, ?, ?)",
+            (trigger, terms_json, sources_json),
+        )
+        return cur.lastrowid, False
+
+
+def get_run(run_id: int) -> dict | None:
+    """A scrape run as a JSON-ready dict, or None if there is no such run."""
+    conn = get_connection()
+    row = conn.execute("SELECT * FROM scrape_runs WHERE id = ?", (run_id,)).fetchone()
+    conn.close()
+    if row is None:
+        return None
+    result = dict(row)
+    for key in ("terms", "sources", "stats"):
+        if result[key] is not None:
+            result[key] = json.loads(result[key])
+    return result
+
+
+def _claim_next_run(owner: str) -> tuple[int, list[str] | None, list[str] | None] | None:
+    with transaction() as conn:
+        row = conn.execute(
+            "SELECT id, terms, sources FROM scrape_runs WHERE status = 'queued' ORDER BY id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            """
+            UPDATE scrape_runs SET status = 'running', started_at = datetime('now'), owner = ?
+            WHERE id = ?
+            """,
+            (owner, row["id"]),
+        )
+    return (
+        row["id"],
+        json.loads(row["terms"]) if row["terms"] else None,
+        json.loads(row["sources"]) if row["sources"] else None,
+    )
+
+
+# ── Scheduler ────────────────────────────────────────────────
+
+
+class Scheduler:
+    """Background thread that scrapes while this process holds the lease.
+
+    With ``scheduled`` it also queues a run for ``terms`` whenever sources
+    fall due; without it, it only executes requested runs.
+    """
+
+    def __init__(
+        self,
+        terms: list[str] | None = None,
+        scheduled: bool = True,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        self.terms = terms
+        self.scheduled = scheduled
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the thread if it isn't running yet. Safe to call repeatedly."""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            # Under gunicorn nothing configures logging, and the scrape and
+            # lease messages would fall through to lastResort (warnings only)
+            if not logging.getLogger().handlers:
+                logging.basicConfig(
+                    level=logging.INFO,
+                    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+                )
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="scrape-scheduler", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop the thread and hand the lease on without waiting for expiry."""
+        self._stop.set()
+        self._wake.set()
+        if self.is_leader:
+            with transaction() as conn:
+                conn.execute(
+                    "DELETE FROM scheduler_lock WHERE name = ? AND owner = ?",
+                    (LEASE_NAME, self.owner),
+                )
+            self.is_leader = False
+
+    def wake(self) -> None:
+        """Check for queued runs now instead of at the next poll."""
+        self._wake.set()
+
+    def _loop(self) -> None:
+        init_db()
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Scheduler tick failed: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _acquire_lease(self) -> bool:
+        """Take or renew the lease. Returns whether this process is leader."""
+        now = time.time()
+        with transaction() as conn:
+            previous = conn.execute(
+                "SELECT owner FROM scheduler_lock WHERE name = ?", (LEASE_NAME,)
+            ).fetchone()
+            conn.execute(
+                """
+                INSERT INTO scheduler_lock (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    owner = excluded.owner,
+                    expires_at = excluded.expires_at
+                WHERE scheduler_lock.owner = excluded.owner OR scheduler_lock.expires_at < ?
+                """,
+                (LEASE_NAME, self.owner, now + LEASE_SECONDS, now),
+            )
+            owner = conn.execute(
+                "SELECT owner FROM scheduler_lock WHERE name = ?", (LEASE_NAME,)
+            ).fetchone()["owner"]
+            leader = owner == self.owner
+            if leader and not self.is_leader and previous and previous["owner"] != self.owner:
+                # The previous leader stopped renewing its lease: whatever it
+                # was running is gone. Runs started outside the scheduler
+                # (the CLI) belong to no leader and are left alone.
+                interrupted = conn.execute(
+                    """
+                    UPDATE scrape_runs
+                    SET status = 'failed', finished_at = datetime('now'), error = 'interrupted'
+                    WHERE status = 'running' AND owner = ?
+                    """,
+                    (previous["owner"],),
+                ).rowcount
+                if interrupted:
+                    logger.warning(f"Marked {interrupted} interrupted scrape run(s) as failed")
+        if leader != self.is_leader:
+            logger.info(f"Scheduler {self.owner} {'is now' if leader else 'is no longer'} leader")
+        self.is_leader = leader
+        return leader
+
+    def _renew_lease(self) -> bool:
+        """Extend the lease if this process still holds it."""
+        with transaction() as conn:
+            return conn.execute(
+                "UPDATE scheduler_lock SET expires_at = ? WHERE name = ? AND owner = ?",
+                (time.time() + LEASE_SECONDS, LEASE_NAME, self.owner),
+            ).rowcount == 1
+
+    @contextmanager
+    def _heartbeat(self) -> Iterator[None]:
+        """Keep renewing the lease while the body runs, however long it takes."""
+        done = threading.Event()
+
+        def beat() -> None:
+            while not done.wait(HEARTBEAT_SECONDS):
+                try:
+                    if not self._renew_lease():
+                        logger.warning(f"Scheduler {self.owner} lost the lease while busy")
+                        return
+                except Exception as e:
+                    logger.error(f"Lease heartbeat failed: {e}")
+
+        thread = threading.Thread(target=beat, name="scrape-lease-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def due_sources(self, now: float) -> list[str]:
+        """Sources whose next scheduled scrape is at or before ``now``."""
+        conn = get_connection()
+        next_runs = {
+            r["source"]: r["next_run_at"]
+            for r in conn.execute("SELECT source, next_run_at FROM scrape_schedule")
+        }
+        conn.close()
+        return [name for name in SCRAPERS if next_runs.get(name, 0) <= now]
+
+    def tick(self) -> None:
+        """One pass: queue due sources, then execute queued runs while leader."""
+        if not self._acquire_lease():
+            return
+        if self.scheduled:
+            due = self.due_sources(time.time())
+            if due:
+                request_run(self.terms, due, trigger="schedule")
+        while not self._stop.is_set() and (claimed := _claim_next_run(self.owner)):
+            with self._heartbeat():
+                self._execute(*claimed)
+            if not self._acquire_lease():
+                return
+        if self.scheduled and maintenance_due():
+            with self._heartbeat():
+                maintain()
+
+    def _execute(self, run_id: int, terms: list[str] | None, sources: list[str] | None) -> None:
+        logger.info(f"Scrape run {run_id} started (terms={terms}, sources={sources or 'all'})")
+        stats, error = None, None
+        try:
+            from scrapers.runner import run  # Only the process that scrapes loads the scrapers
+
+            stats = run(search_terms=terms, sources=sources, run_id=run_id)
+        except Exception as e:
+            logger.error(f"Scrape run {run_id} failed: {e}")
+            error = str(e)
+        finish_run(run_id, stats, error)
+        if self.scheduled and _normalize(terms, None)[0] == _normalize(self.terms, None)[0]:
+            self._reschedule(sources or list(SCRAPERS), stats, error)
+
+    def _reschedule(self, sources: list[str], stats: dict | None, error: str | None) -> None:
+        """Set each source's next run: its interval after success, backoff after failure."""
+        now = time.time()
+        with transaction() as conn:
+            for name in sources:
+                status = (stats or {}).get(name, {}).get("status", f"error: {error}")
+                interval = source_interval(name)
+                if status == "ok":
+                    failures, next_run_at, last_error = 0, now + interval, None
+                else:
+                    row = conn.execute(
+                        "SELECT failures FROM scrape_schedule WHERE source = ?", (name,)
+                    ).fetchone()
+                    failures = (row["failures"] if row else 0) + 1
+                    next_run_at = now + retry_delay(failures, interval)
+                    last_error = status
+                conn.execute(
+                    """
+                    INSERT INTO scrape_schedule (source, next_run_at, failures, last_error)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(source) DO UPDATE SET
+                        next_run_at = excluded.next_run_at,
+                        failures = excluded.failures,
+                        last_error = excluded.last_error
+                    """,
+                    (name, next_run_at, failures, last_error),
+                )
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Run the scrape scheduler in the foreground")
+    parser.add_argument("--terms", nargs="+", help="Search terms for scheduled scrapes")
+    args = parser.parse_args()
+
+    scheduler = Scheduler(terms=args.terms)
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
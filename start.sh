@@ -17,15 +17,18 @@ fi
 echo "Initializing database..."
 python -c "from db.database import init_db; init_db()"
 
-# Run initial scrape in background (don't block server start)
-echo "Starting background scrape..."
-python -m scrapers.runner --terms "data analyst" "bi engineer" "business intelligence" "analytics engineer" "power bi" &
+# Scheduled scrapes run inside the workers; one of them holds the scheduler
+# lease and scrapes any source that is due (all of them on a fresh DB)
+export ENABLE_BG_SCRAPE="${ENABLE_BG_SCRAPE:-1}"
 
-# Start server
+# Start server. Threaded workers, so open /api/events streams (at most
+# SSE_MAX_STREAMS per worker) don't tie up a whole worker each
 echo "Starting server on port ${PORT:-5000}..."
 exec gunicorn app:app \
     --bind "0.0.0.0:${PORT:-5000}" \
     --workers 2 \
+    --worker-class gthread \
+    --threads 16 \
     --timeout 120 \
     --access-logfile - \
     --error-logfile -
@@ -44,12 +44,7 @@ async function saveToList(jobId, listName, btnEl) {
         const data = await resp.json();
 
         if (resp.ok) {
-            const card = document.querySelector(`.job-card[data-job-id="${jobId}"]`);
-            if (card) {
-                const saveBtn = card.querySelector(".btn-save");
-                saveBtn.classList.add("saved");
-                saveBtn.textContent = "★";
-            }
+            setStar(jobId, true);
             showToast(`Saved to "${listName}"`);
         } else {
             showToast(data.error || "Failed to save", "error");
@@ -74,20 +69,9 @@ async function unsaveJob(jobId, listName = "") {
 
         if (resp.ok) {
             if (window.location.pathname.startsWith("/saved")) {
-                const card = document.querySelector(`.job-card[data-job-id="${jobId}"]`);
-                if (card) {
-                    card.style.transition = "opacity 200ms, transform 200ms";
-                    card.style.opacity = "0";
-                    card.style.transform = "translateX(20px)";
-                    setTimeout(() => card.remove(), 220);
-                }
+                removeCards(jobId);
             } else {
-                const card = document.querySelector(`.job-card[data-job-id="${jobId}"]`);
-                if (card) {
-                    const saveBtn = card.querySelector(".btn-save");
-                    saveBtn.classList.remove("saved");
-                    saveBtn.textContent = "☆";
-                }
+                setStar(jobId, false);
             }
             showToast("Removed from saved");
         }
@@ -101,6 +85,101 @@ async function unsaveJob(jobId, listName = "") {
     }
 }
 
+function setStar(jobId, saved) {
+    document.querySelectorAll(`.job-card[data-job-id="${jobId}"] .btn-save`).forEach((btn) => {
+        btn.classList.toggle("saved", saved);
+        btn.textContent = saved ? "★" : "☆";
+    });
+}
+
+function removeCards(jobId) {
+    document.querySelectorAll(`.job-card[data-job-id="${jobId}"]`).forEach((card) => {
+        card.style.transition = "opacity 200ms, transform 200ms";
+        card.style.opacity = "0";
+        card.style.transform = "translateX(20px)";
+        setTimeout(() => card.remove(), 220);
+    });
+}
+
+/* ── Multi-select ─────────────────────────────────────────── */
+
+const selectedJobs = new Set();
+
+function toggleSelect(checkbox) {
+    const jobId = parseInt(checkbox.value, 10);
+    if (checkbox.checked) {
+        selectedJobs.add(jobId);
+    } else {
+        selectedJobs.delete(jobId);
+    }
+    syncSelection();
+}
+
+function clearSelection() {
+    selectedJobs.clear();
+    syncSelection();
+}
+
+function syncSelection() {
+    document.querySelectorAll(".job-select").forEach((box) => {
+        box.checked = selectedJobs.has(parseInt(box.value, 10));
+        box.closest(".job-card").classList.toggle("selected", box.checked);
+    });
+    const bar = document.getElementById("bulk-bar");
+    if (!bar) return;
+    bar.classList.toggle("hidden", !selectedJobs.size);
+    document.getElementById("bulk-count").textContent = selectedJobs.size;
+}
+
+// One request (and one transaction) for every selected job
+async function bulkApply(op) {
+    if (!selectedJobs.size) return;
+    const currentList = document.getElementById("bulk-bar").dataset.list;
+    const target = document.getElementById("bulk-list").value;
+    const body = { op, job_ids: [...selectedJobs] };
+    if (op === "unsave") {
+        body.list_name = currentList;
+    } else {
+        body.list_name = target;
+        body.from_list = currentList;
+    }
+
+    try {
+        const resp = await fetch("/api/saved/batch", {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(body),
+        });
+        const data = await resp.json();
+        if (!resp.ok) {
+            showToast(data.error || "Failed", "error");
+            return;
+        }
+
+        const onSavedPage = window.location.pathname.startsWith("/saved");
+        if (onSavedPage && op === "move" && !currentList) {
+            location.reload(); // Cards on "All" show which list they're in
+            return;
+        }
+        for (const jobId of data.job_ids) {
+            if (onSavedPage) {
+                removeCards(jobId);
+            } else {
+                setStar(jobId, op === "save");
+            }
+        }
+        const count = data.job_ids.length === 1 ? "1 job" : `${data.job_ids.length} jobs`;
+        showToast(
+            op === "save" ? `Saved ${count} to "${data.list_name}"`
+                : op === "move" ? `Moved ${count} to "${data.list_name}"`
+                : `Removed ${count} from saved`
+        );
+        clearSelection();
+    } catch (e) {
+        showToast("Network error", "error");
+    }
+}
+
 /* ── Create New List ──────────────────────────────────────── */
 
 async function createAndSave(jobId) {
@@ -149,6 +228,11 @@ async function triggerScrape() {
     btn.classList.add("loading");
     btn.disabled = true;
 
+    const done = () => {
+        btn.classList.remove("loading");
+        btn.disabled = false;
+    };
+
     try {
         const resp = await fetch("/api/scrape", {
             method: "POST",
@@ -156,17 +240,120 @@ async function triggerScrape() {
             body: JSON.stringify({}),
         });
 
-        if (resp.ok) {
-            showToast("Scraping started! Refresh in ~30s to see new jobs.");
-            setTimeout(() => {
-                btn.classList.remove("loading");
-                btn.disabled = false;
-                location.reload();
-            }, 25000);
+        if (!resp.ok) {
+            showToast("Failed to start scrape", "error");
+            done();
+            return;
+        }
+
+        const data = await resp.json();
+        showToast(data.coalesced ? "A scrape is already running, waiting for it..." : "Scraping started!");
+        if (liveEvents) {
+            // New cards arrive as "jobs" events; the "scrape" event ends the wait
+            scrapeWaiters.set(data.run_id, done);
+        } else {
+            pollScrape(data.status_url, done);
         }
     } catch (e) {
         showToast("Failed to start scrape", "error");
-        btn.classList.remove("loading");
-        btn.disabled = false;
+        done();
+    }
+}
+
+// Fallback for browsers without EventSource
+async function pollScrape(statusUrl, done, attempts = 60) {
+    try {
+        const resp = await fetch(statusUrl);
+        const run = await resp.json();
+        if (run.status === "done") {
+            location.reload();
+            return;
+        }
+        if (run.status === "failed") {
+            showToast(`Scrape failed: ${run.error}`, "error");
+            done();
+            return;
+        }
+    } catch (e) {
+        // Transient; keep polling
+    }
+
+    if (attempts > 1) {
+        setTimeout(() => pollScrape(statusUrl, done, attempts - 1), 3000);
+    } else {
+        showToast("Scrape is taking a while, refresh later to see new jobs.");
+        done();
     }
 }
+
+/* ── Live Updates ─────────────────────────────────────────── */
+
+let liveEvents = null;
+const scrapeWaiters = new Map(); // run_id -> done callback
+
+function connectLiveEvents() {
+    if (!window.EventSource) return;
+    const list = document.querySelector(".job-list");
+    const after = list && list.dataset.lastEventId;
+    // Reconnects (every few minutes) resume from Last-Event-ID by themselves
+    liveEvents = new EventSource(after ? `/api/events?after=${after}` : "/api/events");
+    liveEvents.addEventListener("jobs", (e) => onNewJobs(JSON.parse(e.data)));
+    liveEvents.addEventListener("saved", (e) => onSavedChanged(JSON.parse(e.data)));
+    liveEvents.addEventListener("scrape", (e) => onScrapeFinished(JSON.parse(e.data)));
+    liveEvents.addEventListener("reset", () => location.reload());
+}
+
+async function onNewJobs(data) {
+    const list = document.querySelector(".job-list");
+    const params = new URLSearchParams(window.location.search);
+    const onFirstPage = window.location.pathname === "/" && !params.get("after") && (params.get("page") || "1") === "1";
+    // A job found just now may have been posted weeks ago, so in the
+    // posted-date order it doesn't necessarily belong at the top
+    if (!list || !onFirstPage || params.get("sort")) return;
+
+    const ids = data.ids.filter((id) => !document.querySelector(`.job-card[data-job-id="${id}"]`));
+    if (!ids.length) return;
+
+    // Only the ones matching this page's filters come back
+    params.set("ids", ids.join(","));
+    const resp = await fetch(`/feed/cards?${params}`);
+    if (!resp.ok) return;
+    const html = (await resp.text()).trim();
+    if (!html) return;
+
+    const template = document.createElement("template");
+    template.innerHTML = html;
+    const added = template.content.querySelectorAll(".job-card").length;
+    const empty = list.querySelector(".empty-state");
+    if (empty) empty.remove();
+    list.prepend(template.content);
+
+    const count = document.querySelector(".feed-count");
+    const total = count && parseInt(count.textContent, 10);
+    if (!isNaN(total)) count.textContent = `${total + added} jobs found`;
+}
+
+function onSavedChanged(data) {
+    const path = window.location.pathname;
+    for (const job of data.jobs) {
+        if (!path.startsWith("/saved")) {
+            setStar(job.id, job.is_saved);
+        } else if (!data.saved && (!job.is_saved || path === `/saved/${encodeURIComponent(data.list_name)}`)) {
+            removeCards(job.id);
+        }
+    }
+}
+
+function onScrapeFinished(run) {
+    const done = scrapeWaiters.get(run.run_id);
+    if (!done) return;
+    scrapeWaiters.delete(run.run_id);
+    done();
+    if (run.status === "failed") {
+        showToast(`Scrape failed: ${run.error}`, "error");
+    } else {
+        showToast(run.inserted ? `Scrape finished: ${run.inserted} new jobs` : "Scrape finished, no new jobs");
+    }
+}
+
+connectLiveEvents();